@@ -181,6 +181,9 @@ class Settings(BaseSettings):
     # 데이터베이스 저장 설정
     REQUEST_LOGGER_DATABASE_ENABLED: bool = Field(default=False, description="데이터베이스 저장 활성화")
     REQUEST_LOGGER_DATABASE_PATH: str = Field(default="logs/requests.db", description="데이터베이스 파일 경로")
+    REQUEST_LOGGER_IP_SUMMARY_ENABLED: bool = Field(
+        default=False, description="IP별 활동 요약 메모리 유지 (단일 워커 배포 전용)"
+    )
     
     # 제외할 경로 (쉼표로 구분)
     REQUEST_LOGGER_EXCLUDE_PATHS: str = Field(
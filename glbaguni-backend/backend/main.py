@@ -15,6 +15,7 @@ from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Query
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # ===== 환경변수 최우선 로드 =====
 load_dotenv()
@@ -139,7 +140,8 @@ async def lifespan(app: FastAPI):
                 log_formats=settings.REQUEST_LOGGER_LOG_FORMATS.split(','),
                 database_enabled=settings.REQUEST_LOGGER_DATABASE_ENABLED,
                 retention_days=settings.REQUEST_LOGGER_RETENTION_DAYS,
-                max_log_size_mb=settings.REQUEST_LOGGER_MAX_LOG_SIZE_MB
+                max_log_size_mb=settings.REQUEST_LOGGER_MAX_LOG_SIZE_MB,
+                ip_summary_enabled=settings.REQUEST_LOGGER_IP_SUMMARY_ENABLED
             )
         except Exception as e:
             logger.warning(f"⚠️ 요청 로거 설정 적용 실패, 기본값 사용: {e}")
@@ -168,6 +170,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # 모든 라우트의 기본 응답 직렬화를 orjson으로 처리
+    default_response_class=ORJSONResponse,
 )
 
 # ===== CORS 설정 =====
@@ -20,6 +20,9 @@ logger = logging.getLogger("glbaguni.core")
 
 router = APIRouter()
 
+# 서비스 시작 시각 (uptime 계산용)
+_START_MONO = time.monotonic()
+
 
 @router.get("/")
 async def root():
@@ -60,7 +63,7 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "version": "3.0.0",
-        "uptime_seconds": time.time(),
+        "uptime_seconds": int(time.monotonic() - _START_MONO),
     }
 
     checks = {}
@@ -7,8 +7,12 @@ RSS 피드 및 뉴스 수집 관련 엔드포인트
 
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
+from urllib.parse import urlparse
 
+import requests
+from bs4 import BeautifulSoup
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
 from pydantic import BaseModel, HttpUrl
 
@@ -66,13 +70,21 @@ class FetchResponse(BaseModel):
     processed_at: str
 
 
-# 서비스 인스턴스 (안전한 초기화)
-try:
-    rss_service = RSSService() if RSSService else None
-    content_extractor = ContentExtractor() if ContentExtractor else None
-except Exception:
-    rss_service = None
-    content_extractor = None
+# 서비스 인스턴스 (첫 사용 시 1회만 생성)
+@lru_cache(maxsize=1)
+def _rss_service():
+    try:
+        return RSSService() if RSSService else None
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _content_extractor():
+    try:
+        return ContentExtractor() if ContentExtractor else None
+    except Exception:
+        return None
 
 
 @router.post("/rss", response_model=FetchResponse)
@@ -115,7 +127,7 @@ async def fetch_rss_feeds(request: RSSFetchRequest, background_tasks: Background
 
         # RSS 피드 수집
         all_articles = []
-        if rss_service:
+        if _rss_service():
             for rss_url in validated_urls:
                 try:
                     # RSS 서비스가 있다면 간단한 더미 데이터 반환
@@ -207,10 +219,6 @@ async def fetch_single_article(request: ArticleFetchRequest):
         logger.info(f"⚙️ [처리] 기사 콘텐츠 추출 시작 - ID: {request_id}")
 
         # 기사 내용 추출
-        import requests
-        from bs4 import BeautifulSoup
-        from urllib.parse import urlparse
-
         try:
             response = requests.get(validated_url, timeout=10)
             response.raise_for_status()
@@ -298,6 +306,6 @@ async def fetch_health_check():
         "status": "healthy",
         "router": "fetch",
         "timestamp": datetime.now().isoformat(),
-        "rss_service_available": rss_service is not None,
-        "content_extractor_available": content_extractor is not None,
+        "rss_service_available": _rss_service() is not None,
+        "content_extractor_available": _content_extractor() is not None,
     }
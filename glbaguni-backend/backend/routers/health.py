@@ -5,118 +5,275 @@ Health Check Router - Simplified
 간단한 헬스체크 엔드포인트 (200줄 이하)
 """
 
+import asyncio
 import platform
+import struct
 import sys
 import time
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
+import orjson
 import psutil
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 try:
-    # Try absolute imports first
-    import sys
-    import os
-    
-    # Add the backend directory to the path
-    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if backend_dir not in sys.path:
-        sys.path.insert(0, backend_dir)
-    
     from config.settings import get_settings
-    try:
-        from utils import get_logger
-    except ImportError:
-        from utils.logging_config import get_logger
+    from database import engine
+    from utils.component_manager import (
+        get_component_status,
+        perform_component_health_checks,
+        retry_failed_components,
+    )
+    from utils.logging_config import get_logger
 except ImportError:
-    try:
-        # Fallback for package import
-        from ..config.settings import get_settings
-        from ..utils import get_logger
-    except ImportError:
-        # Create dummy functions for basic functionality
-        def get_settings():
-            class MockSettings:
-                app_name = "Glbaguni"
-                app_version = "3.0.0"
-                environment = "development"
-                log_level = "INFO"
-                debug = True
-            return MockSettings()
-        
-        def get_logger(name):
-            return logging.getLogger(name)
+    from backend.config.settings import get_settings
+    from backend.database import engine
+    from backend.utils.component_manager import (
+        get_component_status,
+        perform_component_health_checks,
+        retry_failed_components,
+    )
+    from backend.utils.logging_config import get_logger
 
 logger = get_logger("routers.health")
-router = APIRouter(tags=["health"])
+router = APIRouter(tags=["health"], default_response_class=ORJSONResponse)
+
+# 서비스 시작 시각 (uptime 계산용, 시스템 시계 변경에 영향받지 않음)
+_START_MONO = time.monotonic()
+
+# 프로세스 수명 동안 변하지 않는 시스템 정보 (모듈 로드 시 1회 계산)
+_PY_VER = sys.version.split()[0]
+_PLATFORM = platform.platform()
+_HOSTNAME = platform.node()
+# platform.architecture()는 플랫폼에 따라 외부 명령(file)을 실행하므로 포인터 크기로 계산
+_ARCH = f"{struct.calcsize('P') * 8}bit"
+_PID = os.getpid()
+_PY_VERSION_FULL = "{0.major}.{0.minor}.{0.micro}".format(sys.version_info)
+_ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+# 바이트 단위 변환 계수 (2의 거듭제곱 역수라 나눗셈과 결과가 동일)
+_MB = 1.0 / (1024 * 1024)
+_GB = 1.0 / (1024 * 1024 * 1024)
+
+# /health 응답의 서버 정보 중 고정 부분 (요청마다 uptime만 추가)
+_SERVER_INFO = {
+    "name": "글바구니 (Glbaguni) Backend",
+    "version": "3.0.0",
+    "python_version": _PY_VERSION_FULL,
+    "environment": _ENVIRONMENT,
+}
+
+# /debug 응답의 고정 앞부분 (system_info 하위 트리는 1회만 직렬화)
+_DEBUG_HEAD = (
+    b'{"success":true,"message":'
+    + orjson.dumps("디버그 정보")
+    + b',"data":{"system_info":'
+    + orjson.dumps(
+        {
+            "python_version": _PY_VER,
+            "platform": _PLATFORM,
+            "hostname": _HOSTNAME,
+            "architecture": _ARCH,
+        }
+    )
+)
+
+# 현재 프로세스 핸들 (요청마다 재생성하지 않도록 모듈 로드 시 1회 생성)
+_PROC = psutil.Process()
+_PROC.cpu_percent(interval=None)  # 첫 호출은 0.0을 반환하므로 기준값 설정
+psutil.cpu_percent(interval=None)  # 시스템 CPU 사용률 기준값 설정
+
+# /health/simple 응답 템플릿 (타임스탬프만 끼워 넣어 인코더를 거치지 않음)
+_SIMPLE_HEALTH_PREFIX = b'{"status":"ok","timestamp":"'
+_SIMPLE_HEALTH_SUFFIX = b'"}'
+
+# 헬스체크 결과 캐시 (짧은 주기의 LB/모니터링 폴링이 같은 결과를 공유)
+HEALTH_TTL = 2.0
+_HEALTH_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+_SNAPSHOT_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+_ENV_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+_DB_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+
+# 프록시/프로브 쪽에서도 TTL 동안 응답을 재사용하도록 허용
+_CACHE_HEADERS = {"Cache-Control": f"max-age={int(HEALTH_TTL)}"}
+
+# 전체 서비스 상태별 HTTP 상태 코드 (그 외는 200)
+_STATUS_HTTP_CODES = {"critical": 503, "degraded": 206}
+
+# 데이터베이스 ping 제한 시간 (초)
+DB_PING_TIMEOUT = 0.5
+
+# 백그라운드 시스템 지표 샘플링 (요청 경로에서는 캐시된 값만 읽음)
+SYSTEM_SAMPLE_INTERVAL = 5.0
+_SYSTEM_SAMPLE: Dict[str, Any] = {"t": 0.0, "cpu": None, "memory": None, "disk": None}
+_sampler_task: Optional["asyncio.Task[None]"] = None
+_refresh_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
+# 헬스체크에서 확인하는 환경변수
+_ENV_VARS = ("OPENAI_API_KEY", "SMTP_USERNAME", "SMTP_PASSWORD", "DATABASE_URL")
+_ENV_TOTAL = len(_ENV_VARS)
+_CONFIG_RATE_FACTOR = 100.0 / _ENV_TOTAL
+
+
+# 캐시된 응답을 다시 만들 때 Response가 직접 설정하는 헤더
+_RESPONSE_OWN_HEADERS = (b"content-length", b"content-type")
+
+
+def _copy_response(payload: Any) -> Any:
+    """캐시된 Response는 요청마다 새 객체로 복사 (미들웨어가 헤더를 고쳐도 캐시에 남지 않도록)"""
+    if not isinstance(payload, Response):
+        return payload
+    headers = {
+        key.decode("latin-1"): value.decode("latin-1")
+        for key, value in payload.raw_headers
+        if key not in _RESPONSE_OWN_HEADERS
+    }
+    return Response(
+        content=payload.body,
+        status_code=payload.status_code,
+        headers=headers,
+        media_type=payload.media_type,
+    )
+
+
+def _ttl_cached(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """인자 없는 읽기 전용 엔드포인트의 응답을 HEALTH_TTL 동안 재사용 (5xx 응답은 캐시하지 않음)"""
+    cache: Dict[str, Any] = {"t": 0.0, "payload": None}
+
+    @wraps(func)
+    async def wrapper() -> Any:
+        if time.monotonic() - cache["t"] < HEALTH_TTL:
+            return _copy_response(cache["payload"])
+        payload = await func()
+        if isinstance(payload, Response) and payload.status_code >= 500:
+            return payload
+        cache["payload"] = payload
+        cache["t"] = time.monotonic()
+        return _copy_response(payload)
+
+    wrapper.cache = cache  # type: ignore[attr-defined]
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def _debug_settings_tail() -> bytes:
+    """/debug 응답의 설정 부분 (설정 로드 후 1회 직렬화)"""
+    settings = get_settings()
+    return (
+        b',"environment":'
+        + orjson.dumps(settings.environment)
+        + b',"log_level":'
+        + orjson.dumps(settings.log_level)
+        + b',"debug_mode":'
+        + orjson.dumps(settings.debug)
+        + b"}}"
+    )
+
+
+def _snapshot() -> Dict[str, Any]:
+    """메모리/프로세스 지표를 한 번에 수집 (블로킹 호출이므로 스레드에서 실행)"""
+    memory = psutil.virtual_memory()
+
+    # oneshot()으로 /proc 읽기를 묶어 프로세스 지표를 한 번에 조회
+    with _PROC.oneshot():
+        cpu_percent = _PROC.cpu_percent(interval=None)
+        rss = _PROC.memory_info().rss
+        num_threads = _PROC.num_threads()
 
-# 서비스 시작 시간
-start_time = datetime.now()
+    return {
+        "memory_info": {
+            "total_gb": round(memory.total * _GB, 2),
+            "used_gb": round(memory.used * _GB, 2),
+            "percentage": round(memory.percent, 1),
+        },
+        "process_info": {
+            "pid": _PID,
+            "cpu_percent": round(cpu_percent, 1),
+            "memory_mb": round(rss * _MB, 1),
+            "num_threads": num_threads,
+        },
+    }
 
 
-@router.get("/")
-async def get_service_info() -> JSONResponse:
-    """기본 서비스 정보 반환"""
-    try:
-        settings = get_settings()
-
-        info = {
+@lru_cache(maxsize=1)
+def _service_info_parts() -> Tuple[bytes, bytes]:
+    """타임스탬프 앞뒤로 나눈 서비스 정보 JSON 바이트 (설정 로드 후 1회 생성)"""
+    settings = get_settings()
+    template = orjson.dumps(
+        {
             "service": settings.app_name,
             "version": settings.app_version,
             "status": "operational",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": "__TS__",
             "endpoints": {
                 "health": "/health",
                 "summarize": "/summarize",
                 "news-search": "/news-search",
             },
         }
+    )
+    head, tail = template.split(b'"__TS__"')
+    return head, tail
+
 
-        return JSONResponse(content=info)
+@router.get("/", response_class=Response)
+async def get_service_info() -> Response:
+    """기본 서비스 정보 반환"""
+    try:
+        head, tail = _service_info_parts()
+        # orjson이 datetime을 직접 ISO 문자열(따옴표 포함)로 인코딩
+        timestamp = orjson.dumps(datetime.now())
+
+        return Response(
+            content=head + timestamp + tail,
+            media_type="application/json",
+            headers=_CACHE_HEADERS,
+        )
     except Exception as e:
         logger.error(f"서비스 정보 조회 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500, content={"error": "서비스 정보를 가져올 수 없습니다"}
         )
 
 
 @router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check(response: Response = None) -> Dict[str, Any]:
     """개선된 헬스체크 - 상세한 시스템 상태 제공"""
-    start_time = time.time()
+    # 정상 응답은 캐시 허용 (오류 응답은 아래에서 헤더 제거)
+    if response is not None:
+        response.headers.update(_CACHE_HEADERS)
+
+    if time.monotonic() - _HEALTH_CACHE["t"] < HEALTH_TTL:
+        return _HEALTH_CACHE["payload"]
+
+    t0 = time.time()
     
     try:
         # 기본 서버 상태
         basic_status = {
             "status": "healthy",
-            "timestamp": time.time(),
+            "timestamp": t0,
             "server": {
-                "name": "글바구니 (Glbaguni) Backend",
-                "version": "3.0.0",
-                "uptime": time.time() - start_time,
-                "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
-                "environment": os.getenv("ENVIRONMENT", "development")
+                **_SERVER_INFO,
+                "uptime": int(time.monotonic() - _START_MONO),
             }
         }
         
         # 컴포넌트 상태 (가능한 경우)
-        if get_component_status:
-            try:
-                component_status = get_component_status()
-                basic_status["components"] = component_status
-            except Exception as e:
-                logging.warning(f"컴포넌트 상태 조회 실패: {e}")
-                basic_status["components"] = {
-                    "error": "컴포넌트 상태를 조회할 수 없습니다",
-                    "reason": str(e)
-                }
-        else:
+        try:
+            component_status = get_component_status()
+            basic_status["components"] = component_status
+        except Exception as e:
+            logging.warning(f"컴포넌트 상태 조회 실패: {e}")
             basic_status["components"] = {
-                "warning": "컴포넌트 매니저를 사용할 수 없습니다"
+                "error": "컴포넌트 상태를 조회할 수 없습니다",
+                "reason": str(e)
             }
         
         # 환경변수 상태 확인
@@ -124,68 +281,52 @@ async def health_check() -> Dict[str, Any]:
         basic_status["environment"] = env_status
         
         # 응답 시간 계산
-        response_time = time.time() - start_time
+        response_time = time.time() - t0
         basic_status["response_time_ms"] = round(response_time * 1000, 2)
-        
+
+        _HEALTH_CACHE["payload"] = basic_status
+        _HEALTH_CACHE["t"] = time.monotonic()
         return basic_status
         
     except Exception as e:
         logging.error(f"헬스체크 중 오류: {e}")
+        if response is not None:
+            del response.headers["Cache-Control"]
         return {
             "status": "error",
-            "timestamp": time.time(),
+            "timestamp": t0,
             "error": str(e),
-            "response_time_ms": round((time.time() - start_time) * 1000, 2)
+            "response_time_ms": round((time.time() - t0) * 1000, 2)
         }
 
 
-@router.get("/debug")
-async def debug_info() -> JSONResponse:
+@router.get("/debug", response_class=Response)
+async def debug_info() -> Response:
     """간단한 디버그 정보"""
     try:
-        settings = get_settings()
-
-        # 시스템 정보
-        system_info = {
-            "python_version": sys.version.split()[0],
-            "platform": platform.platform(),
-            "hostname": platform.node(),
-            "architecture": platform.architecture()[0],
-        }
-
-        # 메모리 정보
-        memory = psutil.virtual_memory()
-        memory_info = {
-            "total_gb": round(memory.total / 1024 / 1024 / 1024, 2),
-            "used_gb": round(memory.used / 1024 / 1024 / 1024, 2),
-            "percentage": round(memory.percent, 1),
-        }
-
-        # 프로세스 정보
-        process = psutil.Process()
-        process_info = {
-            "pid": process.pid,
-            "cpu_percent": round(process.cpu_percent(), 1),
-            "memory_mb": round(process.memory_info().rss / 1024 / 1024, 1),
-            "num_threads": process.num_threads(),
-        }
-
-        debug_data = {
-            "system_info": system_info,
-            "memory_info": memory_info,
-            "process_info": process_info,
-            "environment": settings.environment,
-            "log_level": settings.log_level,
-            "debug_mode": settings.debug,
-        }
-
-        return JSONResponse(
-            content={"success": True, "message": "디버그 정보", "data": debug_data}
+        # psutil 호출은 한 번의 스레드 전환으로 모아서 수행 (TTL 내 재사용)
+        if time.monotonic() - _SNAPSHOT_CACHE["t"] < HEALTH_TTL:
+            snapshot = _SNAPSHOT_CACHE["payload"]
+        else:
+            snapshot = await asyncio.to_thread(_snapshot)
+            _SNAPSHOT_CACHE["payload"] = snapshot
+            _SNAPSHOT_CACHE["t"] = time.monotonic()
+
+        # 고정 부분은 미리 직렬화된 바이트를 사용하고 동적 지표만 인코딩
+        content = (
+            _DEBUG_HEAD
+            + b',"memory_info":'
+            + orjson.dumps(snapshot["memory_info"])
+            + b',"process_info":'
+            + orjson.dumps(snapshot["process_info"])
+            + _debug_settings_tail()
         )
 
+        return Response(content=content, media_type="application/json")
+
     except Exception as e:
         logger.error(f"디버그 정보 조회 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -196,23 +337,25 @@ async def debug_info() -> JSONResponse:
 
 
 @router.get("/status/services")
-async def service_status() -> JSONResponse:
+@_ttl_cached
+async def service_status() -> ORJSONResponse:
     """서비스 상태 체크"""
     try:
         # 강화된 컴포넌트 매니저 사용
-        try:
-            from ..utils.component_manager import get_component_status, perform_component_health_checks
-            component_report = get_component_status()
-            health_results = await perform_component_health_checks()
-        except ImportError:
-            # 폴백
-            component_report = {"system_status": "unknown", "summary": {"total_components": 0}}
-            health_results = {}
+        component_report = get_component_status()
+
+        # 컴포넌트/네트워크 체크와 psutil 샘플링(스레드 풀)을 동시에 수행
+        health_results, db_result, openai_result, resources = await asyncio.gather(
+            perform_component_health_checks(),
+            check_database_connection(),
+            check_openai_connection(),
+            check_system_resources(),
+        )
 
         services = {
-            "database": await check_database_connection(),
-            "openai": await check_openai_connection(),
-            "system_resources": check_system_resources(),
+            "database": db_result,
+            "openai": openai_result,
+            "system_resources": resources,
             "components": {
                 "summary": component_report.get("summary", {}),
                 "system_status": component_report.get("system_status", "unknown"),
@@ -222,41 +365,35 @@ async def service_status() -> JSONResponse:
         }
 
         # 전체 서비스 상태 결정
-        overall_status = "healthy"
+        component_status = component_report.get("system_status", "unknown")
+        cpu_usage = resources["cpu_percent"] or 0
+        memory_percent = resources["memory_percent"] or 0
+        resource_peak = max(cpu_usage, memory_percent)
+
         critical_issues = []
-        
-        # 데이터베이스 상태 체크
-        if not services["database"]["status"]:
+        if not db_result["healthy"]:
             critical_issues.append("database_failed")
-            
-        # 컴포넌트 상태 체크
-        component_status = component_report.get("system_status", "unknown")
         if component_status == "critical":
             critical_issues.append("critical_components_failed")
+        if resource_peak > 90:
+            critical_issues.append("resource_exhaustion")
+
+        if component_status == "critical" or resource_peak > 90:
             overall_status = "critical"
         elif component_status == "degraded":
             overall_status = "degraded"
-            
-        # 시스템 리소스 체크
-        resources = services["system_resources"]
-        if resources["cpu_usage"] > 90 or resources["memory_percent"] > 90:
-            critical_issues.append("resource_exhaustion")
-            overall_status = "critical"
-        elif resources["cpu_usage"] > 70 or resources["memory_percent"] > 70:
-            if overall_status == "healthy":
-                overall_status = "warning"
+        elif resource_peak > 70:
+            overall_status = "warning"
+        else:
+            overall_status = "healthy"
 
         services["overall_status"] = overall_status
         services["critical_issues"] = critical_issues
-        services["timestamp"] = datetime.now().isoformat()
+        services["timestamp"] = time.time()
 
-        status_code = 200
-        if overall_status == "critical":
-            status_code = 503
-        elif overall_status == "degraded":
-            status_code = 206
+        status_code = _STATUS_HTTP_CODES.get(overall_status, 200)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "success": True,
@@ -267,7 +404,7 @@ async def service_status() -> JSONResponse:
 
     except Exception as e:
         logger.error(f"서비스 상태 체크 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "success": False,
@@ -278,27 +415,25 @@ async def service_status() -> JSONResponse:
 
 
 @router.post("/components/retry")
-async def retry_failed_components_endpoint() -> JSONResponse:
+async def retry_failed_components_endpoint() -> ORJSONResponse:
     """실패한 컴포넌트 재시도"""
     try:
-        from ..utils.component_manager import retry_failed_components
-        
         retry_results = await retry_failed_components()
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": "컴포넌트 재시도 완료",
                 "data": {
                     "retry_results": retry_results,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": time.time()
                 }
             }
         )
         
     except Exception as e:
         logger.error(f"컴포넌트 재시도 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -309,11 +444,10 @@ async def retry_failed_components_endpoint() -> JSONResponse:
 
 
 @router.get("/components/detailed")
-async def get_detailed_component_status() -> JSONResponse:
+@_ttl_cached
+async def get_detailed_component_status() -> ORJSONResponse:
     """상세한 컴포넌트 상태 조회"""
     try:
-        from ..utils.component_manager import get_component_status, perform_component_health_checks
-        
         component_report = get_component_status()
         health_results = await perform_component_health_checks()
         
@@ -321,10 +455,10 @@ async def get_detailed_component_status() -> JSONResponse:
         detailed_data = {
             **component_report,
             "health_checks": health_results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
                 "message": "상세 컴포넌트 상태",
@@ -334,7 +468,7 @@ async def get_detailed_component_status() -> JSONResponse:
         
     except Exception as e:
         logger.error(f"상세 컴포넌트 상태 조회 실패: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -345,28 +479,55 @@ async def get_detailed_component_status() -> JSONResponse:
 
 
 # 헬퍼 함수들
+def _ping_database() -> None:
+    """커넥션 풀에서 연결을 빌려 SELECT 1 실행 (블로킹 호출)"""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
 async def check_database_connection() -> Dict[str, Any]:
     """데이터베이스 연결 체크"""
+    if time.monotonic() - _DB_CACHE["t"] < HEALTH_TTL:
+        return _DB_CACHE["payload"]
+
+    t0 = time.perf_counter()
     try:
-        # 간단한 연결 테스트 (실제로는 DB 쿼리 실행)
-        return {
+        await asyncio.wait_for(
+            asyncio.to_thread(_ping_database), timeout=DB_PING_TIMEOUT
+        )
+        result = {
             "healthy": True,
             "message": "Database connection OK",
-            "response_time_ms": 10,
+            "response_time_ms": round((time.perf_counter() - t0) * 1000, 2),
+        }
+    except asyncio.TimeoutError:
+        result = {
+            "healthy": False,
+            "message": f"Database connection timed out after {DB_PING_TIMEOUT}s",
+            "response_time_ms": None,
         }
     except Exception as e:
-        return {
+        result = {
             "healthy": False,
             "message": f"Database connection failed: {str(e)}",
             "response_time_ms": None,
         }
 
+    _DB_CACHE["payload"] = result
+    _DB_CACHE["t"] = time.monotonic()
+    return result
+
+
+@lru_cache(maxsize=1)
+def _openai_key_configured() -> bool:
+    """OpenAI API 키 설정 여부 (설정 로드 후 1회 확인)"""
+    return bool(get_settings().openai_api_key)
+
 
 async def check_openai_connection() -> Dict[str, Any]:
     """OpenAI API 연결 체크"""
     try:
-        settings = get_settings()
-        if not settings.openai_api_key:
+        if not _openai_key_configured():
             return {
                 "healthy": False,
                 "message": "OpenAI API key not configured",
@@ -387,19 +548,77 @@ async def check_openai_connection() -> Dict[str, Any]:
         }
 
 
-def check_system_resources() -> Dict[str, Any]:
+def _sample_system() -> Dict[str, Any]:
+    """CPU/메모리/디스크 지표 수집 (블로킹 호출이므로 스레드에서 실행)"""
+    return {
+        # 직전 호출 이후의 사용률을 즉시 반환 (100ms 블로킹 샘플링 없음)
+        "cpu": psutil.cpu_percent(interval=None),
+        "memory": psutil.virtual_memory(),
+        "disk": psutil.disk_usage("/"),
+    }
+
+
+async def _refresh_system_sample() -> Dict[str, Any]:
+    """시스템 지표를 새로 수집해 캐시에 저장"""
+    sample = await asyncio.to_thread(_sample_system)
+    _SYSTEM_SAMPLE.update(sample, t=time.monotonic())
+    return _SYSTEM_SAMPLE
+
+
+async def _system_sampler_loop() -> None:
+    """주기적으로 시스템 지표를 갱신하는 백그라운드 작업"""
+    while True:
+        try:
+            await _refresh_system_sample()
+        except Exception as e:
+            logger.error(f"시스템 지표 샘플링 오류: {e}")
+        await asyncio.sleep(SYSTEM_SAMPLE_INTERVAL)
+
+
+def _ensure_system_sampler() -> None:
+    """현재 이벤트 루프에서 샘플링 작업이 실행 중인지 확인하고 필요시 시작"""
+    global _sampler_task
+    loop = asyncio.get_running_loop()
+    if (
+        _sampler_task is None
+        or _sampler_task.done()
+        or _sampler_task.get_loop() is not loop
+    ):
+        _sampler_task = loop.create_task(_system_sampler_loop())
+
+
+async def _get_system_sample() -> Dict[str, Any]:
+    """캐시된 시스템 지표 반환 (샘플러가 아직 갱신하지 못했으면 직접 수집)"""
+    global _refresh_task
+    _ensure_system_sampler()
+    if time.monotonic() - _SYSTEM_SAMPLE["t"] <= SYSTEM_SAMPLE_INTERVAL * 2:
+        return _SYSTEM_SAMPLE
+
+    # 동시에 들어온 요청들은 진행 중인 하나의 수집 결과를 함께 기다림
+    loop = asyncio.get_running_loop()
+    if (
+        _refresh_task is None
+        or _refresh_task.done()
+        or _refresh_task.get_loop() is not loop
+    ):
+        _refresh_task = loop.create_task(_refresh_system_sample())
+    return await asyncio.shield(_refresh_task)
+
+
+async def check_system_resources() -> Dict[str, Any]:
     """시스템 리소스 체크"""
     try:
-        cpu = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
+        sample = await _get_system_sample()
+        cpu = sample["cpu"]
+        memory_percent = sample["memory"].percent
 
-        healthy = cpu < 80 and memory.percent < 80
+        healthy = cpu < 80 and memory_percent < 80
 
         return {
             "healthy": healthy,
-            "message": f"CPU: {cpu:.1f}%, Memory: {memory.percent:.1f}%",
+            "message": f"CPU: {cpu:.1f}%, Memory: {memory_percent:.1f}%",
             "cpu_percent": round(cpu, 1),
-            "memory_percent": round(memory.percent, 1),
+            "memory_percent": round(memory_percent, 1),
         }
     except Exception as e:
         return {
@@ -412,47 +631,47 @@ def check_system_resources() -> Dict[str, Any]:
 
 def check_environment_status() -> Dict[str, Any]:
     """환경변수 상태 확인"""
-    env_vars = [
-        "OPENAI_API_KEY",
-        "SMTP_USERNAME", 
-        "SMTP_PASSWORD",
-        "DATABASE_URL"
-    ]
-    
+    if time.monotonic() - _ENV_CACHE["t"] < HEALTH_TTL:
+        return _ENV_CACHE["payload"]
+
+    environ = os.environ
+    configured = [var for var in _ENV_VARS if environ.get(var)]
+    missing = [var for var in _ENV_VARS if not environ.get(var)]
+
     status = {
-        "configured": [],
-        "missing": [],
-        "total": len(env_vars)
+        "configured": configured,
+        "missing": missing,
+        "total": _ENV_TOTAL,
+        "configured_count": len(configured),
+        "missing_count": len(missing),
+        "configuration_rate": len(configured) * _CONFIG_RATE_FACTOR,
     }
-    
-    for var in env_vars:
-        if os.getenv(var):
-            status["configured"].append(var)
-        else:
-            status["missing"].append(var)
-    
-    status["configured_count"] = len(status["configured"])
-    status["missing_count"] = len(status["missing"])
-    status["configuration_rate"] = (status["configured_count"] / status["total"]) * 100
-    
+
+    _ENV_CACHE["payload"] = status
+    _ENV_CACHE["t"] = time.monotonic()
     return status
 
 
 @router.get("/health/detailed")
+@_ttl_cached
 async def detailed_health_check() -> Dict[str, Any]:
     """상세한 헬스체크 - 모든 시스템 정보"""
     try:
-        basic_health = await health_check()
-        
+        basic_health, memory_info, disk_info = await asyncio.gather(
+            health_check(), get_memory_info(), get_disk_info()
+        )
+        # 캐시된 결과를 변경하지 않도록 복사본에 상세 정보 추가
+        basic_health = dict(basic_health)
+
         # 추가 상세 정보
         detailed_info = {
             "system": {
                 "platform": os.name,
                 "cwd": os.getcwd(),
-                "process_id": os.getpid() if hasattr(os, 'getpid') else "unknown"
+                "process_id": _PID
             },
-            "memory": get_memory_info(),
-            "disk": get_disk_info()
+            "memory": memory_info,
+            "disk": disk_info
         }
         
         basic_health["detailed"] = detailed_info
@@ -463,42 +682,38 @@ async def detailed_health_check() -> Dict[str, Any]:
         raise HTTPException(500, f"상세 헬스체크 실패: {str(e)}")
 
 
-def get_memory_info() -> Dict[str, Any]:
+async def get_memory_info() -> Dict[str, Any]:
     """메모리 정보 조회 (가능한 경우)"""
     try:
-        import psutil
-        memory = psutil.virtual_memory()
+        memory = (await _get_system_sample())["memory"]
         return {
-            "total_gb": round(memory.total / (1024**3), 2),
-            "available_gb": round(memory.available / (1024**3), 2),
+            "total_gb": round(memory.total * _GB, 2),
+            "available_gb": round(memory.available * _GB, 2),
             "used_percent": memory.percent
         }
-    except ImportError:
-        return {"error": "psutil 패키지가 설치되지 않음"}
     except Exception as e:
         return {"error": f"메모리 정보 조회 실패: {str(e)}"}
 
 
-def get_disk_info() -> Dict[str, Any]:
+async def get_disk_info() -> Dict[str, Any]:
     """디스크 정보 조회 (가능한 경우)"""
     try:
-        import psutil
-        disk = psutil.disk_usage('/')
+        disk = (await _get_system_sample())["disk"]
         return {
-            "total_gb": round(disk.total / (1024**3), 2),
-            "free_gb": round(disk.free / (1024**3), 2),
+            "total_gb": round(disk.total * _GB, 2),
+            "free_gb": round(disk.free * _GB, 2),
             "used_percent": round((disk.used / disk.total) * 100, 2)
         }
-    except ImportError:
-        return {"error": "psutil 패키지가 설치되지 않음"}
     except Exception as e:
         return {"error": f"디스크 정보 조회 실패: {str(e)}"}
 
 
-@router.get("/health/simple")
-async def simple_health_check() -> Dict[str, str]:
+@router.get("/health/simple", response_class=Response)
+async def simple_health_check() -> Response:
     """간단한 헬스체크 - 로드밸런서용"""
-    return {
-        "status": "ok",
-        "timestamp": str(int(time.time()))
-    }
+    return Response(
+        content=_SIMPLE_HEALTH_PREFIX
+        + str(int(time.time())).encode()
+        + _SIMPLE_HEALTH_SUFFIX,
+        media_type="application/json",
+    )
@@ -5,32 +5,42 @@
 """
 
 import logging
-import uuid
-from typing import Optional
+import secrets
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Query
 
-# Import 에러 방지를 위한 안전한 import 구조
+# 히스토리 서비스 조회 함수 (모듈 로드 시 1회만 resolve)
+# main.py와 같은 순서로 import해야 초기화된 컴포넌트 매니저 인스턴스를 공유함
 try:
-    from ..models import HistoryResponse
-    from ..utils.executors import SafeExecutor
-    from ..utils.validators import InputSanitizer
+    from utils.component_manager import get_history_service
 except ImportError:
     try:
-        from backend.models import HistoryResponse
-        from backend.utils.executors import SafeExecutor
-        from backend.utils.validators import InputSanitizer
-    except ImportError as e:
-        logging.error(f"History router import error: {e}")
-        # 기본값으로 fallback
-        HistoryResponse = dict
-        SafeExecutor = None
-        InputSanitizer = None
+        from backend.utils.component_manager import get_history_service
+    except ImportError:
+        def get_history_service():
+            return None
+
+logger = logging.getLogger("glbaguni")
 
 # 라우터 생성
 router = APIRouter(prefix="/api", tags=["history"])
 
+def _empty_history(
+    page: int, per_page: int, status: str, message: Optional[str] = None
+) -> Dict[str, Any]:
+    """빈 히스토리 응답 생성 (페이지 정보만 요청값 사용)"""
+    result: Dict[str, Any] = {
+        "status": status,
+        "data": {
+            "items": [],
+            "pagination": {"page": page, "per_page": per_page, "total": 0, "pages": 0},
+        },
+    }
+    if message:
+        result["message"] = message
+    return result
+
 def create_history_router(app_state=None, importer=None):
     """히스토리 라우터 생성 (호환성 유지)"""
     return router
@@ -43,9 +53,8 @@ async def get_user_history(
     language: Optional[str] = Query(None, description="언어 필터 (ko/en)"),
 ):
     """사용자 히스토리 조회 API"""
-    request_id = str(uuid.uuid4())[:8]
-    logger = logging.getLogger("glbaguni")
-    logger.info(f"📚 [{request_id}] 히스토리 조회: user_id={user_id}")
+    request_id = secrets.token_hex(4)
+    logger.info("📚 [%s] 히스토리 조회: user_id=%s", request_id, user_id)
 
     try:
         # 기본적인 입력 검증
@@ -53,31 +62,13 @@ async def get_user_history(
             raise HTTPException(400, "잘못된 사용자 ID입니다")
 
         # 컴포넌트 매니저에서 히스토리 서비스 가져오기
-        try:
-            from backend.utils.component_manager import get_history_service
-            history_service = get_history_service()
-        except ImportError:
-            try:
-                from utils.component_manager import get_history_service
-                history_service = get_history_service()
-            except ImportError:
-                history_service = None
+        history_service = get_history_service()
 
         if not history_service:
-            logger.warning(f"⚠️ [{request_id}] 히스토리 서비스가 초기화되지 않았습니다")
-            return {
-                "status": "warning",
-                "message": "히스토리 서비스가 현재 이용할 수 없습니다",
-                "data": {
-                    "items": [],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 0,
-                        "pages": 0
-                    }
-                }
-            }
+            logger.warning("⚠️ [%s] 히스토리 서비스가 초기화되지 않았습니다", request_id)
+            return _empty_history(
+                page, per_page, "warning", "히스토리 서비스가 현재 이용할 수 없습니다"
+            )
 
         # 히스토리 조회 시도
         try:
@@ -87,39 +78,20 @@ async def get_user_history(
                 )
             else:
                 # 기본 응답
-                result = {
-                    "status": "success",
-                    "data": {
-                        "items": [],
-                        "pagination": {
-                            "page": page,
-                            "per_page": per_page,
-                            "total": 0,
-                            "pages": 0
-                        }
-                    }
-                }
+                result = _empty_history(page, per_page, "success")
         except Exception as service_error:
-            logger.error(f"❌ [{request_id}] 히스토리 서비스 호출 오류: {service_error}")
-            result = {
-                "status": "error",
-                "message": "히스토리 조회 중 오류가 발생했습니다",
-                "data": {
-                    "items": [],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 0,
-                        "pages": 0
-                    }
-                }
-            }
+            logger.error(
+                "❌ [%s] 히스토리 서비스 호출 오류: %s", request_id, service_error
+            )
+            result = _empty_history(
+                page, per_page, "error", "히스토리 조회 중 오류가 발생했습니다"
+            )
 
-        logger.info(f"✅ [{request_id}] 히스토리 조회 완료")
+        logger.info("✅ [%s] 히스토리 조회 완료", request_id)
         return result
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ [{request_id}] 히스토리 조회 중 오류: {e}")
+        logger.error("❌ [%s] 히스토리 조회 중 오류: %s", request_id, e)
         raise HTTPException(500, "히스토리 조회 중 내부 오류가 발생했습니다") 
\ No newline at end of file
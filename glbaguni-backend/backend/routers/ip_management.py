@@ -5,12 +5,23 @@ IP 차단 관리 라우터
 IP 차단 목록 조회, 수동 차단/해제, 통계 등을 관리하는 엔드포인트를 제공합니다.
 """
 
-from fastapi import APIRouter, Request, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Query, Depends, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
+import bisect
+import heapq
 import time
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Tuple
 from pydantic import BaseModel, Field
 import ipaddress
+import re
+import secrets
+
+import orjson
 
 try:
     from utils.logging_config import get_logger
@@ -20,7 +31,7 @@ try:
         BlockedIP,
         BlockReason,
         ThreatLevel,
-        ip_blocker_middleware
+        get_ip_blocker_middleware
     )
 except ImportError:
     from backend.utils.logging_config import get_logger
@@ -30,7 +41,7 @@ except ImportError:
         BlockedIP,
         BlockReason,
         ThreatLevel,
-        ip_blocker_middleware
+        get_ip_blocker_middleware
     )
     import logging
     def get_logger(name):
@@ -38,7 +49,167 @@ except ImportError:
 
 logger = get_logger("ip_management")
 
-router = APIRouter(prefix="/ip-management", tags=["IP Management"])
+router = APIRouter(
+    prefix="/ip-management",
+    tags=["IP Management"],
+    default_response_class=ORJSONResponse,
+)
+
+# 앱에 등록된 것과 같은 전역 IP 차단 미들웨어 인스턴스
+ip_blocker_middleware = get_ip_blocker_middleware()
+
+# 차단 목록 캐시 (관리 API 연속 호출 시 저장소 스캔/to_dict 직렬화를 1회로 합침)
+BLOCKED_IPS_TTL = 1.0
+_BLOCKED_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+_BLOCKED_LOCK = asyncio.Lock()
+
+# 백그라운드 수동 차단/해제 작업 상태 (IP별 마지막 요청, 오래된 것부터 정리)
+MAX_BLOCK_TASKS = 1000
+_BLOCK_TASKS: Dict[str, Dict[str, Any]] = {}
+
+# 스냅샷별 위협 레벨/차단 이유 분류 (같은 스냅샷이면 버킷을 다시 만들지 않음)
+_BLOCKED_GROUPS: Dict[str, Any] = {"snapshot": None, "payload": None}
+
+
+async def _get_blocked_snapshot() -> Tuple[List[BlockedIP], List[Dict[str, Any]]]:
+    """차단된 IP 목록과 각 IP의 to_dict() 결과 (BLOCKED_IPS_TTL 동안 재사용)"""
+    async with _BLOCKED_LOCK:
+        if time.monotonic() - _BLOCKED_CACHE["t"] < BLOCKED_IPS_TTL:
+            return _BLOCKED_CACHE["payload"]
+
+        blocked_ips = await ip_blocker_middleware.storage.get_blocked_ips()
+        payload = (blocked_ips, [blocked_ip.to_dict() for blocked_ip in blocked_ips])
+        _BLOCKED_CACHE["payload"] = payload
+        _BLOCKED_CACHE["t"] = time.monotonic()
+        return payload
+
+
+def _get_blocked_groups(
+    snapshot: Tuple[List[BlockedIP], List[Dict[str, Any]]]
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+    """스냅샷의 위협 레벨별/차단 이유별 분류 (스냅샷이 바뀔 때만 다시 계산)"""
+    if _BLOCKED_GROUPS["snapshot"] is snapshot:
+        return _BLOCKED_GROUPS["payload"]
+
+    # IP당 한 번 만든 dict를 모든 분류에서 공유
+    by_threat_level = {value: [] for value in _THREAT_VALUES}
+    by_reason = {value: [] for value in _REASON_VALUES}
+    for blocked_ip, blocked_dict in zip(*snapshot):
+        by_threat_level[blocked_ip.threat_level.value].append(blocked_dict)
+        by_reason[blocked_ip.reason.value].append(blocked_dict)
+
+    payload = (by_threat_level, by_reason)
+    _BLOCKED_GROUPS["payload"] = payload
+    _BLOCKED_GROUPS["snapshot"] = snapshot
+    return payload
+
+
+# 응답의 위협 레벨/차단 이유 키 (Enum 순회는 모듈 로드 시 1회만)
+_THREAT_VALUES = tuple(level.value for level in ThreatLevel)
+_REASON_VALUES = tuple(reason.value for reason in BlockReason)
+
+# 일반적인 IPv4 점 표기 (ipaddress와 같이 앞자리 0은 허용하지 않음)
+_IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])"
+_IPV4_RE = re.compile(rf"(?:{_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}")
+
+# IP 통계 기반 위험도 규칙: (통계 키, 집합 여부, 높은 임계값부터 (임계값, 점수, 메시지))
+_RISK_RULES = (
+    ("total_requests", False, ((1000, 30, "과도한 요청 수: {}"), (500, 15, "많은 요청 수: {}"))),
+    ("failed_auths", False, ((10, 25, "인증 실패 과다: {}회"), (5, 10, "인증 실패: {}회"))),
+    ("user_agents", True, ((10, 20, "다양한 User-Agent: {}개"),)),
+    ("endpoints", True, ((20, 15, "다양한 엔드포인트 접근: {}개"),)),
+)
+
+# 최근 활동 응답에 포함할 User-Agent 최대 길이
+_UA_TRUNC = 100
+
+# 위험도 점수 구간별 레벨 (점수 >= 임계값이면 다음 레벨)과 권장 조치
+_LEVEL_THRESHOLDS = (10, 30, 50, 70)
+_LEVELS = ("SAFE", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+_RECOMMENDATIONS = {
+    "SAFE": "안전한 IP입니다",
+    "LOW": "주의 관찰이 필요합니다",
+    "MEDIUM": "의심스러운 활동이 감지되었습니다",
+    "HIGH": "위험한 IP로 판단되며 차단을 고려하세요",
+    "CRITICAL": "즉시 차단이 필요한 위험한 IP입니다",
+}
+
+
+def _is_valid_ip(ip: str) -> bool:
+    """IP 주소 유효성 검사 (IPv4는 정규식으로 바로 판정, 그 외만 ipaddress로 파싱)"""
+    if _IPV4_RE.fullmatch(ip):
+        return True
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _truncate_user_agent(user_agent: str) -> str:
+    """긴 User-Agent 자르기 (같은 봇/브라우저의 반복 UA는 같은 문자열 객체를 재사용)"""
+    if len(user_agent) <= _UA_TRUNC:
+        return user_agent
+    return user_agent[:_UA_TRUNC] + "..."
+
+
+def _score_ip_stats(ip_stats: Dict[str, Any]) -> Tuple[int, List[str]]:
+    """IP 통계에 위험도 규칙을 적용해 (점수, 위험 요인) 반환"""
+    risk_score = 0
+    risk_factors = []
+    for key, is_collection, tiers in _RISK_RULES:
+        value = ip_stats.get(key)
+        if not value:
+            continue
+        if is_collection:
+            value = len(value)
+        for threshold, score, message in tiers:
+            if value > threshold:
+                risk_score += score
+                risk_factors.append(message.format(value))
+                break
+    return risk_score, risk_factors
+
+
+def _invalidate_blocked_cache() -> None:
+    """수동 차단/해제 직후 목록 조회에 바로 반영되도록 캐시 무효화"""
+    _BLOCKED_CACHE["t"] = 0.0
+
+
+def _record_block_task(ip: str, request_id: str, action: str, status: str) -> None:
+    """수동 차단/해제 작업 상태 기록"""
+    _BLOCK_TASKS.pop(ip, None)
+    if len(_BLOCK_TASKS) >= MAX_BLOCK_TASKS:
+        _BLOCK_TASKS.pop(next(iter(_BLOCK_TASKS)))
+    _BLOCK_TASKS[ip] = {
+        "request_id": request_id,
+        "action": action,
+        "status": status,
+        "updated_at": time.time(),
+    }
+
+
+async def _run_block_task(request_id: str, ip: str, reason: str, duration_hours: int) -> bool:
+    """수동 차단 실행 후 캐시 무효화 및 상태 기록"""
+    success = await ip_blocker_middleware.block_ip_manually(ip, reason, duration_hours)
+    if success:
+        _invalidate_blocked_cache()
+        logger.info(
+            "🔨 수동 IP 차단: %s | 이유: %s | 시간: %s시간", ip, reason, duration_hours
+        )
+    _record_block_task(ip, request_id, "block", "completed" if success else "failed")
+    return success
+
+
+async def _run_unblock_task(request_id: str, ip: str) -> bool:
+    """수동 차단 해제 실행 후 캐시 무효화 및 상태 기록"""
+    success = await ip_blocker_middleware.unblock_ip_manually(ip)
+    if success:
+        _invalidate_blocked_cache()
+        logger.info("🔓 수동 IP 차단 해제: %s", ip)
+    _record_block_task(ip, request_id, "unblock", "completed" if success else "failed")
+    return success
 
 
 class ManualBlockRequest(BaseModel):
@@ -53,31 +224,32 @@ class IPAnalysisRequest(BaseModel):
     ip: str = Field(..., description="분석할 IP 주소")
 
 
+class IPBatchAnalysisRequest(BaseModel):
+    """IP 일괄 분석 요청 모델"""
+    ips: List[str] = Field(..., min_length=1, max_length=100, description="분석할 IP 주소 목록")
+
+
 @router.get("/blocked-ips")
 async def get_blocked_ips() -> Dict[str, Any]:
     """
     현재 차단된 IP 목록 조회
     """
     try:
-        blocked_ips = await ip_blocker_middleware.storage.get_blocked_ips()
-        
-        # 위협 레벨별 분류
-        by_threat_level = {level.value: [] for level in ThreatLevel}
-        by_reason = {reason.value: [] for reason in BlockReason}
+        snapshot = await _get_blocked_snapshot()
+        blocked_ips, blocked_dicts = snapshot
         
-        for blocked_ip in blocked_ips:
-            by_threat_level[blocked_ip.threat_level.value].append(blocked_ip.to_dict())
-            by_reason[blocked_ip.reason.value].append(blocked_ip.to_dict())
+        # 위협 레벨별/차단 이유별 분류
+        by_threat_level, by_reason = _get_blocked_groups(snapshot)
         
         return {
             "total_blocked": len(blocked_ips),
-            "blocked_ips": [ip.to_dict() for ip in blocked_ips],
+            "blocked_ips": blocked_dicts,
             "by_threat_level": by_threat_level,
             "by_reason": by_reason,
             "timestamp": time.time()
         }
     except Exception as e:
-        logger.error(f"차단된 IP 목록 조회 중 오류: {e}")
+        logger.error("차단된 IP 목록 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="차단된 IP 목록 조회에 실패했습니다")
 
 
@@ -88,9 +260,7 @@ async def get_blocked_ip_info(ip: str) -> Dict[str, Any]:
     """
     try:
         # IP 주소 유효성 검증
-        try:
-            ipaddress.ip_address(ip)
-        except ValueError:
+        if not _is_valid_ip(ip):
             raise HTTPException(status_code=400, detail="유효하지 않은 IP 주소입니다")
         
         is_blocked, blocked_info = await ip_blocker_middleware.storage.is_blocked(ip)
@@ -119,20 +289,25 @@ async def get_blocked_ip_info(ip: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"IP 정보 조회 중 오류: {e}")
+        logger.error("IP 정보 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="IP 정보 조회에 실패했습니다")
 
 
 @router.post("/block-ip")
-async def block_ip_manually(request: ManualBlockRequest) -> Dict[str, Any]:
+async def block_ip_manually(
+    request: ManualBlockRequest,
+    background_tasks: BackgroundTasks,
+    sync: bool = Query(False, description="차단 완료까지 기다린 뒤 응답")
+) -> Dict[str, Any]:
     """
     수동으로 IP 차단
+    
+    기본적으로 저장소 기록은 백그라운드에서 처리하고 접수 즉시 응답합니다.
+    처리 결과는 GET /ip-management/block-ip/status/{ip}로 확인합니다.
     """
     try:
         # IP 주소 유효성 검증
-        try:
-            ipaddress.ip_address(request.ip)
-        except ValueError:
+        if not _is_valid_ip(request.ip):
             raise HTTPException(status_code=400, detail="유효하지 않은 IP 주소입니다")
         
         # 화이트리스트 확인
@@ -149,15 +324,37 @@ async def block_ip_manually(request: ManualBlockRequest) -> Dict[str, Any]:
                 "timestamp": time.time()
             }
         
+        request_id = secrets.token_hex(4)
+        
+        if not sync:
+            # 저장소 기록은 응답 후 백그라운드에서 실행
+            _record_block_task(request.ip, request_id, "block", "pending")
+            background_tasks.add_task(
+                _run_block_task,
+                request_id,
+                request.ip,
+                request.reason,
+                request.duration_hours
+            )
+            return {
+                "success": True,
+                "accepted": True,
+                "status": "pending",
+                "request_id": request_id,
+                "message": f"IP {request.ip} 차단 요청이 접수되었습니다",
+                "ip": request.ip,
+                "duration_hours": request.duration_hours,
+                "reason": request.reason,
+                "timestamp": time.time()
+            }
+        
         # 수동 차단 실행
-        success = await ip_blocker_middleware.block_ip_manually(
+        if await _run_block_task(
+            request_id,
             request.ip, 
             request.reason, 
             request.duration_hours
-        )
-        
-        if success:
-            logger.info(f"🔨 수동 IP 차단: {request.ip} | 이유: {request.reason} | 시간: {request.duration_hours}시간")
+        ):
             return {
                 "success": True,
                 "message": f"IP {request.ip}이(가) {request.duration_hours}시간 동안 차단되었습니다",
@@ -172,20 +369,45 @@ async def block_ip_manually(request: ManualBlockRequest) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"수동 IP 차단 중 오류: {e}")
+        logger.error("수동 IP 차단 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="IP 차단 처리에 실패했습니다")
 
 
+@router.get("/block-ip/status/{ip}")
+async def get_block_task_status(ip: str) -> Dict[str, Any]:
+    """
+    백그라운드 수동 차단/해제 요청 처리 상태 조회
+    """
+    if not _is_valid_ip(ip):
+        raise HTTPException(status_code=400, detail="유효하지 않은 IP 주소입니다")
+    
+    task = _BLOCK_TASKS.get(ip)
+    if task is None:
+        raise HTTPException(status_code=404, detail="해당 IP의 차단/해제 요청 기록이 없습니다")
+    
+    is_blocked, _ = await ip_blocker_middleware.storage.is_blocked(ip)
+    return {
+        "ip": ip,
+        **task,
+        "is_blocked": is_blocked,
+        "timestamp": time.time()
+    }
+
+
 @router.delete("/unblock-ip/{ip}")
-async def unblock_ip_manually(ip: str) -> Dict[str, Any]:
+async def unblock_ip_manually(
+    ip: str,
+    background_tasks: BackgroundTasks,
+    sync: bool = Query(False, description="차단 해제 완료까지 기다린 뒤 응답")
+) -> Dict[str, Any]:
     """
     수동으로 IP 차단 해제
+    
+    기본적으로 저장소 삭제는 백그라운드에서 처리하고 접수 즉시 응답합니다.
     """
     try:
         # IP 주소 유효성 검증
-        try:
-            ipaddress.ip_address(ip)
-        except ValueError:
+        if not _is_valid_ip(ip):
             raise HTTPException(status_code=400, detail="유효하지 않은 IP 주소입니다")
         
         # 차단 여부 확인
@@ -198,16 +420,31 @@ async def unblock_ip_manually(ip: str) -> Dict[str, Any]:
                 "timestamp": time.time()
             }
         
-        # 차단 해제 실행
-        success = await ip_blocker_middleware.unblock_ip_manually(ip)
+        request_id = secrets.token_hex(4)
+        previous_block = blocked_info.to_dict() if blocked_info else None
         
-        if success:
-            logger.info(f"🔓 수동 IP 차단 해제: {ip}")
+        if not sync:
+            # 저장소 삭제는 응답 후 백그라운드에서 실행
+            _record_block_task(ip, request_id, "unblock", "pending")
+            background_tasks.add_task(_run_unblock_task, request_id, ip)
+            return {
+                "success": True,
+                "accepted": True,
+                "status": "pending",
+                "request_id": request_id,
+                "message": f"IP {ip} 차단 해제 요청이 접수되었습니다",
+                "ip": ip,
+                "previous_block": previous_block,
+                "timestamp": time.time()
+            }
+        
+        # 차단 해제 실행
+        if await _run_unblock_task(request_id, ip):
             return {
                 "success": True,
                 "message": f"IP {ip}의 차단이 해제되었습니다",
                 "ip": ip,
-                "previous_block": blocked_info.to_dict() if blocked_info else None,
+                "previous_block": previous_block,
                 "timestamp": time.time()
             }
         else:
@@ -216,7 +453,7 @@ async def unblock_ip_manually(ip: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"수동 IP 차단 해제 중 오류: {e}")
+        logger.error("수동 IP 차단 해제 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="IP 차단 해제 처리에 실패했습니다")
 
 
@@ -230,25 +467,23 @@ async def get_ip_blocker_stats() -> Dict[str, Any]:
         
         # 추가 통계 계산
         analyzer = ip_blocker_middleware.analyzer
-        current_time = time.time()
         
         # 활성 IP 수
         active_ips = len(analyzer.ip_stats)
         
-        # 최근 활동 IP들 (지난 1시간)
-        recent_active_ips = 0
-        for ip, stat in analyzer.ip_stats.items():
-            if current_time - stat.get("last_request", 0) < 3600:
-                recent_active_ips += 1
-        
-        # 위협 분포
-        threat_distribution = {level.value: 0 for level in ThreatLevel}
-        reason_distribution = {reason.value: 0 for reason in BlockReason}
+        # 최근 활동 IP들 (지난 1시간, 분석기가 유지하는 집계 사용)
+        recent_active_ips = analyzer.recent_active_count()
         
-        blocked_ips = await ip_blocker_middleware.storage.get_blocked_ips()
+        # 위협 분포 (한 번의 순회로 두 분포를 함께 집계)
+        blocked_ips, _ = await _get_blocked_snapshot()
+        threat_counter: Counter = Counter()
+        reason_counter: Counter = Counter()
         for blocked_ip in blocked_ips:
-            threat_distribution[blocked_ip.threat_level.value] += 1
-            reason_distribution[blocked_ip.reason.value] += 1
+            threat_counter[blocked_ip.threat_level.value] += 1
+            reason_counter[blocked_ip.reason.value] += 1
+        
+        threat_distribution = {value: threat_counter[value] for value in _THREAT_VALUES}
+        reason_distribution = {value: reason_counter[value] for value in _REASON_VALUES}
         
         return {
             **stats,
@@ -265,10 +500,45 @@ async def get_ip_blocker_stats() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"IP 차단 통계 조회 중 오류: {e}")
+        logger.error("IP 차단 통계 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="통계 정보 조회에 실패했습니다")
 
 
+def _build_ip_analysis(
+    ip: str, is_blocked: bool, blocked_info: Optional[BlockedIP], now: float
+) -> Dict[str, Any]:
+    """IP 통계/요청 기록과 차단 상태로 위험도 분석 결과 생성"""
+    # IP 통계 가져오기
+    ip_stats = ip_blocker_middleware.analyzer.ip_stats.get(ip, {})
+    request_history = ip_blocker_middleware.analyzer.request_history.get(ip, ())
+    
+    # 위험도 점수 계산
+    risk_score, risk_factors = _score_ip_stats(ip_stats)
+    
+    # 최근 요청 패턴 분석 (시간순 기록을 뒤에서부터 1시간 경계까지만 셈)
+    recent_count = _count_recent(request_history, now - 3600)
+    if recent_count > 100:
+        risk_score += 20
+        risk_factors.append(f"최근 1시간 과도한 요청: {recent_count}회")
+    
+    # 위험도 레벨 결정
+    risk_level = _LEVELS[bisect.bisect_right(_LEVEL_THRESHOLDS, risk_score)]
+    
+    return {
+        "ip": ip,
+        "risk_score": min(risk_score, 100),
+        "risk_level": risk_level,
+        "risk_factors": risk_factors,
+        "is_blocked": is_blocked,
+        "blocked_info": blocked_info.to_dict() if blocked_info else None,
+        "stats": ip_stats,
+        "request_history_count": len(request_history),
+        "recent_requests_count": recent_count,
+        "analysis_timestamp": now,
+        "recommendation": _RECOMMENDATIONS[risk_level]
+    }
+
+
 @router.post("/analyze-ip")
 async def analyze_ip(request: IPAnalysisRequest) -> Dict[str, Any]:
     """
@@ -278,97 +548,52 @@ async def analyze_ip(request: IPAnalysisRequest) -> Dict[str, Any]:
         ip = request.ip
         
         # IP 주소 유효성 검증
-        try:
-            ipaddress.ip_address(ip)
-        except ValueError:
+        if not _is_valid_ip(ip):
             raise HTTPException(status_code=400, detail="유효하지 않은 IP 주소입니다")
         
-        # IP 통계 가져오기
-        ip_stats = ip_blocker_middleware.analyzer.ip_stats.get(ip, {})
-        request_history = list(ip_blocker_middleware.analyzer.request_history.get(ip, []))
-        
         # 차단 여부 확인
         is_blocked, blocked_info = await ip_blocker_middleware.storage.is_blocked(ip)
         
-        # 위험도 점수 계산
-        risk_score = 0
-        risk_factors = []
-        
-        if ip_stats:
-            # 요청 빈도
-            total_requests = ip_stats.get("total_requests", 0)
-            if total_requests > 1000:
-                risk_score += 30
-                risk_factors.append(f"과도한 요청 수: {total_requests}")
-            elif total_requests > 500:
-                risk_score += 15
-                risk_factors.append(f"많은 요청 수: {total_requests}")
-            
-            # 인증 실패
-            failed_auths = ip_stats.get("failed_auths", 0)
-            if failed_auths > 10:
-                risk_score += 25
-                risk_factors.append(f"인증 실패 과다: {failed_auths}회")
-            elif failed_auths > 5:
-                risk_score += 10
-                risk_factors.append(f"인증 실패: {failed_auths}회")
-            
-            # User-Agent 다양성
-            user_agents = len(ip_stats.get("user_agents", set()))
-            if user_agents > 10:
-                risk_score += 20
-                risk_factors.append(f"다양한 User-Agent: {user_agents}개")
-            
-            # 엔드포인트 다양성
-            endpoints = len(ip_stats.get("endpoints", set()))
-            if endpoints > 20:
-                risk_score += 15
-                risk_factors.append(f"다양한 엔드포인트 접근: {endpoints}개")
-        
-        # 최근 요청 패턴 분석
-        if request_history:
-            recent_requests = [req for req in request_history if time.time() - req.timestamp < 3600]
-            if len(recent_requests) > 100:
-                risk_score += 20
-                risk_factors.append(f"최근 1시간 과도한 요청: {len(recent_requests)}회")
-        
-        # 위험도 레벨 결정
-        if risk_score >= 70:
-            risk_level = "CRITICAL"
-        elif risk_score >= 50:
-            risk_level = "HIGH"
-        elif risk_score >= 30:
-            risk_level = "MEDIUM"
-        elif risk_score >= 10:
-            risk_level = "LOW"
-        else:
-            risk_level = "SAFE"
+        return _build_ip_analysis(ip, is_blocked, blocked_info, time.time())
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("IP 분석 중 오류: %s", e)
+        raise HTTPException(status_code=500, detail="IP 분석에 실패했습니다")
+
+
+@router.post("/analyze-ips")
+async def analyze_ips(request: IPBatchAnalysisRequest) -> Dict[str, Any]:
+    """
+    여러 IP의 위험도 일괄 분석 (차단 여부는 저장소에 한 번에 조회)
+    """
+    try:
+        invalid_ips = [ip for ip in request.ips if not _is_valid_ip(ip)]
+        if invalid_ips:
+            raise HTTPException(
+                status_code=400,
+                detail=f"유효하지 않은 IP 주소입니다: {', '.join(invalid_ips)}"
+            )
+        
+        blocked = await ip_blocker_middleware.storage.is_blocked_many(request.ips)
+        now = time.time()
+        results = [
+            _build_ip_analysis(ip, is_blocked, blocked_info, now)
+            for ip, (is_blocked, blocked_info) in blocked.items()
+        ]
         
         return {
-            "ip": ip,
-            "risk_score": min(risk_score, 100),
-            "risk_level": risk_level,
-            "risk_factors": risk_factors,
-            "is_blocked": is_blocked,
-            "blocked_info": blocked_info.to_dict() if blocked_info else None,
-            "stats": ip_stats,
-            "request_history_count": len(request_history),
-            "recent_requests_count": len([req for req in request_history if time.time() - req.timestamp < 3600]),
-            "analysis_timestamp": time.time(),
-            "recommendation": {
-                "SAFE": "안전한 IP입니다",
-                "LOW": "주의 관찰이 필요합니다",
-                "MEDIUM": "의심스러운 활동이 감지되었습니다",
-                "HIGH": "위험한 IP로 판단되며 차단을 고려하세요",
-                "CRITICAL": "즉시 차단이 필요한 위험한 IP입니다"
-            }.get(risk_level, "알 수 없는 위험도")
+            "results": results,
+            "count": len(results),
+            "analysis_timestamp": now
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"IP 분석 중 오류: {e}")
-        raise HTTPException(status_code=500, detail="IP 분석에 실패했습니다")
+        logger.error("IP 일괄 분석 중 오류: %s", e)
+        raise HTTPException(status_code=500, detail="IP 일괄 분석에 실패했습니다")
 
 
 @router.get("/whitelist")
@@ -384,7 +609,7 @@ async def get_whitelist() -> Dict[str, Any]:
             "timestamp": time.time()
         }
     except Exception as e:
-        logger.error(f"화이트리스트 조회 중 오류: {e}")
+        logger.error("화이트리스트 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="화이트리스트 조회에 실패했습니다")
 
 
@@ -421,10 +646,28 @@ async def get_ip_blocker_config() -> Dict[str, Any]:
             "timestamp": time.time()
         }
     except Exception as e:
-        logger.error(f"설정 정보 조회 중 오류: {e}")
+        logger.error("설정 정보 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="설정 정보 조회에 실패했습니다")
 
 
+def _iter_recent(ip: str, history, cutoff: float):
+    """시간순 히스토리를 뒤에서부터 읽어 cutoff 이후 요청을 최신순으로 생성"""
+    for request in reversed(history):
+        if request.timestamp <= cutoff:
+            return
+        yield request.timestamp, ip, request
+
+
+def _count_recent(history, cutoff: float) -> int:
+    """cutoff 이후 요청 수 (뒤에서부터 세다가 경계에서 중단)"""
+    count = 0
+    for request in reversed(history):
+        if request.timestamp <= cutoff:
+            break
+        count += 1
+    return count
+
+
 @router.get("/recent-activity")
 async def get_recent_activity(
     limit: int = Query(50, ge=1, le=200, description="조회할 항목 수"),
@@ -435,83 +678,97 @@ async def get_recent_activity(
     """
     try:
         analyzer = ip_blocker_middleware.analyzer
-        current_time = time.time()
-        recent_activity = []
-        
-        # 모든 IP의 최근 요청 수집
-        for ip, history in analyzer.request_history.items():
-            if ip_filter and ip != ip_filter:
-                continue
-                
-            for request in history:
-                if current_time - request.timestamp < 3600:  # 최근 1시간
-                    recent_activity.append({
-                        "ip": ip,
-                        "timestamp": request.timestamp,
-                        "endpoint": request.endpoint,
-                        "method": request.method,
-                        "status_code": request.status_code,
-                        "user_agent": request.user_agent[:100] + "..." if len(request.user_agent) > 100 else request.user_agent,
-                        "response_time": request.response_time,
-                        "threat_score": request.threat_score
-                    })
-        
-        # 시간순 정렬
-        recent_activity.sort(key=lambda x: x["timestamp"], reverse=True)
+        now = time.time()
+        cutoff = now - 3600  # 최근 1시간
+        
+        if ip_filter:
+            histories = [(ip_filter, analyzer.request_history.get(ip_filter, ()))]
+        else:
+            histories = list(analyzer.request_history.items())
+        
+        # IP별 최신순 스트림을 병합해 상위 limit개만 꺼냄 (전체 목록을 만들지 않음)
+        newest_first = heapq.merge(
+            *(_iter_recent(ip, history, cutoff) for ip, history in histories),
+            key=itemgetter(0),
+            reverse=True,
+        )
+        recent_activity = [
+            {
+                "ip": ip,
+                "timestamp": timestamp,
+                "endpoint": request.endpoint,
+                "method": request.method,
+                "status_code": request.status_code,
+                "user_agent": _truncate_user_agent(request.user_agent),
+                "response_time": request.response_time,
+                "threat_score": request.threat_score
+            }
+            for timestamp, ip, request in islice(newest_first, limit)
+        ]
+        total_recent = sum(
+            _count_recent(history, cutoff) for _, history in histories
+        )
         
         return {
-            "recent_activity": recent_activity[:limit],
-            "total_recent_requests": len(recent_activity),
+            "recent_activity": recent_activity,
+            "total_recent_requests": total_recent,
             "time_window": "최근 1시간",
             "ip_filter": ip_filter,
-            "timestamp": time.time()
+            "timestamp": now
         }
         
     except Exception as e:
-        logger.error(f"최근 활동 조회 중 오류: {e}")
+        logger.error("최근 활동 조회 중 오류: %s", e)
         raise HTTPException(status_code=500, detail="최근 활동 조회에 실패했습니다")
 
 
-@router.get("/info")
-async def get_ip_blocker_info() -> Dict[str, Any]:
+# 시스템 정보는 고정값이므로 모듈 로드 시 1회만 직렬화
+_INFO_DICT = {
+    "system": {
+        "name": "글바구니 IP 차단 시스템",
+        "version": "1.0.0",
+        "description": "비정상적인 요청 패턴을 감지하여 자동으로 IP를 차단하는 시스템"
+    },
+    "features": {
+        "automatic_detection": "비정상적인 요청 패턴 자동 감지",
+        "threat_levels": "4단계 위험도 분류 (LOW/MEDIUM/HIGH/CRITICAL)",
+        "storage_options": "메모리 + Redis 저장소 지원",
+        "manual_management": "수동 차단/해제 기능",
+        "whitelist_support": "화이트리스트 IP 보호",
+        "real_time_analysis": "실시간 요청 패턴 분석"
+    },
+    "detection_criteria": {
+        "rate_limit_abuse": "짧은 시간 내 과도한 요청",
+        "failed_auth_attempts": "연속적인 인증 실패",
+        "captcha_failures": "CAPTCHA 반복 실패",
+        "endpoint_scanning": "다양한 엔드포인트 스캔",
+        "user_agent_violations": "의심스러운 User-Agent 패턴",
+        "suspicious_patterns": "기타 비정상적인 행동 패턴"
+    },
+    "block_durations": {
+        "LOW": "15분 차단",
+        "MEDIUM": "1시간 차단",
+        "HIGH": "2시간 차단",
+        "CRITICAL": "24시간 차단"
+    },
+    "api_endpoints": {
+        "GET /ip-management/blocked-ips": "차단된 IP 목록 조회",
+        "GET /ip-management/blocked-ips/{ip}": "특정 IP 차단 정보",
+        "POST /ip-management/block-ip": "수동 IP 차단",
+        "GET /ip-management/block-ip/status/{ip}": "수동 차단/해제 처리 상태",
+        "DELETE /ip-management/unblock-ip/{ip}": "수동 IP 차단 해제",
+        "GET /ip-management/stats": "시스템 통계",
+        "POST /ip-management/analyze-ip": "IP 위험도 분석",
+        "POST /ip-management/analyze-ips": "여러 IP 위험도 일괄 분석",
+        "GET /ip-management/recent-activity": "최근 활동 조회"
+    }
+}
+_INFO_BYTES = orjson.dumps(_INFO_DICT)
+
+
+@router.get("/info", response_class=Response)
+async def get_ip_blocker_info() -> Response:
     """
     IP 차단 시스템 정보
     """
-    return {
-        "system": {
-            "name": "글바구니 IP 차단 시스템",
-            "version": "1.0.0",
-            "description": "비정상적인 요청 패턴을 감지하여 자동으로 IP를 차단하는 시스템"
-        },
-        "features": {
-            "automatic_detection": "비정상적인 요청 패턴 자동 감지",
-            "threat_levels": "4단계 위험도 분류 (LOW/MEDIUM/HIGH/CRITICAL)",
-            "storage_options": "메모리 + Redis 저장소 지원",
-            "manual_management": "수동 차단/해제 기능",
-            "whitelist_support": "화이트리스트 IP 보호",
-            "real_time_analysis": "실시간 요청 패턴 분석"
-        },
-        "detection_criteria": {
-            "rate_limit_abuse": "짧은 시간 내 과도한 요청",
-            "failed_auth_attempts": "연속적인 인증 실패",
-            "captcha_failures": "CAPTCHA 반복 실패",
-            "endpoint_scanning": "다양한 엔드포인트 스캔",
-            "user_agent_violations": "의심스러운 User-Agent 패턴",
-            "suspicious_patterns": "기타 비정상적인 행동 패턴"
-        },
-        "block_durations": {
-            "LOW": "15분 차단",
-            "MEDIUM": "1시간 차단",
-            "HIGH": "2시간 차단",
-            "CRITICAL": "24시간 차단"
-        },
-        "api_endpoints": {
-            "GET /ip-management/blocked-ips": "차단된 IP 목록 조회",
-            "GET /ip-management/blocked-ips/{ip}": "특정 IP 차단 정보",
-            "POST /ip-management/block-ip": "수동 IP 차단",
-            "DELETE /ip-management/unblock-ip/{ip}": "수동 IP 차단 해제",
-            "GET /ip-management/stats": "시스템 통계",
-            "POST /ip-management/analyze-ip": "IP 위험도 분석",
-            "GET /ip-management/recent-activity": "최근 활동 조회"
-        }
-    } 
\ No newline at end of file
+    return Response(content=_INFO_BYTES, media_type="application/json")
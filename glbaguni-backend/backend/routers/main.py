@@ -10,49 +10,79 @@ import time
 from datetime import datetime
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from ..utils.responses import ResponseBuilder
 
+logger = logging.getLogger("glbaguni")
+
+# 루트 응답의 고정 부분 (요청마다 stats만 추가)
+_SERVICE_INFO = {
+    "service": "글바구니 (Glbaguni)",
+    "description": "AI 기반 RSS 피드 요약 서비스",
+    "version": "2.2.0",
+    "status": "운영중",
+    "features": (
+        "RSS 피드 요약",
+        "자연어 뉴스 검색",
+        "사용자 히스토리",
+        "개인화 추천",
+        "이메일 알림",
+    ),
+}
+
+
+# 헬스체크 결과 재사용 시간 (프로브가 몰려도 DB 확인은 TTL마다 1회)
+HEALTH_TTL = 1.0
+
+# 환경변수 설정 여부 (프로세스 수명 동안 고정이므로 요청마다 조회하지 않음)
+_TEST_ENV_VARS = ("OPENAI_API_KEY", "SMTP_USERNAME", "SMTP_PASSWORD")
+_ENV_STATUS = {}
+
+
+def reload_env_status():
+    """환경변수 상태 다시 읽기 (.env 로드 이후 또는 테스트에서 호출)"""
+    _ENV_STATUS["openai"] = "configured" if os.getenv("OPENAI_API_KEY") else "missing"
+    _ENV_STATUS["smtp"] = "yes" if os.getenv("SMTP_USERNAME") else "no"
+    _ENV_STATUS["test"] = {
+        var: "SET" if os.getenv(var) else "NOT_SET" for var in _TEST_ENV_VARS
+    }
+
+
+reload_env_status()
+
 
 def create_main_router(app_state, importer):
     """메인 라우터 생성"""
-    router = APIRouter()
+    reload_env_status()
+    router = APIRouter(default_response_class=ORJSONResponse)
+
+    # 헬스체크 데이터 캐시 (라우터별로 유지, 응답 envelope는 요청마다 새로 생성)
+    health_cache = {"t": 0.0, "data": None}
 
     @router.get("/")
     async def root():
         """루트 엔드포인트"""
         return ResponseBuilder.success(
-            data={
-                "service": "글바구니 (Glbaguni)",
-                "description": "AI 기반 RSS 피드 요약 서비스",
-                "version": "2.2.0",
-                "status": "운영중",
-                "features": [
-                    "RSS 피드 요약",
-                    "자연어 뉴스 검색",
-                    "사용자 히스토리",
-                    "개인화 추천",
-                    "이메일 알림",
-                ],
-                "stats": app_state.get_stats(),
-            },
+            data={**_SERVICE_INFO, "stats": app_state.get_stats()},
             message="글바구니 서비스에 오신 것을 환영합니다!",
         )
 
     @router.get("/health")
     async def health_check():
         """상세한 헬스 체크 엔드포인트"""
+        if time.monotonic() - health_cache["t"] < HEALTH_TTL:
+            return ResponseBuilder.success(
+                data=health_cache["data"], message="헬스 체크 완료"
+            )
+
         try:
-            logger = logging.getLogger("glbaguni")
-            
             health_data = {
                 "status": "healthy",
                 "timestamp": datetime.now().isoformat(),
                 "version": "2.2.0",
-                "uptime_seconds": (
-                    time.time() - app_state.start_time if app_state.start_time else 0
-                ),
+                "uptime_seconds": app_state.uptime_seconds(),
                 "components": {},
                 "environment": {},
                 "database": {},
@@ -79,10 +109,8 @@ def create_main_router(app_state, importer):
 
             # 환경변수 상태
             health_data["environment"] = {
-                "openai_api_key": (
-                    "configured" if os.getenv("OPENAI_API_KEY") else "missing"
-                ),
-                "smtp_configured": "yes" if os.getenv("SMTP_USERNAME") else "no",
+                "openai_api_key": _ENV_STATUS["openai"],
+                "smtp_configured": _ENV_STATUS["smtp"],
                 "security_module": (
                     "available" if importer.security_available else "unavailable"
                 ),
@@ -100,14 +128,17 @@ def create_main_router(app_state, importer):
                 health_data["status"] = "degraded"
 
             # 전체 상태 결정
-            component_statuses = list(health_data["components"].values())
-            if "unavailable" in component_statuses or "unhealthy" in component_statuses:
+            if any(
+                status in ("unavailable", "unhealthy")
+                for status in health_data["components"].values()
+            ):
                 health_data["status"] = "degraded"
 
+            health_cache["data"] = health_data
+            health_cache["t"] = time.monotonic()
             return ResponseBuilder.success(data=health_data, message="헬스 체크 완료")
 
         except Exception as e:
-            logger = logging.getLogger("glbaguni")
             logger.error(f"헬스 체크 중 오류: {e}")
             return ResponseBuilder.error(
                 error_code="HEALTH_CHECK_ERROR",
@@ -121,10 +152,7 @@ def create_main_router(app_state, importer):
         return ResponseBuilder.success(
             data={
                 "test_status": "OK",
-                "environment_vars": {
-                    var: "SET" if os.getenv(var) else "NOT_SET"
-                    for var in ["OPENAI_API_KEY", "SMTP_USERNAME", "SMTP_PASSWORD"]
-                },
+                "environment_vars": dict(_ENV_STATUS["test"]),
                 "modules": {
                     "security_available": importer.security_available,
                     "models_loaded": len(importer.models),
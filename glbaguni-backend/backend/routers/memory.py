@@ -7,11 +7,12 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from dataclasses import asdict
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
 try:
@@ -22,6 +23,8 @@ try:
         initialize_memory_manager,
         cleanup_memory_manager
     )
+    from utils.common import now_iso_cached
+    from utils.http_cache import cached_json_response, freeze_json
     from utils.logging_config import get_logger
 except ImportError:
     from backend.utils.memory_manager import (
@@ -31,11 +34,56 @@ except ImportError:
         initialize_memory_manager,
         cleanup_memory_manager
     )
+    from backend.utils.common import now_iso_cached
+    from backend.utils.http_cache import cached_json_response, freeze_json
     from backend.utils.logging_config import get_logger
 
 logger = get_logger("memory_router")
 
 
+# 직렬화된 설정 응답 캐시 (설정 객체가 바뀔 때만 다시 직렬화)
+_CONFIG_CACHE: Dict[str, Any] = {"config": None, "body": b"", "etag": ""}
+
+
+# 강제 정리 결과 공유 (짧은 시간 내 중복 요청은 GC/캐시 정리를 다시 실행하지 않음)
+CLEANUP_COALESCE_SECONDS = 2.0
+_CLEANUP_LOCK = asyncio.Lock()
+_CLEANUP_LAST: Dict[str, Any] = {"t": 0.0, "result": None}
+
+
+# 테스트용 캐시 최대 크기/개수와 등록된 캐시 (관리자는 weakref만 보관하므로 여기서 유지,
+# 개수를 넘으면 가장 오래 전에 등록된 캐시부터 해제)
+MAX_TEST_CACHE_SIZE = 100_000
+MAX_TEST_CACHES = 4
+_TEST_CACHES: Dict[str, "_TestCache"] = {}
+
+
+class _TestCache(dict):
+    """weakref 등록이 가능한 테스트용 dict 캐시"""
+
+
+def get_memory_manager_dependency() -> MemoryManager:
+    """엔드포인트 주입용 전역 메모리 관리자 (테스트에서 dependency_overrides로 교체 가능)"""
+    return get_memory_manager()
+
+
+async def _coalesced_cleanup(memory_manager: MemoryManager) -> Dict[str, Any]:
+    """강제 메모리 정리 (진행 중이거나 직전에 끝난 정리가 있으면 그 결과 재사용)"""
+    async with _CLEANUP_LOCK:
+        if (
+            _CLEANUP_LAST["result"] is not None
+            and time.monotonic() - _CLEANUP_LAST["t"] < CLEANUP_COALESCE_SECONDS
+        ):
+            return _CLEANUP_LAST["result"]
+
+        result = await memory_manager.force_cleanup()
+        # 실패 결과는 공유하지 않음 (다음 요청에서 다시 시도)
+        if "error" not in result:
+            _CLEANUP_LAST["result"] = result
+            _CLEANUP_LAST["t"] = time.monotonic()
+        return result
+
+
 # === Pydantic 모델들 ===
 
 class MemoryStatusResponse(BaseModel):
@@ -70,23 +118,30 @@ class MemoryCleanupResponse(BaseModel):
 
 class MemoryConfigRequest(BaseModel):
     """메모리 설정 요청 모델"""
-    monitoring_interval_seconds: Optional[int] = Field(default=60, description="모니터링 간격 (초)")
-    cleanup_interval_seconds: Optional[int] = Field(default=300, description="정리 간격 (초)")
-    warning_threshold: Optional[float] = Field(default=70.0, description="경고 임계값 (%)")
-    critical_threshold: Optional[float] = Field(default=85.0, description="심각 임계값 (%)")
-    cleanup_threshold: Optional[float] = Field(default=80.0, description="정리 시작 임계값 (%)")
-    max_cache_size: Optional[int] = Field(default=1000, description="최대 캐시 크기")
-    enable_alerts: Optional[bool] = Field(default=True, description="알림 활성화")
+    monitoring_interval_seconds: Optional[int] = Field(default=None, description="모니터링 간격 (초)")
+    cleanup_interval_seconds: Optional[int] = Field(default=None, description="정리 간격 (초)")
+    warning_threshold: Optional[float] = Field(default=None, description="경고 임계값 (%)")
+    critical_threshold: Optional[float] = Field(default=None, description="심각 임계값 (%)")
+    cleanup_threshold: Optional[float] = Field(default=None, description="정리 시작 임계값 (%)")
+    max_cache_size: Optional[int] = Field(default=None, description="최대 캐시 크기")
+    enable_alerts: Optional[bool] = Field(default=None, description="알림 활성화")
 
 
 # === 라우터 생성 ===
 
 def create_memory_router() -> APIRouter:
     """메모리 관리 라우터 생성"""
-    router = APIRouter(prefix="/memory", tags=["Memory Management"])
+    router = APIRouter(
+        prefix="/memory",
+        tags=["Memory Management"],
+        default_response_class=ORJSONResponse,
+    )
     
-    @router.get("/status", response_model=MemoryStatusResponse)
-    async def get_memory_status():
+    # 응답 모델은 문서화에만 사용 (내부에서 만든 dict라 요청마다 재검증하지 않음)
+    @router.get("/status", responses={200: {"model": MemoryStatusResponse}})
+    async def get_memory_status(
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         현재 메모리 상태 조회
         
@@ -94,27 +149,28 @@ def create_memory_router() -> APIRouter:
             메모리 상태 정보 (healthy/warning/critical)
         """
         try:
-            memory_manager = get_memory_manager()
             health_status = memory_manager.get_health_status()
             
-            return MemoryStatusResponse(
-                status=health_status["status"],
-                message=health_status["message"],
-                memory_percent=health_status["memory_percent"],
-                process_memory_mb=health_status["process_memory_mb"],
-                cache_size=health_status["cache_size"],
-                timestamp=datetime.now().isoformat()
-            )
+            return ORJSONResponse({
+                "status": health_status["status"],
+                "message": health_status["message"],
+                "memory_percent": health_status["memory_percent"],
+                "process_memory_mb": health_status["process_memory_mb"],
+                "cache_size": health_status["cache_size"],
+                "timestamp": now_iso_cached()
+            })
             
         except Exception as e:
-            logger.error(f"메모리 상태 조회 실패: {e}")
+            logger.exception("메모리 상태 조회 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 상태 조회 중 오류가 발생했습니다: {str(e)}"
             )
     
-    @router.get("/stats", response_model=MemoryStatsResponse)
-    async def get_memory_stats():
+    @router.get("/stats", responses={200: {"model": MemoryStatsResponse}})
+    async def get_memory_stats(
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         상세 메모리 통계 조회
         
@@ -122,20 +178,19 @@ def create_memory_router() -> APIRouter:
             상세한 메모리 사용 통계 및 트렌드 정보
         """
         try:
-            memory_manager = get_memory_manager()
-            stats = memory_manager.get_stats()
-            
-            return MemoryStatsResponse(**stats)
+            return ORJSONResponse(memory_manager.get_stats())
             
         except Exception as e:
-            logger.error(f"메모리 통계 조회 실패: {e}")
+            logger.exception("메모리 통계 조회 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 통계 조회 중 오류가 발생했습니다: {str(e)}"
             )
     
     @router.post("/cleanup", response_model=MemoryCleanupResponse)
-    async def force_memory_cleanup():
+    async def force_memory_cleanup(
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         강제 메모리 정리 실행
         
@@ -143,10 +198,8 @@ def create_memory_router() -> APIRouter:
             메모리 정리 결과
         """
         try:
-            memory_manager = get_memory_manager()
-            
             logger.info("📞 API를 통한 강제 메모리 정리 요청")
-            result = await memory_manager.force_cleanup()
+            result = await _coalesced_cleanup(memory_manager)
             
             success = "error" not in result
             message = "메모리 정리가 성공적으로 완료되었습니다." if success else f"메모리 정리 중 오류: {result.get('error')}"
@@ -161,14 +214,17 @@ def create_memory_router() -> APIRouter:
             )
             
         except Exception as e:
-            logger.error(f"강제 메모리 정리 실패: {e}")
+            logger.exception("강제 메모리 정리 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 정리 중 오류가 발생했습니다: {str(e)}"
             )
     
     @router.post("/cleanup/background")
-    async def schedule_memory_cleanup(background_tasks: BackgroundTasks):
+    async def schedule_memory_cleanup(
+        background_tasks: BackgroundTasks,
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         백그라운드에서 메모리 정리 실행
         
@@ -178,11 +234,10 @@ def create_memory_router() -> APIRouter:
         try:
             async def cleanup_task():
                 try:
-                    memory_manager = get_memory_manager()
-                    result = await memory_manager.force_cleanup()
-                    logger.info(f"백그라운드 메모리 정리 완료: {result}")
+                    result = await _coalesced_cleanup(memory_manager)
+                    logger.info("백그라운드 메모리 정리 완료: %s", result)
                 except Exception as e:
-                    logger.error(f"백그라운드 메모리 정리 실패: {e}")
+                    logger.exception("백그라운드 메모리 정리 실패: %s", e)
             
             background_tasks.add_task(cleanup_task)
             
@@ -195,7 +250,7 @@ def create_memory_router() -> APIRouter:
             )
             
         except Exception as e:
-            logger.error(f"백그라운드 메모리 정리 스케줄링 실패: {e}")
+            logger.exception("백그라운드 메모리 정리 스케줄링 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"백그라운드 작업 스케줄링 중 오류가 발생했습니다: {str(e)}"
@@ -203,7 +258,8 @@ def create_memory_router() -> APIRouter:
     
     @router.get("/history")
     async def get_memory_history(
-        hours: int = Query(default=1, ge=1, le=24, description="조회할 시간 범위 (시간)")
+        hours: int = Query(default=1, ge=1, le=24, description="조회할 시간 범위 (시간)"),
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
     ):
         """
         메모리 사용 히스토리 조회
@@ -215,26 +271,22 @@ def create_memory_router() -> APIRouter:
             지정된 시간 범위의 메모리 사용 히스토리
         """
         try:
-            memory_manager = get_memory_manager()
             trend = memory_manager.monitor.get_memory_trend(minutes=hours * 60)
             
-            # 히스토리 데이터 추출
-            cutoff_time = datetime.now().timestamp() - (hours * 3600)
-            history_data = []
-            
-            for stats in memory_manager.monitor.stats_history:
-                if stats.timestamp.timestamp() > cutoff_time:
-                    history_data.append(stats.to_dict())
+            # 히스토리 데이터 추출 (개수는 이분 탐색으로, 복사/변환은 최근 100개만)
+            window_seconds = hours * 3600
+            monitor = memory_manager.monitor
+            recent_stats = monitor.get_recent_stats(window_seconds, limit=100)
             
             return {
                 "hours": hours,
                 "trend": trend,
-                "history_count": len(history_data),
-                "data": history_data[-100:]  # 최근 100개만 반환 (너무 많은 데이터 방지)
+                "history_count": monitor.count_recent_stats(window_seconds),
+                "data": [stats.to_dict() for stats in recent_stats]
             }
             
         except Exception as e:
-            logger.error(f"메모리 히스토리 조회 실패: {e}")
+            logger.exception("메모리 히스토리 조회 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 히스토리 조회 중 오류가 발생했습니다: {str(e)}"
@@ -252,44 +304,32 @@ def create_memory_router() -> APIRouter:
             설정 업데이트 결과
         """
         try:
-            # 새 설정 객체 생성
-            new_config = MemoryConfig(
-                monitoring_interval_seconds=config_request.monitoring_interval_seconds,
-                cleanup_interval_seconds=config_request.cleanup_interval_seconds,
-                warning_threshold=config_request.warning_threshold,
-                critical_threshold=config_request.critical_threshold,
-                cleanup_threshold=config_request.cleanup_threshold,
-                max_cache_size=config_request.max_cache_size,
-                enable_alerts=config_request.enable_alerts
-            )
+            # 새 설정 객체 생성 (요청에 없는 항목은 MemoryConfig 기본값 유지)
+            new_config = MemoryConfig(**config_request.model_dump(exclude_none=True))
             
             logger.info("🔧 메모리 관리 설정 업데이트 요청")
             
-            # 메모리 관리자 재초기화
+            # 메모리 관리자 재초기화 (설정 응답 캐시도 무효화)
             await initialize_memory_manager(new_config)
+            _CONFIG_CACHE["config"] = None
             
             return {
                 "message": "메모리 관리 설정이 성공적으로 업데이트되었습니다.",
-                "config": {
-                    "monitoring_interval_seconds": new_config.monitoring_interval_seconds,
-                    "cleanup_interval_seconds": new_config.cleanup_interval_seconds,
-                    "warning_threshold": new_config.warning_threshold,
-                    "critical_threshold": new_config.critical_threshold,
-                    "cleanup_threshold": new_config.cleanup_threshold,
-                    "max_cache_size": new_config.max_cache_size,
-                    "enable_alerts": new_config.enable_alerts
-                }
+                "config": asdict(new_config)
             }
             
         except Exception as e:
-            logger.error(f"메모리 설정 업데이트 실패: {e}")
+            logger.exception("메모리 설정 업데이트 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 설정 업데이트 중 오류가 발생했습니다: {str(e)}"
             )
     
-    @router.get("/config")
-    async def get_memory_config():
+    @router.get("/config", response_class=Response)
+    async def get_memory_config(
+        request: Request,
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         현재 메모리 관리 설정 조회
         
@@ -297,31 +337,31 @@ def create_memory_router() -> APIRouter:
             현재 메모리 관리 설정
         """
         try:
-            memory_manager = get_memory_manager()
             config = memory_manager.config
             
-            return {
-                "monitoring_interval_seconds": config.monitoring_interval_seconds,
-                "cleanup_interval_seconds": config.cleanup_interval_seconds,
-                "warning_threshold": config.warning_threshold,
-                "critical_threshold": config.critical_threshold,
-                "cleanup_threshold": config.cleanup_threshold,
-                "max_cache_size": config.max_cache_size,
-                "cache_cleanup_ratio": config.cache_cleanup_ratio,
-                "max_history_size": config.max_history_size,
-                "enable_alerts": config.enable_alerts,
-                "alert_cooldown_minutes": config.alert_cooldown_minutes
-            }
+            if _CONFIG_CACHE["config"] is not config:
+                body, etag = freeze_json(asdict(config))
+                _CONFIG_CACHE.update(config=config, body=body, etag=etag)
+            
+            # 설정은 POST로 바뀔 수 있으므로 저장은 허용하되 매 요청 ETag로 재검증
+            return cached_json_response(
+                request,
+                _CONFIG_CACHE["body"],
+                _CONFIG_CACHE["etag"],
+                cache_control="private, no-cache",
+            )
             
         except Exception as e:
-            logger.error(f"메모리 설정 조회 실패: {e}")
+            logger.exception("메모리 설정 조회 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 설정 조회 중 오류가 발생했습니다: {str(e)}"
             )
     
     @router.post("/start")
-    async def start_memory_management():
+    async def start_memory_management(
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
         """
         메모리 관리 시작
         
@@ -329,7 +369,6 @@ def create_memory_router() -> APIRouter:
             메모리 관리 시작 결과
         """
         try:
-            memory_manager = get_memory_manager()
             await memory_manager.start()
             
             return {
@@ -338,7 +377,7 @@ def create_memory_router() -> APIRouter:
             }
             
         except Exception as e:
-            logger.error(f"메모리 관리 시작 실패: {e}")
+            logger.exception("메모리 관리 시작 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 관리 시작 중 오류가 발생했습니다: {str(e)}"
@@ -361,7 +400,7 @@ def create_memory_router() -> APIRouter:
             }
             
         except Exception as e:
-            logger.error(f"메모리 관리 중지 실패: {e}")
+            logger.exception("메모리 관리 중지 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"메모리 관리 중지 중 오류가 발생했습니다: {str(e)}"
@@ -370,7 +409,10 @@ def create_memory_router() -> APIRouter:
     @router.get("/cache/register")
     async def register_cache_endpoint(
         name: str = Query(..., description="캐시 이름"),
-        size: int = Query(default=0, description="캐시 크기")
+        size: int = Query(
+            default=0, ge=0, le=MAX_TEST_CACHE_SIZE, description="캐시 크기"
+        ),
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
     ):
         """
         캐시 등록 (테스트용)
@@ -383,10 +425,14 @@ def create_memory_router() -> APIRouter:
             캐시 등록 결과
         """
         try:
-            memory_manager = get_memory_manager()
-            
-            # 테스트용 캐시 객체 생성
-            test_cache = {f"item_{i}": f"data_{i}" for i in range(size)}
+            # 테스트용 캐시 객체 생성 (크기 집계용이므로 정수 키만, 값 문자열은 만들지 않음)
+            test_cache = _TestCache.fromkeys(range(size))
+            _TEST_CACHES.pop(name, None)
+            while len(_TEST_CACHES) >= MAX_TEST_CACHES:
+                oldest = next(iter(_TEST_CACHES))
+                del _TEST_CACHES[oldest]
+                memory_manager.unregister_cache(oldest)
+            _TEST_CACHES[name] = test_cache
             memory_manager.register_cache(name, test_cache)
             
             return {
@@ -397,10 +443,36 @@ def create_memory_router() -> APIRouter:
             }
             
         except Exception as e:
-            logger.error(f"캐시 등록 실패: {e}")
+            logger.exception("캐시 등록 실패: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"캐시 등록 중 오류가 발생했습니다: {str(e)}"
             )
     
+    @router.delete("/cache/register")
+    async def unregister_cache(
+        name: str = Query(..., description="캐시 이름"),
+        memory_manager: MemoryManager = Depends(get_memory_manager_dependency)
+    ):
+        """
+        테스트용 캐시 등록 해제
+        
+        Args:
+            name: 캐시 이름
+            
+        Returns:
+            캐시 해제 결과
+        """
+        if _TEST_CACHES.pop(name, None) is None:
+            raise HTTPException(
+                status_code=404, detail=f"등록된 테스트 캐시 '{name}'이 없습니다."
+            )
+        memory_manager.unregister_cache(name)
+        
+        return {
+            "message": f"캐시 '{name}'이 해제되었습니다.",
+            "cache_name": name,
+            "total_cache_size": memory_manager.monitor.cache_manager.get_cache_size()
+        }
+    
     return router
\ No newline at end of file
@@ -5,44 +5,127 @@ News Router
 뉴스 검색 및 자연어 처리 관련 엔드포인트
 """
 
-import uuid
-from datetime import datetime
-from typing import List, Optional
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+import importlib
+import itertools
+import logging
+import os
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 
-# 의존성 임포트
-try:
-    from database import get_db
-    from models import NewsSearchRequest, NewsSearchResponse
-    from services.gpt_service import GPTService
-    from services.news_service import NewsService
-    from utils.validator import validate_user_input
-except ImportError:
+logger = logging.getLogger(__name__)
+
+
+# 의존성 임포트 (모듈 로드 시 1회만 해석)
+class _Deps(NamedTuple):
+    NewsService: Optional[type]
+    validate_user_input: Callable[[str, int], str]
+
+
+def _import_attr(attr: str, *module_names: str):
+    """여러 경로 중 처음 import에 성공한 모듈의 속성 반환"""
+    error = None
+    for module_name in module_names:
+        try:
+            return getattr(importlib.import_module(module_name), attr)
+        except ImportError as e:
+            error = e
+    raise ImportError(f"{attr}을(를) 불러올 수 없습니다: {error}") from error
+
+
+def _passthrough_input(text: str, max_length: int = 5000) -> str:
+    return text
+
+
+def _resolve() -> _Deps:
+    """라우터 의존성 해석 (입력 검증기는 필수, 뉴스 서비스는 선택)"""
     try:
-        from backend.database import get_db
-        from backend.models import NewsSearchRequest, NewsSearchResponse
-        from backend.services.gpt_service import GPTService
-        from backend.services.news_service import NewsService
-        from backend.utils.validator import validate_user_input
+        validate = _import_attr(
+            "validate_user_input", "utils.validator", "backend.utils.validator"
+        )
     except ImportError:
-        # 기본값으로 None 또는 Mock 객체 사용
-        get_db = None
-        NewsSearchRequest = None
-        NewsSearchResponse = None
-        GPTService = None
-        NewsService = None
-        def validate_user_input(text: str, max_length: int = 5000) -> str:
-            return text
+        # 검증 없는 입력 허용은 환경변수로 명시한 경우에만
+        if os.getenv("NEWS_ALLOW_UNVALIDATED_INPUT") != "1":
+            raise
+        logger.warning("⚠️ 입력 검증기 없이 뉴스 라우터를 사용합니다.")
+        validate = _passthrough_input
 
-import logging
+    try:
+        news_service_cls = _import_attr(
+            "NewsService", "services.news_service", "backend.services.news_service"
+        )
+    except ImportError as e:
+        logger.warning("⚠️ 뉴스 서비스를 불러올 수 없습니다: %s", e)
+        news_service_cls = None
 
-logger = logging.getLogger(__name__)
+    return _Deps(news_service_cls, validate)
+
+
+NewsService, validate_user_input = _resolve()
+
+try:
+    from utils.common import now_iso_cached
+    from utils.http_cache import cached_json_response, freeze_json
+except ImportError:
+    from backend.utils.common import now_iso_cached
+    from backend.utils.http_cache import cached_json_response, freeze_json
 
 # 라우터 생성
-router = APIRouter(prefix="/news", tags=["news"])
+router = APIRouter(
+    prefix="/news", tags=["news"], default_response_class=ORJSONResponse
+)
+
+# 로그 연계용 요청 ID (프로세스별 임의 접두사 + 증가 카운터, 보안 용도 아님)
+# 워커/재시작마다 같은 ID 순서가 반복되지 않도록 접두사에 임의값과 PID를 함께 섞음
+_RID_PREFIX = f"{(int.from_bytes(os.urandom(2), 'big') ^ os.getpid()) & 0xFFFF:04x}"
+_RID_COUNTER = itertools.count()
+
+
+def _rid() -> str:
+    """8자리 요청 ID 생성 (4자리 접두사 + 4자리 16진수 범위에서 순환하는 카운터)"""
+    return f"{_RID_PREFIX}{next(_RID_COUNTER) & 0xFFFF:04x}"
+
+
+def _mark_stage(stages: list, name: str, started: float) -> None:
+    """처리 단계와 요청 시작 후 경과 시간(ms)을 기록 (완료 시 한 번에 로깅)"""
+    stages.append((name, round((time.monotonic() - started) * 1000, 2)))
+
+
+# 검색 결과 기사 본문 미리보기 길이
+_CONTENT_PREVIEW_LEN = 500
+
+
+def _short(text: str, limit: int = _CONTENT_PREVIEW_LEN) -> str:
+    """limit보다 긴 경우에만 잘라서 말줄임표 추가 (짧으면 복사 없이 그대로 반환)"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _article_to_dict(article) -> dict:
+    """검색 결과 기사를 응답용 dict로 변환 (본문은 미리보기 길이로 자름)"""
+    published_at = article.published_at
+    return {
+        "title": article.title,
+        "url": str(article.url),
+        "content": _short(article.content),
+        "source": article.source,
+        "published_date": published_at.isoformat() if published_at else None,
+    }
+
+
+# 간단 키워드 추출용 토큰 패턴 (한글 음절 포함 2글자 이상)
+_TOKEN_RE = re.compile(r"[\w가-힣]{2,}", re.UNICODE)
+
+
+def _extract_keywords(text: str, limit: int) -> List[str]:
+    """등장 빈도가 높은 순으로 키워드 추출 (빈도가 같으면 먼저 나온 순)"""
+    return [word for word, _ in Counter(_TOKEN_RE.findall(text)).most_common(limit)]
 
 
 # 요청/응답 모델
@@ -62,11 +145,34 @@ class KeywordExtractionRequest(BaseModel):
     max_keywords: int = 10
 
 
-# 서비스 인스턴스 (안전한 초기화)
-try:
-    news_service = NewsService() if NewsService else None
-except Exception:
-    news_service = None
+# 서비스 인스턴스 (import 시점이 아닌 첫 사용 시 1회만 생성, 실패는 캐시하지 않음)
+@lru_cache(maxsize=1)
+def _get_news_service():
+    if NewsService is None:
+        raise RuntimeError("뉴스 서비스를 사용할 수 없습니다.")
+    return NewsService()
+
+
+# 헬스 체크에서 확인한 뉴스 서비스 생성 실패 (한 번만 기록하고 프로브마다 재생성하지 않음)
+_SERVICE_INIT_ERROR: dict = {"error": None}
+
+
+def _news_service_available() -> bool:
+    """뉴스 서비스 사용 가능 여부 (헬스 체크용, 생성 실패는 기억해 두고 다시 만들지 않음)"""
+    if NewsService is None:
+        return False
+    if _get_news_service.cache_info().currsize:
+        # 검색 요청 등에서 이미 생성에 성공한 경우
+        return True
+    if _SERVICE_INIT_ERROR["error"] is not None:
+        return False
+    try:
+        _get_news_service()
+    except Exception as e:
+        _SERVICE_INIT_ERROR["error"] = str(e)
+        logger.exception("⚠️ 뉴스 서비스 생성 실패: %s", e)
+        return False
+    return True
 
 
 @router.post("/search")
@@ -82,15 +188,13 @@ async def search_news(
     - **language**: 요약 언어 (ko/en)
     - **user_id**: 사용자 ID (선택사항)
     """
-    request_id = str(uuid.uuid4())[:8]
+    request_id = _rid()
+    started = time.monotonic()
+    stages = []
 
     try:
-        # 1. 요청 수신
-        logger.info(f"📥 [뉴스검색] 사용자 입력 수신 완료 - ID: {request_id}")
-        logger.info(f"🔍 [{request_id}] 뉴스 검색 요청: '{request.query}'")
-
-        # 2. 입력 검증 시작
-        logger.info(f"🔎 [검증] 검색 쿼리 검증 시작 - ID: {request_id}")
+        # 1. 요청 수신 → 2. 입력 검증
+        _mark_stage(stages, "received", started)
 
         # 입력 검증 (매개변수 순서 수정)
         validated_query = validate_user_input(request.query, 1000)
@@ -98,51 +202,49 @@ async def search_news(
         if len(validated_query.strip()) < 2:
             raise HTTPException(status_code=400, detail="검색 쿼리가 너무 짧습니다.")
 
-        # 2. 입력 검증 완료
-        logger.info(f"🔎 [검증] 검색 쿼리 검증 완료 - ID: {request_id}")
+        _mark_stage(stages, "validated", started)
 
-        # 3. 처리 시작
-        logger.info(f"⚙️ [처리] 뉴스 검색 실행 시작 - ID: {request_id}")
-
-        # 뉴스 검색 실행 (실제 메서드 사용)
-        if news_service:
-            search_result = await news_service.search_news(
-                query=validated_query,
-                max_results=request.max_articles,
-                sources=None
-            )
-        else:
-            search_result = []
-
-        # 4. 처리 완료
-        logger.info(f"✅ [완료] 뉴스 검색 완료 - ID: {request_id}: {len(search_result)}개 기사")
+        # 3. 뉴스 검색 실행 (실제 메서드 사용)
+        search_result = await _get_news_service().search_news(
+            query=validated_query,
+            max_results=request.max_articles,
+            sources=None
+        )
 
-        # 5. 응답 전송
-        logger.info(f"📤 [응답] 클라이언트에 응답 전송 - ID: {request_id}")
+        # 4. 처리 완료 - 단계별 경과 시간을 모아 한 번만 기록
+        _mark_stage(stages, "searched", started)
+        logger.info(
+            "✅ 뉴스 검색 완료 - ID: %s: %d개 기사",
+            request_id,
+            len(search_result),
+            extra={
+                "rid": request_id,
+                "query": request.query,
+                "stages": stages,
+                "articles": len(search_result),
+            },
+        )
 
-        return {
+        # 이미 JSON 기본 타입만 담고 있으므로 jsonable_encoder를 거치지 않고 orjson으로 직렬화
+        return ORJSONResponse({
             "success": True,
             "message": f"{len(search_result)}개의 관련 뉴스를 찾았습니다.",
-            "articles": [
-                {
-                    "title": article.title,
-                    "url": str(article.url),
-                    "content": article.content[:500] + "..." if len(article.content) > 500 else article.content,
-                    "source": article.source,
-                    "published_date": article.published_at.isoformat() if article.published_at else None,
-                }
-                for article in search_result
-            ],
+            "articles": [_article_to_dict(article) for article in search_result],
             "extracted_keywords": [],  # 키워드 추출은 별도 구현 필요
             "total_articles": len(search_result),
             "request_id": request_id,
-            "processed_at": datetime.now().isoformat(),
-        }
+            "processed_at": now_iso_cached(),
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ [오류] 뉴스 검색 중 오류 발생 - ID: {request_id}: {str(e)}")
+        logger.exception(
+            "❌ [오류] 뉴스 검색 중 오류 발생 - ID: %s: %s",
+            request_id,
+            e,
+            extra={"rid": request_id, "stages": stages},
+        )
         raise HTTPException(
             status_code=500, detail=f"뉴스 검색 중 오류가 발생했습니다: {str(e)}"
         )
@@ -155,54 +257,85 @@ async def extract_keywords(request: KeywordExtractionRequest):
     - **text**: 키워드를 추출할 텍스트
     - **max_keywords**: 최대 키워드 수
     """
-    request_id = str(uuid.uuid4())[:8]
+    request_id = _rid()
+    started = time.monotonic()
+    stages = []
 
     try:
-        # 1. 요청 수신
-        logger.info(f"📥 [키워드추출] 사용자 입력 수신 완료 - ID: {request_id}")
-        logger.info(f"🏷️ [{request_id}] 키워드 추출 요청")
-
-        # 2. 입력 검증 시작
-        logger.info(f"🔎 [검증] 텍스트 검증 시작 - ID: {request_id}")
+        # 1. 요청 수신 → 2. 입력 검증
+        _mark_stage(stages, "received", started)
 
         # 입력 검증 (매개변수 순서 수정)
         validated_text = validate_user_input(request.text, 10000)
 
-        # 2. 입력 검증 완료
-        logger.info(f"🔎 [검증] 텍스트 검증 완료 - ID: {request_id}")
+        _mark_stage(stages, "validated", started)
 
-        # 3. 처리 시작
-        logger.info(f"⚙️ [처리] 키워드 추출 실행 시작 - ID: {request_id}")
+        # 3. 간단한 빈도 기반 키워드 추출 (실제로는 NLP 라이브러리 사용)
+        keywords = _extract_keywords(validated_text, request.max_keywords)
 
-        # 간단한 키워드 추출 구현 (실제로는 NLP 라이브러리 사용)
-        import re
-        words = re.findall(r'\b\w+\b', validated_text)
-        keywords = list(set(word for word in words if len(word) > 2))[:request.max_keywords]
-
-        # 4. 처리 완료
-        logger.info(f"✅ [완료] 키워드 추출 완료 - ID: {request_id}: {len(keywords)}개")
-
-        # 5. 응답 전송
-        logger.info(f"📤 [응답] 클라이언트에 응답 전송 - ID: {request_id}")
+        # 4. 처리 완료 - 단계별 경과 시간을 모아 한 번만 기록
+        _mark_stage(stages, "extracted", started)
+        logger.info(
+            "✅ 키워드 추출 완료 - ID: %s: %d개",
+            request_id,
+            len(keywords),
+            extra={"rid": request_id, "stages": stages, "keywords": len(keywords)},
+        )
 
         return {
             "success": True,
             "keywords": keywords,
             "count": len(keywords),
             "request_id": request_id,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now_iso_cached(),
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ [오류] 키워드 추출 중 오류 발생 - ID: {request_id}: {str(e)}")
+        logger.exception(
+            "❌ [오류] 키워드 추출 중 오류 발생 - ID: %s: %s",
+            request_id,
+            e,
+            extra={"rid": request_id, "stages": stages},
+        )
         raise HTTPException(
             status_code=500, detail=f"키워드 추출 중 오류가 발생했습니다: {str(e)}"
         )
 
 
-@router.get("/trending")
+# 트렌딩 응답 캐시 (카테고리/개수별 직렬화 결과를 TTL 동안 재사용)
+TRENDING_TTL = 60.0
+_TRENDING_CACHE = {"t": 0.0}
+
+
+@lru_cache(maxsize=32)
+def _trending_payload(category: Optional[str], limit: int) -> bytes:
+    """트렌딩 뉴스 응답 본문 생성 및 직렬화"""
+    # 임시 구현 - 실제로는 트렌딩 뉴스 API 사용
+    trending_news = []
+
+    return orjson.dumps(
+        {
+            "success": True,
+            "trending_news": trending_news,
+            "count": len(trending_news),
+            "category": category or "all",
+            "timestamp": now_iso_cached(),
+        }
+    )
+
+
+def _get_trending_payload(category: Optional[str], limit: int) -> bytes:
+    """TTL이 지나면 캐시를 비우고 트렌딩 응답 본문 반환"""
+    now = time.monotonic()
+    if now - _TRENDING_CACHE["t"] >= TRENDING_TTL:
+        _trending_payload.cache_clear()
+        _TRENDING_CACHE["t"] = now
+    return _trending_payload(category, limit)
+
+
+@router.get("/trending", response_class=Response)
 async def get_trending_news(category: Optional[str] = None, limit: int = 20):
     """
     트렌딩 뉴스를 가져옵니다.
@@ -211,49 +344,35 @@ async def get_trending_news(category: Optional[str] = None, limit: int = 20):
     - **limit**: 최대 기사 수
     """
     try:
-        # 임시 구현 - 실제로는 트렌딩 뉴스 API 사용
-        trending_news = []
-
-        return {
-            "success": True,
-            "trending_news": trending_news,
-            "count": len(trending_news),
-            "category": category or "all",
-            "timestamp": datetime.now().isoformat(),
-        }
+        return Response(
+            content=_get_trending_payload(category, limit),
+            media_type="application/json",
+        )
 
     except Exception as e:
-        logger.error(f"트렌딩 뉴스 조회 실패: {e}")
+        logger.exception("트렌딩 뉴스 조회 실패: %s", e)
         raise HTTPException(
             status_code=500, detail=f"트렌딩 뉴스 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
 
-@router.get("/sources")
-async def get_news_sources():
-    """사용 가능한 뉴스 소스 목록을 반환합니다."""
-    try:
-        # 기본 뉴스 소스 목록
-        sources = [
-            {"name": "네이버 뉴스", "type": "portal", "language": "ko"},
-            {"name": "다음 뉴스", "type": "portal", "language": "ko"},
-            {"name": "연합뉴스", "type": "agency", "language": "ko"},
-            {"name": "KBS", "type": "broadcast", "language": "ko"},
-            {"name": "MBC", "type": "broadcast", "language": "ko"},
-        ]
+# 기본 뉴스 소스 목록 (고정값이므로 모듈 로드 시 1회만 직렬화)
+_NEWS_SOURCES = [
+    {"name": "네이버 뉴스", "type": "portal", "language": "ko"},
+    {"name": "다음 뉴스", "type": "portal", "language": "ko"},
+    {"name": "연합뉴스", "type": "agency", "language": "ko"},
+    {"name": "KBS", "type": "broadcast", "language": "ko"},
+    {"name": "MBC", "type": "broadcast", "language": "ko"},
+]
+_NEWS_SOURCES_BODY, _NEWS_SOURCES_ETAG = freeze_json(
+    {"success": True, "sources": _NEWS_SOURCES, "count": len(_NEWS_SOURCES)}
+)
 
-        return {
-            "success": True,
-            "sources": sources,
-            "count": len(sources),
-            "timestamp": datetime.now().isoformat(),
-        }
 
-    except Exception as e:
-        logger.error(f"뉴스 소스 조회 실패: {e}")
-        raise HTTPException(
-            status_code=500, detail="뉴스 소스 목록을 가져올 수 없습니다."
-        )
+@router.get("/sources", response_class=Response)
+async def get_news_sources(request: Request):
+    """사용 가능한 뉴스 소스 목록을 반환합니다."""
+    return cached_json_response(request, _NEWS_SOURCES_BODY, _NEWS_SOURCES_ETAG)
 
 
 @router.get("/health")
@@ -262,6 +381,6 @@ async def news_health_check():
     return {
         "status": "healthy",
         "router": "news",
-        "timestamp": datetime.now().isoformat(),
-        "news_service_available": news_service is not None,
+        "timestamp": now_iso_cached(),
+        "news_service_available": _news_service_available(),
     }
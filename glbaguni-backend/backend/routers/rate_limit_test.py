@@ -5,17 +5,19 @@ Rate Limiting 테스트 라우터
 Rate limiting 기능을 테스트하고 모니터링할 수 있는 엔드포인트를 제공합니다.
 """
 
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Response
 from fastapi.responses import JSONResponse
 import time
 from typing import Dict, Any
 
 try:
+    from utils.http_cache import cached_json_response, freeze_json
     from utils.logging_config import get_logger
-    from utils.rate_limiter import rate_limit_middleware
+    from utils.rate_limiter import DEFAULT_EXEMPT_PATHS, rate_limit_middleware
 except ImportError:
+    from backend.utils.http_cache import cached_json_response, freeze_json
     from backend.utils.logging_config import get_logger
-    from backend.utils.rate_limiter import rate_limit_middleware
+    from backend.utils.rate_limiter import DEFAULT_EXEMPT_PATHS, rate_limit_middleware
     import logging
     def get_logger(name):
         return logging.getLogger(name)
@@ -24,6 +26,28 @@ logger = get_logger("rate_limit_test")
 
 router = APIRouter(prefix="/rate-limit", tags=["Rate Limiting"])
 
+# rate limit 헤더가 하나도 없을 때 공유하는 응답 값 (수정 금지)
+_NO_RATE_LIMIT_HEADERS = {
+    "x-ratelimit-limit": None,
+    "x-ratelimit-remaining": None,
+    "x-ratelimit-reset": None,
+}
+
+
+def _rate_limit_headers(request: Request) -> Dict[str, Any]:
+    """요청의 rate limit 헤더 추출 (모두 없으면 미리 만든 dict 재사용)"""
+    headers = request.headers
+    limit = headers.get("x-ratelimit-limit")
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if limit is None and remaining is None and reset is None:
+        return _NO_RATE_LIMIT_HEADERS
+    return {
+        "x-ratelimit-limit": limit,
+        "x-ratelimit-remaining": remaining,
+        "x-ratelimit-reset": reset,
+    }
+
 
 @router.get("/test")
 async def test_rate_limit(request: Request) -> Dict[str, Any]:
@@ -39,11 +63,7 @@ async def test_rate_limit(request: Request) -> Dict[str, Any]:
         "client_ip": client_ip,
         "path": str(request.url.path),
         "method": request.method,
-        "headers": {
-            "x-ratelimit-limit": request.headers.get("x-ratelimit-limit"),
-            "x-ratelimit-remaining": request.headers.get("x-ratelimit-remaining"),
-            "x-ratelimit-reset": request.headers.get("x-ratelimit-reset")
-        }
+        "headers": _rate_limit_headers(request)
     }
 
 
@@ -86,39 +106,37 @@ async def bulk_test_rate_limit(request: Request, count: int = 10) -> Dict[str, A
     }
 
 
-@router.get("/info")
-async def rate_limit_info() -> Dict[str, Any]:
+# 설정 정보는 고정값이므로 모듈 로드 시 1회만 직렬화
+_INFO_BODY, _INFO_ETAG = freeze_json({
+    "rate_limiting": {
+        "enabled": True,
+        "type": "IP-based",
+        "limits": {
+            "requests_per_minute": 60,
+            "window_size": "60 seconds",
+            "response_code": 429
+        },
+        "features": [
+            "IP 기반 제한",
+            "슬라이딩 윈도우",
+            "Redis/메모리 지원",
+            "자동 헤더 추가",
+            "예외 경로 지원"
+        ]
+    },
+    "headers": {
+        "X-RateLimit-Limit": "분당 허용 요청 수",
+        "X-RateLimit-Remaining": "남은 요청 수",
+        "X-RateLimit-Reset": "리셋 시간 (Unix timestamp)",
+        "Retry-After": "재시도 가능 시간 (초)"
+    },
+    "exempt_paths": sorted(DEFAULT_EXEMPT_PATHS)
+})
+
+
+@router.get("/info", response_class=Response)
+async def rate_limit_info(request: Request) -> Response:
     """
     Rate limiting 설정 정보
     """
-    return {
-        "rate_limiting": {
-            "enabled": True,
-            "type": "IP-based",
-            "limits": {
-                "requests_per_minute": 60,
-                "window_size": "60 seconds",
-                "response_code": 429
-            },
-            "features": [
-                "IP 기반 제한",
-                "슬라이딩 윈도우",
-                "Redis/메모리 지원",
-                "자동 헤더 추가",
-                "예외 경로 지원"
-            ]
-        },
-        "headers": {
-            "X-RateLimit-Limit": "분당 허용 요청 수",
-            "X-RateLimit-Remaining": "남은 요청 수",
-            "X-RateLimit-Reset": "리셋 시간 (Unix timestamp)",
-            "Retry-After": "재시도 가능 시간 (초)"
-        },
-        "exempt_paths": [
-            "/docs",
-            "/redoc", 
-            "/openapi.json",
-            "/health",
-            "/health/basic"
-        ]
-    } 
\ No newline at end of file
+    return cached_json_response(request, _INFO_BODY, _INFO_ETAG)
@@ -5,16 +5,20 @@
 요청 로그 조회, 분석, 통계 등을 관리하는 엔드포인트를 제공합니다.
 """
 
+import asyncio
 import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Any, Iterator, Optional, List
 from fastapi import APIRouter, Query, HTTPException, Depends
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import csv
+import gzip
 import io
 import json
-from pathlib import Path
 
 try:
     from utils.logging_config import get_logger
@@ -38,7 +42,40 @@ except ImportError:
 
 logger = get_logger("request_logs")
 
-router = APIRouter(prefix="/request-logs", tags=["Request Logs"])
+# IP 활동 분석/타임라인에서 실제로 쓰는 컬럼만 조회 (나머지 컬럼은 DB에서 꺼내지 않음)
+_IP_ACTIVITY_COLUMNS = (
+    'timestamp', 'method', 'endpoint', 'user_agent', 'status_code', 'response_time'
+)
+_TIMELINE_COLUMNS = ('timestamp', 'method', 'endpoint', 'user_agent', 'status_code')
+
+router = APIRouter(
+    prefix="/request-logs",
+    tags=["Request Logs"],
+    default_response_class=ORJSONResponse,
+)
+
+# 대시보드 폴링용 응답 캐시 (같은 조건의 반복 조회는 TTL 동안 재사용)
+LOG_STATS_TTL = 5.0
+SUSPICIOUS_PATTERNS_TTL = 30.0
+MAX_PATTERN_CACHE_SIZE = 64
+_STATS_CACHE: Dict[str, Any] = {"t": 0.0, "payload": None}
+_PATTERN_CACHE: Dict[tuple, tuple] = {}  # (hours, threshold) -> (저장 시각, 응답)
+
+
+def _get_cached_patterns(key: tuple) -> Optional[Dict[str, Any]]:
+    """TTL 내에 저장된 패턴 분석 결과 반환 (없거나 만료되면 None)"""
+    cached = _PATTERN_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < SUSPICIOUS_PATTERNS_TTL:
+        return cached[1]
+    return None
+
+
+def _store_cached_patterns(key: tuple, payload: Dict[str, Any]) -> None:
+    """패턴 분석 결과 저장 (최대 크기를 넘으면 가장 오래된 항목부터 제거)"""
+    _PATTERN_CACHE.pop(key, None)
+    while len(_PATTERN_CACHE) >= MAX_PATTERN_CACHE_SIZE:
+        del _PATTERN_CACHE[next(iter(_PATTERN_CACHE))]
+    _PATTERN_CACHE[key] = (time.monotonic(), payload)
 
 
 class LogQueryRequest(BaseModel):
@@ -67,6 +104,9 @@ async def get_request_log_stats() -> Dict[str, Any]:
     요청 로그 시스템 통계 정보
     """
     try:
+        if time.monotonic() - _STATS_CACHE["t"] < LOG_STATS_TTL:
+            return _STATS_CACHE["payload"]
+        
         logger_middleware = get_request_logger_middleware()
         
         # 기본 통계
@@ -75,11 +115,13 @@ async def get_request_log_stats() -> Dict[str, Any]:
         # 데이터베이스 통계 (가능한 경우)
         db_stats = logger_middleware.get_database_stats(24)
         
-        return {
+        payload = {
             "basic_stats": basic_stats,
             "database_stats": db_stats,
             "timestamp": time.time()
         }
+        _STATS_CACHE.update(t=time.monotonic(), payload=payload)
+        return payload
         
     except Exception as e:
         logger.error(f"요청 로그 통계 조회 중 오류: {e}")
@@ -150,26 +192,21 @@ async def get_recent_logs(
             'limit': limit
         }
         
-        # 상태 필터 적용
+        # 상태 필터 적용 (SQL 조건으로 걸러 limit이 필터된 결과 수를 제한하도록)
         if status_filter == "error":
             # 4xx, 5xx 상태 코드만
-            pass  # 여러 상태 코드는 별도 쿼리 필요
+            query_params['status_code_min'] = 400
         elif status_filter == "blocked":
             query_params['is_blocked'] = True
         elif status_filter == "success":
             # 2xx, 3xx 상태 코드만
-            pass
+            query_params['status_code_min'] = 200
+            query_params['status_code_max'] = 400
         
         logs = logger_middleware.query_logs(**query_params)
         
-        # 상태 필터 후처리
-        if status_filter == "error":
-            logs = [log for log in logs if log.get('status_code', 0) >= 400]
-        elif status_filter == "success":
-            logs = [log for log in logs if 200 <= log.get('status_code', 0) < 400]
-        
         return {
-            "logs": logs[:limit],
+            "logs": logs,
             "time_range_hours": hours,
             "filter": status_filter,
             "total_results": len(logs),
@@ -195,78 +232,47 @@ async def analyze_suspicious_patterns(
         if not logger_middleware.db_logger:
             raise HTTPException(status_code=400, detail="데이터베이스 로깅이 활성화되지 않았습니다")
         
-        analyzer = LogAnalyzer(logger_middleware.db_logger)
-        patterns = analyzer.detect_suspicious_patterns(hours)
-        
-        # 추가 분석
-        start_time = time.time() - (hours * 3600)
+        cache_key = (hours, threshold_requests)
+        cached = _get_cached_patterns(cache_key)
+        if cached is not None:
+            return cached
         
-        # 고빈도 IP 분석
-        recent_logs = logger_middleware.query_logs(start_time=start_time, limit=10000)
-        
-        ip_analysis = {}
-        endpoint_analysis = {}
-        user_agent_analysis = {}
+        analyzer = LogAnalyzer(logger_middleware.db_logger, logger_middleware.ip_summary)
+        patterns = analyzer.detect_suspicious_patterns(hours)
         
-        for log in recent_logs:
-            ip = log.get('client_ip', '')
-            endpoint = log.get('endpoint', '')
-            user_agent = log.get('user_agent', '')
-            
-            # IP별 분석
-            if ip not in ip_analysis:
-                ip_analysis[ip] = {
-                    'request_count': 0,
-                    'unique_endpoints': set(),
-                    'status_codes': {},
-                    'user_agents': set(),
-                    'first_seen': log.get('timestamp', 0),
-                    'last_seen': log.get('timestamp', 0)
-                }
-            
-            ip_stats = ip_analysis[ip]
-            ip_stats['request_count'] += 1
-            ip_stats['unique_endpoints'].add(endpoint)
-            ip_stats['user_agents'].add(user_agent)
-            ip_stats['last_seen'] = max(ip_stats['last_seen'], log.get('timestamp', 0))
-            
-            status_code = log.get('status_code', 0)
-            ip_stats['status_codes'][status_code] = ip_stats['status_codes'].get(status_code, 0) + 1
-            
-            # 엔드포인트별 분석
-            endpoint_analysis[endpoint] = endpoint_analysis.get(endpoint, 0) + 1
-            
-            # User-Agent별 분석
-            user_agent_analysis[user_agent] = user_agent_analysis.get(user_agent, 0) + 1
+        # 추가 분석 (집계는 DB에서 GROUP BY로 처리하고 IP별 결과만 가져옴,
+        # IP별 집계/요약/상위 항목 모두 같은 시작 시각 사용)
+        start_time = analyzer.window_start(hours)
+        ip_rows = analyzer.aggregate_by_ip(start_time)
+        summary = analyzer.window_summary(start_time)
         
         # 의심스러운 IP 식별
         suspicious_ips = []
-        for ip, stats in ip_analysis.items():
+        for row in ip_rows:
             risk_score = 0
             risk_factors = []
             
             # 요청 빈도
-            requests_per_hour = stats['request_count'] / hours
+            total_requests = row['request_count']
+            requests_per_hour = total_requests / hours
             if requests_per_hour > threshold_requests:
                 risk_score += 30
                 risk_factors.append(f"고빈도 요청: {requests_per_hour:.1f}/시간")
             
             # 엔드포인트 다양성
-            unique_endpoints = len(stats['unique_endpoints'])
+            unique_endpoints = row['unique_endpoints']
             if unique_endpoints > 20:
                 risk_score += 20
                 risk_factors.append(f"다양한 엔드포인트: {unique_endpoints}개")
             
             # User-Agent 다양성
-            unique_uas = len(stats['user_agents'])
+            unique_uas = row['unique_user_agents']
             if unique_uas > 5:
                 risk_score += 15
                 risk_factors.append(f"다양한 User-Agent: {unique_uas}개")
             
             # 4xx 에러율
-            total_requests = stats['request_count']
-            error_4xx = sum(count for code, count in stats['status_codes'].items() if 400 <= code < 500)
-            error_rate = (error_4xx / total_requests) * 100 if total_requests > 0 else 0
+            error_rate = (row['error_4xx'] / total_requests) * 100
             
             if error_rate > 50:
                 risk_score += 25
@@ -274,29 +280,27 @@ async def analyze_suspicious_patterns(
             
             if risk_score > 30:
                 suspicious_ips.append({
-                    'ip': ip,
+                    'ip': row['client_ip'],
                     'risk_score': risk_score,
                     'risk_factors': risk_factors,
                     'stats': {
-                        'request_count': stats['request_count'],
+                        'request_count': total_requests,
                         'requests_per_hour': requests_per_hour,
                         'unique_endpoints': unique_endpoints,
                         'unique_user_agents': unique_uas,
                         'error_rate': error_rate,
-                        'duration_hours': (stats['last_seen'] - stats['first_seen']) / 3600
+                        'duration_hours': (row['last_seen'] - row['first_seen']) / 3600
                     }
                 })
         
         # 위험도순 정렬
         suspicious_ips.sort(key=lambda x: x['risk_score'], reverse=True)
         
-        # 상위 엔드포인트
-        top_endpoints = sorted(endpoint_analysis.items(), key=lambda x: x[1], reverse=True)[:20]
+        # 상위 엔드포인트 / User-Agent
+        top_endpoints = analyzer.top_values("endpoint", start_time, 20)
+        top_user_agents = analyzer.top_values("user_agent", start_time, 20)
         
-        # 상위 User-Agent
-        top_user_agents = sorted(user_agent_analysis.items(), key=lambda x: x[1], reverse=True)[:20]
-        
-        return {
+        payload = {
             "analysis_period_hours": hours,
             "threshold_requests_per_hour": threshold_requests,
             "suspicious_ips": suspicious_ips[:50],  # 상위 50개
@@ -304,14 +308,16 @@ async def analyze_suspicious_patterns(
             "top_endpoints": [{"endpoint": ep, "count": count} for ep, count in top_endpoints],
             "top_user_agents": [{"user_agent": ua, "count": count} for ua, count in top_user_agents],
             "summary": {
-                "total_ips_analyzed": len(ip_analysis),
+                "total_ips_analyzed": summary['unique_ips'],
                 "suspicious_ips_count": len(suspicious_ips),
-                "total_requests_analyzed": len(recent_logs),
-                "unique_endpoints": len(endpoint_analysis),
-                "unique_user_agents": len(user_agent_analysis)
+                "total_requests_analyzed": summary['total_requests'],
+                "unique_endpoints": summary['unique_endpoints'],
+                "unique_user_agents": summary['unique_user_agents']
             },
             "timestamp": time.time()
         }
+        _store_cached_patterns(cache_key, payload)
+        return payload
         
     except HTTPException:
         raise
@@ -320,6 +326,31 @@ async def analyze_suspicious_patterns(
         raise HTTPException(status_code=500, detail="패턴 분석에 실패했습니다")
 
 
+def _count_ip_activity(logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """최신순 로그 목록에서 LogAnalyzer.ip_activity와 같은 형식의 분포 집계 (DB 비활성화 시)"""
+    if not logs:
+        return {}
+    
+    # 컬럼별 빈도 집계는 Counter(C 구현)에 맡기고 행마다 dict를 갱신하지 않음
+    return {
+        "total_requests": len(logs),
+        "first_seen": logs[-1]['timestamp'],
+        "last_seen": logs[0]['timestamp'],
+        "methods": dict(Counter(map(itemgetter('method'), logs))),
+        "status_codes": dict(Counter(map(itemgetter('status_code'), logs))),
+        "endpoints": dict(Counter(map(itemgetter('endpoint'), logs))),
+        "user_agents": dict(Counter(map(itemgetter('user_agent'), logs))),
+        # 시간대는 행마다 로컬 시각으로 계산 (구간이 서머타임 전환을 걸쳐도 정확,
+        # datetime 객체 대신 time.localtime 사용)
+        "hourly_distribution": dict(Counter(
+            time.localtime(ts).tm_hour for ts in map(itemgetter('timestamp'), logs)
+        )),
+        "response_times": [
+            rt for rt in map(itemgetter('response_time'), logs) if rt > 0
+        ]
+    }
+
+
 @router.get("/analyze/ip/{ip}")
 async def analyze_ip_activity(
     ip: str,
@@ -332,13 +363,18 @@ async def analyze_ip_activity(
         logger_middleware = get_request_logger_middleware()
         
         start_time = time.time() - (hours * 3600)
-        logs = logger_middleware.query_logs(
-            start_time=start_time,
-            client_ip=ip,
-            limit=5000
-        )
-        
-        if not logs:
+        if logger_middleware.db_logger:
+            # 분포 집계를 DB에서 한 번의 쿼리로 처리
+            activity = LogAnalyzer(logger_middleware.db_logger).ip_activity(ip, start_time)
+        else:
+            activity = _count_ip_activity(logger_middleware.query_logs(
+                start_time=start_time,
+                client_ip=ip,
+                limit=5000,
+                columns=_IP_ACTIVITY_COLUMNS
+            ))
+        
+        if not activity:
             return {
                 "ip": ip,
                 "message": "해당 IP의 로그가 없습니다",
@@ -346,49 +382,15 @@ async def analyze_ip_activity(
                 "timestamp": time.time()
             }
         
-        # 활동 분석
+        endpoints = Counter(activity['endpoints'])
+        user_agents = Counter(activity['user_agents'])
         analysis = {
             "ip": ip,
-            "total_requests": len(logs),
-            "first_seen": min(log.get('timestamp', 0) for log in logs),
-            "last_seen": max(log.get('timestamp', 0) for log in logs),
-            "unique_endpoints": len(set(log.get('endpoint', '') for log in logs)),
-            "unique_user_agents": len(set(log.get('user_agent', '') for log in logs)),
-            "methods": {},
-            "status_codes": {},
-            "endpoints": {},
-            "user_agents": {},
-            "hourly_distribution": {},
-            "response_times": []
+            **activity,
+            "unique_endpoints": len(endpoints),
+            "unique_user_agents": len(user_agents),
         }
         
-        for log in logs:
-            # 메소드별 집계
-            method = log.get('method', '')
-            analysis['methods'][method] = analysis['methods'].get(method, 0) + 1
-            
-            # 상태 코드별 집계
-            status_code = log.get('status_code', 0)
-            analysis['status_codes'][status_code] = analysis['status_codes'].get(status_code, 0) + 1
-            
-            # 엔드포인트별 집계
-            endpoint = log.get('endpoint', '')
-            analysis['endpoints'][endpoint] = analysis['endpoints'].get(endpoint, 0) + 1
-            
-            # User-Agent별 집계
-            user_agent = log.get('user_agent', '')
-            analysis['user_agents'][user_agent] = analysis['user_agents'].get(user_agent, 0) + 1
-            
-            # 시간별 분포
-            timestamp = log.get('timestamp', 0)
-            hour = datetime.fromtimestamp(timestamp).hour
-            analysis['hourly_distribution'][hour] = analysis['hourly_distribution'].get(hour, 0) + 1
-            
-            # 응답 시간
-            response_time = log.get('response_time', 0)
-            if response_time > 0:
-                analysis['response_times'].append(response_time)
-        
         # 통계 계산
         activity_duration = analysis['last_seen'] - analysis['first_seen']
         requests_per_hour = analysis['total_requests'] / max(activity_duration / 3600, 0.01)
@@ -401,8 +403,8 @@ async def analyze_ip_activity(
         avg_response_time = sum(analysis['response_times']) / len(analysis['response_times']) if analysis['response_times'] else 0
         
         # 상위 항목들 정렬
-        analysis['top_endpoints'] = sorted(analysis['endpoints'].items(), key=lambda x: x[1], reverse=True)[:10]
-        analysis['top_user_agents'] = sorted(analysis['user_agents'].items(), key=lambda x: x[1], reverse=True)[:5]
+        analysis['top_endpoints'] = endpoints.most_common(10)
+        analysis['top_user_agents'] = user_agents.most_common(5)
         
         return {
             **analysis,
@@ -421,11 +423,53 @@ async def analyze_ip_activity(
         raise HTTPException(status_code=500, detail="IP 활동 분석에 실패했습니다")
 
 
+class _Echo:
+    """csv.writer가 쓴 내용을 그대로 돌려주는 파일 객체"""
+    
+    def write(self, value: str) -> str:
+        return value
+
+
+def _iter_csv(first: Optional[Dict[str, Any]], rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """첫 행과 나머지 로그 행을 CSV 한 줄씩 변환 (헤더는 첫 행의 키 사용, 로그가 없으면 빈 본문)"""
+    if first is None:
+        return
+    
+    writer = csv.DictWriter(_Echo(), fieldnames=list(first.keys()))
+    yield writer.writeheader()
+    yield writer.writerow(first)
+    try:
+        for row in rows:
+            yield writer.writerow(row)
+    except Exception as e:
+        # 응답 헤더를 이미 보낸 뒤라 상태 코드를 바꿀 수 없으므로 기록 후 스트림 중단
+        logger.error(f"CSV 스트리밍 중 오류: {e}")
+        raise
+
+
+# gzip 내보내기 시 압축 결과를 이 크기만큼 모아서 전송
+_GZIP_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_gzip(chunks: Iterator[str]) -> Iterator[bytes]:
+    """문자열 조각을 gzip으로 압축하며 일정 크기마다 전송 (전체를 메모리에 모으지 않음)"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=1) as gz:
+        for chunk in chunks:
+            gz.write(chunk.encode('utf-8'))
+            if buffer.tell() >= _GZIP_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue()
+
+
 @router.get("/export/csv")
 async def export_logs_csv(
     hours: int = Query(24, ge=1, le=168, description="내보낼 시간 범위"),
     client_ip: Optional[str] = Query(None, description="특정 IP 필터"),
-    status_code: Optional[int] = Query(None, description="상태 코드 필터")
+    status_code: Optional[int] = Query(None, description="상태 코드 필터"),
+    compress: bool = Query(False, description="gzip 압축(.csv.gz) 여부")
 ):
     """
     로그를 CSV 파일로 내보내기
@@ -445,28 +489,26 @@ async def export_logs_csv(
         if status_code:
             query_params['status_code'] = status_code
         
-        logs = logger_middleware.query_logs(**query_params)
-        
-        # CSV 생성
-        output = io.StringIO()
-        if logs:
-            fieldnames = logs[0].keys()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(logs)
+        rows = logger_middleware.iter_logs(**query_params)
+        # 첫 행을 미리 읽어 쿼리 실패를 응답 헤더 전송 전에 500으로 처리
+        first = await asyncio.to_thread(next, rows, None)
         
         # 파일명 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"request_logs_{timestamp}.csv"
         
-        # 임시 파일로 저장
-        temp_path = Path(f"/tmp/{filename}")
-        temp_path.write_text(output.getvalue(), encoding='utf-8')
-        
-        return FileResponse(
-            path=str(temp_path),
-            filename=filename,
-            media_type='text/csv'
+        if compress:
+            # Content-Encoding이 아닌 .csv.gz 파일 자체로 내려 클라이언트가 압축된 채 저장
+            return StreamingResponse(
+                _iter_gzip(_iter_csv(first, rows)),
+                media_type='application/gzip',
+                headers={'Content-Disposition': f'attachment; filename="{filename}.gz"'}
+            )
+        
+        return StreamingResponse(
+            _iter_csv(first, rows),
+            media_type='text/csv',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
         )
         
     except Exception as e:
@@ -489,53 +531,27 @@ async def get_ip_timeline(
         logs = logger_middleware.query_logs(
             start_time=start_time,
             client_ip=ip,
-            limit=5000
+            limit=5000,
+            columns=_TIMELINE_COLUMNS
         )
         
-        # 시간별 그룹화 (10분 단위)
-        timeline = {}
-        
-        for log in logs:
-            timestamp = log.get('timestamp', 0)
-            # 10분 단위로 그룹화
-            time_slot = int(timestamp // 600) * 600
-            time_key = datetime.fromtimestamp(time_slot).isoformat()
-            
-            if time_key not in timeline:
-                timeline[time_key] = {
-                    'timestamp': time_slot,
-                    'request_count': 0,
-                    'endpoints': set(),
-                    'status_codes': {},
-                    'methods': {},
-                    'unique_user_agents': set()
-                }
-            
-            slot = timeline[time_key]
-            slot['request_count'] += 1
-            slot['endpoints'].add(log.get('endpoint', ''))
-            slot['unique_user_agents'].add(log.get('user_agent', ''))
-            
-            status_code = log.get('status_code', 0)
-            slot['status_codes'][status_code] = slot['status_codes'].get(status_code, 0) + 1
-            
-            method = log.get('method', '')
-            slot['methods'][method] = slot['methods'].get(method, 0) + 1
-        
-        # 결과 정리
+        # 시간별 그룹화 (10분 단위). 로그가 최신순으로 정렬되어 있어 같은 구간의
+        # 행이 연속하므로 groupby로 구간을 나누고 구간별로 한 번에 집계
         timeline_list = []
-        for time_key in sorted(timeline.keys()):
-            slot = timeline[time_key]
+        for time_slot, group in groupby(logs, key=lambda log: int(log['timestamp'] // 600) * 600):
+            rows = list(group)
+            endpoints = set(map(itemgetter('endpoint'), rows))
             timeline_list.append({
-                'time': time_key,
-                'timestamp': slot['timestamp'],
-                'request_count': slot['request_count'],
-                'unique_endpoints': len(slot['endpoints']),
-                'unique_user_agents': len(slot['unique_user_agents']),
-                'status_codes': dict(slot['status_codes']),
-                'methods': dict(slot['methods']),
-                'top_endpoints': list(slot['endpoints'])[:5]
+                'time': datetime.fromtimestamp(time_slot).isoformat(),
+                'timestamp': time_slot,
+                'request_count': len(rows),
+                'unique_endpoints': len(endpoints),
+                'unique_user_agents': len(set(map(itemgetter('user_agent'), rows))),
+                'status_codes': dict(Counter(map(itemgetter('status_code'), rows))),
+                'methods': dict(Counter(map(itemgetter('method'), rows))),
+                'top_endpoints': list(endpoints)[:5]
             })
+        timeline_list.reverse()
         
         return {
             'ip': ip,
@@ -6,9 +6,10 @@ Sources Router
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -146,7 +147,30 @@ NEWS_SOURCES = [
 ]
 
 
-@router.get("/", response_model=SourcesResponse)
+def _build_sources_body(sources: List[Dict[str, str]]) -> bytes:
+    """언론사 목록 응답을 모델로 1회 검증한 뒤 JSON 바이트로 직렬화"""
+    response = SourcesResponse(
+        success=True,
+        message="언론사 목록을 성공적으로 조회했습니다.",
+        sources=sources,
+        total_count=len(sources)
+    )
+    return orjson.dumps(response.model_dump())
+
+
+# 고정 데이터이므로 전체/카테고리별 응답 본문을 모듈 로드 시 미리 생성
+_ALL_SOURCES_BODY = _build_sources_body(NEWS_SOURCES)
+_EMPTY_SOURCES_BODY = _build_sources_body([])
+_CATEGORY_SOURCES_BODIES = {
+    category.lower(): _build_sources_body(
+        [source for source in NEWS_SOURCES if source["category"] == category]
+    )
+    for category in {source["category"] for source in NEWS_SOURCES}
+}
+
+
+# 응답 모델은 OpenAPI 문서용으로만 사용 (요청마다 재검증/재직렬화하지 않음)
+@router.get("/", response_class=Response, responses={200: {"model": SourcesResponse}})
 async def get_news_sources(category: Optional[str] = None):
     """
     언론사 목록을 조회합니다.
@@ -161,36 +185,15 @@ async def get_news_sources(category: Optional[str] = None):
         GET /sources
         GET /sources?category=IT
     """
-    try:
-        # 카테고리 필터링
-        if category:
-            filtered_sources = [
-                source for source in NEWS_SOURCES 
-                if source["category"].lower() == category.lower()
-            ]
-            logger.info(f"언론사 목록 조회 완료 (카테고리: {category}): {len(filtered_sources)}개")
-        else:
-            filtered_sources = NEWS_SOURCES
-            logger.info(f"전체 언론사 목록 조회 완료: {len(filtered_sources)}개")
-        
-        # NewsSource 객체로 변환
-        sources = [NewsSource(**source) for source in filtered_sources]
-        
-        return SourcesResponse(
-            success=True,
-            message="언론사 목록을 성공적으로 조회했습니다.",
-            sources=sources,
-            total_count=len(sources)
-        )
-        
-    except Exception as e:
-        logger.error(f"언론사 목록 조회 중 오류: {e}")
-        return SourcesResponse(
-            success=False,
-            message=f"언론사 목록 조회에 실패했습니다: {str(e)}",
-            sources=[],
-            total_count=0
-        )
+    # 카테고리 필터링
+    if category:
+        body = _CATEGORY_SOURCES_BODIES.get(category.lower(), _EMPTY_SOURCES_BODY)
+        logger.info(f"언론사 목록 조회 완료 (카테고리: {category})")
+    else:
+        body = _ALL_SOURCES_BODY
+        logger.info(f"전체 언론사 목록 조회 완료: {len(NEWS_SOURCES)}개")
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/categories")
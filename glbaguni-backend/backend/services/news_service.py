@@ -68,7 +68,7 @@ class NewsService:
 
                 # 2. GPT 요약 생성
                 summary = await self.gpt_service.summarize_articles(
-                    articles=[article.dict() for article in articles],
+                    articles=[article.model_dump() for article in articles],
                     style=request.summary_style,
                     max_length=self.settings.summary_max_length,
                     language=request.language,
@@ -81,7 +81,7 @@ class NewsService:
                     "total_articles": len(articles),
                     "processed_articles": len(articles),
                     "failed_articles": 0,
-                    "summary": summary.dict(),
+                    "summary": summary.model_dump(),
                     "articles": [
                         {
                             "title": article.title,
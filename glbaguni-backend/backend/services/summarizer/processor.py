@@ -7,7 +7,7 @@ Summarizer Processor Module
 
 import logging
 import re
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional
 
 try:
@@ -114,7 +114,7 @@ class SummarizerProcessor:
         logger.info(f"📚 일괄 요약 처리 시작: {len(articles)}개 기사")
 
         summaries = []
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         for i, article in enumerate(articles, 1):
             try:
@@ -128,7 +128,7 @@ class SummarizerProcessor:
                 logger.error(f"기사 {i} 처리 실패: {e}")
                 continue
 
-        elapsed_time = (datetime.now() - start_time).total_seconds()
+        elapsed_time = time.monotonic() - start_time
         logger.info(
             f"✅ 일괄 요약 완료 - 성공: {len(summaries)}, 실패: {self.failed_count}, "
             f"소요시간: {elapsed_time:.2f}초"
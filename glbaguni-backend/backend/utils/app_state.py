@@ -25,7 +25,7 @@ class ApplicationState:
         self.notifier = None
         self.history_service = None
 
-        # 상태 정보
+        # 상태 정보 (start_time은 time.monotonic() 기준)
         self.initialized = False
         self.start_time = None
         self.request_count = 0
@@ -33,7 +33,7 @@ class ApplicationState:
     async def initialize(self, importer) -> None:
         """애플리케이션 컴포넌트 초기화"""
         try:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             logger = logging.getLogger("glbaguni")
             logger.info("🔧 애플리케이션 컴포넌트 초기화 시작...")
 
@@ -46,7 +46,7 @@ class ApplicationState:
             # 서비스 컴포넌트 초기화
             await self._init_services(importer)
 
-            elapsed = time.time() - self.start_time
+            elapsed = time.monotonic() - self.start_time
             self.initialized = True
             logger.info(f"🎉 애플리케이션 초기화 완료! ({elapsed:.2f}초)")
 
@@ -136,11 +136,17 @@ class ApplicationState:
         """요청 카운트 증가"""
         self.request_count += 1
 
+    def uptime_seconds(self) -> int:
+        """초기화 이후 경과 시간 (초, 시스템 시계 변경에 영향받지 않음)"""
+        if self.start_time is None:
+            return 0
+        return int(time.monotonic() - self.start_time)
+
     def get_stats(self) -> Dict[str, Any]:
         """애플리케이션 통계 반환"""
         return {
             "initialized": self.initialized,
-            "uptime_seconds": time.time() - self.start_time if self.start_time else 0,
+            "uptime_seconds": self.uptime_seconds(),
             "request_count": self.request_count,
             "components": {
                 "http_client": bool(self.http_client),
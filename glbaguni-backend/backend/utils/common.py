@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공통 헬퍼 함수
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+# 응답용 현재 시각 ISO 문자열 캐시 (1초 단위로 갱신)
+_NOW_ISO: Dict[str, Any] = {"t": 0.0, "value": ""}
+
+
+def now_iso_cached() -> str:
+    """현재 시각 ISO 문자열 (1초 이내 재호출은 같은 문자열 재사용)"""
+    now = time.time()
+    # 시계가 뒤로 조정된 경우에도 바로 갱신
+    if not 0.0 <= now - _NOW_ISO["t"] < 1.0:
+        _NOW_ISO["value"] = datetime.fromtimestamp(now).isoformat()
+        _NOW_ISO["t"] = now
+    return _NOW_ISO["value"]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 JSON 응답 캐시 유틸리티
+내용이 바뀔 때만 직렬화하고, ETag / If-None-Match로 304 응답을 지원합니다.
+"""
+
+import hashlib
+from typing import Any, Tuple
+
+import orjson
+from fastapi import Request, Response
+
+
+def freeze_json(payload: Any) -> Tuple[bytes, str]:
+    """응답 본문을 orjson 바이트로 직렬화하고 내용 기반 ETag 생성"""
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, etag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더에 ETag가 포함되어 있는지 확인 (약한 비교)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# 모듈 로드 시 고정되는 응답용 기본 캐시 정책
+STATIC_CACHE_CONTROL = "public, max-age=60"
+
+
+def cached_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str = STATIC_CACHE_CONTROL,
+) -> Response:
+    """미리 직렬화된 JSON 응답 (클라이언트 ETag가 같으면 본문 없이 304)
+
+    변경 가능한 응답은 cache_control에 "private, no-cache"를 넘겨 매번 ETag로 재검증하게 한다.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -10,10 +10,11 @@ import hashlib
 import json
 import time
 import uuid
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
 import ipaddress
 import re
@@ -178,6 +179,9 @@ class IPBlockerConfig:
 class RequestAnalyzer:
     """요청 패턴 분석기"""
     
+    # 최근 활동 IP로 집계하는 기간 (초)
+    RECENT_ACTIVE_WINDOW = 3600
+    
     def __init__(self, config: IPBlockerConfig):
         self.config = config
         
@@ -194,6 +198,9 @@ class RequestAnalyzer:
             "rapid_requests": 0
         })
         
+        # IP별 마지막 요청 시각 (오래된 순서 유지, 통계 조회 시 전체 스캔 없이 집계)
+        self._recent_activity: "OrderedDict[str, float]" = OrderedDict()
+        
     def analyze_request(self, pattern: RequestPattern) -> Tuple[bool, BlockReason, ThreatLevel]:
         """요청 패턴 분석"""
         ip = pattern.ip
@@ -212,6 +219,8 @@ class RequestAnalyzer:
         stats = self.ip_stats[ip]
         stats["total_requests"] += 1
         stats["last_request"] = now
+        self._recent_activity[ip] = now
+        self._recent_activity.move_to_end(ip)
         stats["user_agents"].add(pattern.user_agent)
         stats["endpoints"].add(pattern.endpoint)
         
@@ -227,6 +236,17 @@ class RequestAnalyzer:
         # 위협 분석
         return self._analyze_threats(ip, pattern, stats)
     
+    def recent_active_count(self) -> int:
+        """최근 RECENT_ACTIVE_WINDOW 동안 요청한 IP 수 (만료 항목만 앞에서 제거)"""
+        cutoff = time.time() - self.RECENT_ACTIVE_WINDOW
+        activity = self._recent_activity
+        while activity:
+            ip, last_request = next(iter(activity.items()))
+            if last_request > cutoff:
+                break
+            activity.popitem(last=False)
+        return len(activity)
+    
     def _analyze_threats(self, ip: str, pattern: RequestPattern, stats: Dict[str, Any]) -> Tuple[bool, BlockReason, ThreatLevel]:
         """위협 분석"""
         recent_requests = len(self.request_history[ip])
@@ -329,6 +349,50 @@ class IPBlockerStorage:
             logger.error(f"IP 차단 확인 중 오류: {e}")
             return False, None
     
+    async def is_blocked_many(self, ips: List[str]) -> Dict[str, Tuple[bool, Optional[BlockedIP]]]:
+        """여러 IP 차단 여부를 한 번에 확인 (Redis는 MGET으로 1회 왕복)"""
+        ips = list(dict.fromkeys(ips))
+        try:
+            results: Dict[str, Tuple[bool, Optional[BlockedIP]]] = {}
+            expired = []
+            now = time.time()
+            
+            # Redis에서 일괄 확인
+            redis_values: List[Optional[str]] = [None] * len(ips)
+            if self.redis_client and ips:
+                prefix = f"{self.config.redis_key_prefix}blocked:"
+                redis_values = self.redis_client.mget([prefix + ip for ip in ips])
+            
+            for ip, data in zip(ips, redis_values):
+                if data:
+                    blocked_ip = BlockedIP.from_dict(json.loads(data))
+                    if now < blocked_ip.blocked_until:
+                        results[ip] = (True, blocked_ip)
+                    else:
+                        expired.append(ip)
+                        results[ip] = (False, None)
+                    continue
+                
+                # 메모리에서 확인
+                blocked_ip = self.memory_storage.get(ip)
+                if blocked_ip is None:
+                    results[ip] = (False, None)
+                elif now < blocked_ip.blocked_until:
+                    results[ip] = (True, blocked_ip)
+                else:
+                    del self.memory_storage[ip]
+                    results[ip] = (False, None)
+            
+            # 만료된 차단 해제
+            for ip in expired:
+                await self.unblock_ip(ip)
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"IP 일괄 차단 확인 중 오류: {e}")
+            return {ip: (False, None) for ip in ips}
+    
     async def block_ip(self, blocked_ip: BlockedIP):
         """IP 차단"""
         try:
@@ -432,6 +496,10 @@ class IPBlockerMiddleware:
         # 정리 작업 플래그 (안전하게 처리)
         self._cleanup_task_started = False
         
+        # 화이트리스트 CIDR은 한 번만 파싱해 prefix 길이별 네트워크 집합으로 보관
+        self._whitelist_networks: Dict[Tuple[int, int], Set[int]] = {}
+        self._compile_whitelist()
+        
         logger.info(f"🛡️ IP 차단 미들웨어 활성화 (Redis: {'사용' if self.config.redis_enabled and REDIS_AVAILABLE else '미사용'})")
     
     def get_client_ip(self, request: Request) -> str:
@@ -449,21 +517,51 @@ class IPBlockerMiddleware:
         # 직접 연결
         return request.client.host if request.client else "unknown"
     
+    def _compile_whitelist(self):
+        """화이트리스트 CIDR을 (IP 버전, 호스트 비트 수) -> 네트워크 접두사 정수 집합으로 변환"""
+        networks: Dict[Tuple[int, int], Set[int]] = defaultdict(set)
+        for whitelist_ip in self.config.whitelist_ips:
+            if "/" not in whitelist_ip:  # 단일 IP는 문자열 그대로 비교
+                continue
+            try:
+                network = ipaddress.ip_network(whitelist_ip, strict=False)
+            except ValueError:
+                logger.warning(f"⚠️ 잘못된 화이트리스트 CIDR 무시: {whitelist_ip}")
+                continue
+            host_bits = network.max_prefixlen - network.prefixlen
+            networks[(network.version, host_bits)].add(
+                int(network.network_address) >> host_bits
+            )
+        self._whitelist_networks = dict(networks)
+        # 같은 IP의 반복 확인은 파싱/조회 없이 응답 (재컴파일 시 새 캐시로 교체되어 무효화)
+        self._cidr_whitelisted = lru_cache(maxsize=4096)(self._match_whitelist_networks)
+    
+    def reload_whitelist(self):
+        """config.whitelist_ips 변경 후 CIDR 목록과 확인 결과 캐시 갱신"""
+        self._compile_whitelist()
+    
     def is_whitelisted(self, ip: str) -> bool:
         """화이트리스트 확인"""
         if ip in self.config.whitelist_ips:
             return True
         
-        # CIDR 범위 확인
+        if not self._whitelist_networks:
+            return False
+        
+        return self._cidr_whitelisted(ip)
+    
+    def _match_whitelist_networks(self, ip: str) -> bool:
+        """CIDR 범위 확인 (등록된 prefix 길이마다 집합 조회 1회)"""
         try:
-            for whitelist_ip in self.config.whitelist_ips:
-                if "/" in whitelist_ip:  # CIDR 표기법
-                    network = ipaddress.ip_network(whitelist_ip, strict=False)
-                    if ipaddress.ip_address(ip) in network:
-                        return True
+            address = ipaddress.ip_address(ip)
         except ValueError:
             # IP 주소 파싱 실패 시 화이트리스트 통과하지 않음
-            pass
+            return False
+        
+        address_int = int(address)
+        for (version, host_bits), prefixes in self._whitelist_networks.items():
+            if version == address.version and (address_int >> host_bits) in prefixes:
+                return True
         
         return False
     
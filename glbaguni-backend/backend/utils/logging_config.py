@@ -5,13 +5,34 @@
 전체 프로젝트의 로깅을 중앙에서 관리
 """
 
+import json
 import logging
 import logging.handlers
 import os
 import sys
-from datetime import datetime
+import time
 from typing import Optional
 
+# LogRecord 기본 속성 (이외의 속성은 extra로 전달된 필드)
+_RESERVED_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+
+class StructuredFormatter(logging.Formatter):
+    """extra로 전달된 필드를 JSON으로 덧붙이는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED_RECORD_ATTRS
+        }
+        if extras:
+            line = f"{line} | {json.dumps(extras, ensure_ascii=False, default=str)}"
+        return line
+
 
 def setup_comprehensive_logging(
     log_level: str = "INFO",
@@ -59,10 +80,13 @@ def setup_comprehensive_logging(
             ]
         )
 
+    # extra 필드(구조화 로그)까지 출력하도록 포매터를 직접 지정
+    formatter = StructuredFormatter(log_format, date_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        datefmt=date_format,
         handlers=handlers,
     )
 
@@ -142,12 +166,12 @@ class ContextLogger:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         self.logger.info(f"🔄 시작: {self.operation}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.monotonic() - self.start_time
 
         if exc_type is None:
             self.logger.info(f"✅ 완료: {self.operation} ({duration:.3f}초)")
@@ -6,6 +6,7 @@
 """
 
 import asyncio
+import bisect
 import gc
 import logging
 import os
@@ -14,6 +15,7 @@ import time
 import tracemalloc
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Callable
 import weakref
@@ -28,6 +30,9 @@ except ImportError:
 
 logger = get_logger("memory_manager")
 
+# 바이트 -> MB 변환 계수 (2의 거듭제곱 역수라 나눗셈과 결과가 동일)
+_MB = 1.0 / (1024 * 1024)
+
 
 @dataclass
 class MemoryStats:
@@ -100,6 +105,15 @@ class CacheManager:
             self.caches[name] = weakref.ref(cache_object)
             logger.debug(f"캐시 등록: {name}")
     
+    def unregister_cache(self, name: str) -> bool:
+        """캐시 등록 해제 (등록되어 있던 경우 True)"""
+        with self.lock:
+            self.access_times.pop(name, None)
+            removed = self.caches.pop(name, None) is not None
+        if removed:
+            logger.debug(f"캐시 등록 해제: {name}")
+        return removed
+    
     def get_cache_size(self) -> int:
         """전체 캐시 크기 반환"""
         total_size = 0
@@ -164,6 +178,8 @@ class MemoryMonitor:
         self.config = config
         self.process = psutil.Process()
         self.stats_history: deque = deque(maxlen=config.max_history_size)
+        # stats_history와 같은 순서의 epoch 타임스탬프 (시간 범위 조회 시 이분 탐색용)
+        self.stats_history_ts: deque = deque(maxlen=config.max_history_size)
         self.last_alert_time: Dict[str, datetime] = {}
         self.cache_manager = CacheManager(config.max_cache_size)
         
@@ -192,13 +208,13 @@ class MemoryMonitor:
             
             stats = MemoryStats(
                 timestamp=datetime.now(),
-                total_memory_mb=memory.total / 1024 / 1024,
-                available_memory_mb=memory.available / 1024 / 1024,
-                used_memory_mb=memory.used / 1024 / 1024,
+                total_memory_mb=memory.total * _MB,
+                available_memory_mb=memory.available * _MB,
+                used_memory_mb=memory.used * _MB,
                 memory_percent=memory.percent,
-                process_memory_mb=process_memory.rss / 1024 / 1024,
+                process_memory_mb=process_memory.rss * _MB,
                 process_memory_percent=self.process.memory_percent(),
-                swap_memory_mb=swap.used / 1024 / 1024,
+                swap_memory_mb=swap.used * _MB,
                 swap_percent=swap.percent,
                 gc_collections=gc_stats,
                 cache_size=cache_size
@@ -224,6 +240,7 @@ class MemoryMonitor:
     def add_stats(self, stats: MemoryStats):
         """통계 히스토리에 추가"""
         self.stats_history.append(stats)
+        self.stats_history_ts.append(stats.timestamp.timestamp())
         
         # 임계값 확인 및 알림
         self._check_thresholds(stats)
@@ -267,13 +284,27 @@ class MemoryMonitor:
         cooldown = timedelta(minutes=self.config.alert_cooldown_minutes)
         return current_time - last_time > cooldown
     
+    def _recent_start(self, seconds: float) -> int:
+        """최근 seconds 범위가 시작되는 히스토리 인덱스 (시간순 타임스탬프 이분 탐색)"""
+        return bisect.bisect_right(self.stats_history_ts, time.time() - seconds)
+    
+    def count_recent_stats(self, seconds: float) -> int:
+        """최근 seconds 동안의 통계 개수 (항목 복사 없음)"""
+        return len(self.stats_history_ts) - self._recent_start(seconds)
+    
+    def get_recent_stats(self, seconds: float, limit: Optional[int] = None) -> List[MemoryStats]:
+        """최근 seconds 동안의 통계 (limit이 있으면 가장 최근 limit개만 복사)"""
+        start = self._recent_start(seconds)
+        if limit is not None:
+            start = max(start, len(self.stats_history) - limit)
+        return list(islice(self.stats_history, start, None))
+    
     def get_memory_trend(self, minutes: int = 30) -> Dict[str, Any]:
         """메모리 사용 트렌드 분석"""
         if not self.stats_history:
             return {"trend": "stable", "avg_usage": 0, "peak_usage": 0}
         
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_stats = [s for s in self.stats_history if s.timestamp > cutoff_time]
+        recent_stats = self.get_recent_stats(minutes * 60)
         
         if len(recent_stats) < 2:
             return {"trend": "stable", "avg_usage": 0, "peak_usage": 0}
@@ -310,64 +341,73 @@ class MemoryOptimizer:
     def __init__(self, cache_manager: CacheManager):
         self.cache_manager = cache_manager
         self.optimization_count = 0
+        self.process = psutil.Process()
+        # 스레드 풀에서 실행되므로 동시에 두 번 최적화하지 않도록 보호
+        self._lock = threading.Lock()
     
     async def optimize_memory(self, force: bool = False) -> Dict[str, Any]:
-        """메모리 최적화 실행"""
-        optimization_start = time.time()
-        results = {
-            "optimization_time": 0,
-            "gc_collected": 0,
-            "cache_cleaned": 0,
-            "memory_freed_mb": 0
-        }
+        """메모리 최적화 실행 (GC는 스레드 풀에서 실행해 이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self._optimize_memory_sync, force)
+
+    def _optimize_memory_sync(self, force: bool = False) -> Dict[str, Any]:
+        """메모리 최적화 (동기 실행)"""
+        with self._lock:
+            optimization_start = time.time()
+            results = {
+                "optimization_time": 0,
+                "gc_collected": 0,
+                "cache_cleaned": 0,
+                "memory_freed_mb": 0
+            }
         
-        try:
-            # 최적화 전 메모리 사용량
-            before_memory = psutil.Process().memory_info().rss / 1024 / 1024
+            try:
+                # 최적화 전 메모리 사용량
+                before_memory = self.process.memory_info().rss * _MB
             
-            # 1. 가비지 컬렉션 실행
-            collected_objects = 0
-            for generation in range(3):
-                collected = gc.collect(generation)
-                collected_objects += collected
+                # 1. 가비지 컬렉션 실행
+                collected_objects = 0
+                for generation in range(3):
+                    collected = gc.collect(generation)
+                    collected_objects += collected
             
-            results["gc_collected"] = collected_objects
+                results["gc_collected"] = collected_objects
             
-            # 2. 캐시 정리
-            if force or self.cache_manager.get_cache_size() > self.cache_manager.max_size:
-                cleaned_count = self.cache_manager.cleanup_caches(0.3)
-                results["cache_cleaned"] = cleaned_count
+                # 2. 캐시 정리
+                cleaned_count = 0
+                if force or self.cache_manager.get_cache_size() > self.cache_manager.max_size:
+                    cleaned_count = self.cache_manager.cleanup_caches(0.3)
+                    results["cache_cleaned"] = cleaned_count
             
-            # 3. 약한 참조 정리
-            try:
-                import weakref
-                weakref._remove_dead_weakref = True
-            except:
-                pass
+                # 3. 약한 참조 정리
+                try:
+                    import weakref
+                    weakref._remove_dead_weakref = True
+                except:
+                    pass
             
-            # 최적화 후 메모리 사용량
-            after_memory = psutil.Process().memory_info().rss / 1024 / 1024
-            memory_freed = max(0, before_memory - after_memory)
+                # 최적화 후 메모리 사용량
+                after_memory = self.process.memory_info().rss * _MB
+                memory_freed = max(0, before_memory - after_memory)
             
-            results["memory_freed_mb"] = memory_freed
-            results["optimization_time"] = time.time() - optimization_start
+                results["memory_freed_mb"] = memory_freed
+                results["optimization_time"] = time.time() - optimization_start
             
-            self.optimization_count += 1
+                self.optimization_count += 1
             
-            if memory_freed > 1:  # 1MB 이상 해제된 경우만 로그
-                logger.info(
-                    f"🔧 메모리 최적화 완료: "
-                    f"GC {collected_objects}개 객체, "
-                    f"캐시 {cleaned_count}개 항목, "
-                    f"{memory_freed:.1f}MB 해제"
-                )
+                if memory_freed > 1:  # 1MB 이상 해제된 경우만 로그
+                    logger.info(
+                        f"🔧 메모리 최적화 완료: "
+                        f"GC {collected_objects}개 객체, "
+                        f"캐시 {cleaned_count}개 항목, "
+                        f"{memory_freed:.1f}MB 해제"
+                    )
             
-            return results
+                return results
             
-        except Exception as e:
-            logger.error(f"메모리 최적화 실패: {e}")
-            results["error"] = str(e)
-            return results
+            except Exception as e:
+                logger.error(f"메모리 최적화 실패: {e}")
+                results["error"] = str(e)
+                return results
 
 
 class MemoryManager:
@@ -476,6 +516,10 @@ class MemoryManager:
         """캐시 객체 등록"""
         self.monitor.cache_manager.register_cache(name, cache_object)
     
+    def unregister_cache(self, name: str) -> bool:
+        """캐시 등록 해제"""
+        return self.monitor.cache_manager.unregister_cache(name)
+    
     async def force_cleanup(self) -> Dict[str, Any]:
         """강제 메모리 정리"""
         logger.info("🧹 강제 메모리 정리 시작")
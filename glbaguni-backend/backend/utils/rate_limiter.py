@@ -5,9 +5,10 @@ Rate Limiting 미들웨어
 IP 기반 요청 속도 제한 기능을 제공합니다.
 """
 
+import re
 import time
 import asyncio
-from typing import Dict, Optional, List, Tuple, Any, Union
+from typing import Dict, Iterable, Optional, List, Pattern, Tuple, Any, Union
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -45,6 +46,19 @@ except ImportError:
 
 logger = get_logger("rate_limiter")
 
+# 기본 제외 경로 (라우터/미들웨어가 같은 집합을 공유)
+DEFAULT_EXEMPT_PATHS = frozenset(
+    {"/docs", "/redoc", "/openapi.json", "/health", "/health/basic"}
+)
+
+
+def compile_exempt_pattern(paths: Iterable[str]) -> Optional[Pattern[str]]:
+    """제외 경로 부분 일치 검사용 정규식을 미리 컴파일 (경로가 없으면 None)"""
+    paths = sorted(set(paths), key=len, reverse=True)
+    if not paths:
+        return None
+    return re.compile("|".join(map(re.escape, paths)))
+
 
 @dataclass
 class RateLimitConfig:
@@ -65,13 +79,7 @@ class RateLimitConfig:
     
     def __post_init__(self):
         if self.exempt_paths is None:
-            self.exempt_paths = [
-                "/docs", 
-                "/redoc", 
-                "/openapi.json",
-                "/health",
-                "/health/basic"
-            ]
+            self.exempt_paths = sorted(DEFAULT_EXEMPT_PATHS)
 
 
 class MemoryRateLimiter:
@@ -262,6 +270,10 @@ class RateLimitMiddleware:
     
     def __init__(self, config: Optional[RateLimitConfig] = None):
         self.config = config or RateLimitConfig()
+
+        # 제외 경로는 요청마다 순회하지 않도록 집합/정규식으로 1회만 변환
+        self._exempt_paths = frozenset(self.config.exempt_paths or ())
+        self._exempt_pattern = compile_exempt_pattern(self._exempt_paths)
         
         # Redis 우선, 실패시 메모리 사용
         if REDIS_AVAILABLE:
@@ -294,7 +306,9 @@ class RateLimitMiddleware:
         try:
             # 제외 경로 확인
             path = str(request.url.path)
-            if self.config.exempt_paths and any(exempt in path for exempt in self.config.exempt_paths):
+            if path in self._exempt_paths or (
+                self._exempt_pattern and self._exempt_pattern.search(path)
+            ):
                 return await call_next(request)
             
             # 클라이언트 IP 추출
@@ -10,12 +10,14 @@ import asyncio
 import json
 import os
 import time
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional, List, Union
+from dataclasses import dataclass, asdict, field, fields
+from typing import Dict, Any, Iterator, Optional, List, Sequence, Union
 import ipaddress
 import gzip
 import shutil
+import threading
 from pathlib import Path
 import csv
 import sqlite3
@@ -102,6 +104,18 @@ class RequestLogEntry:
         ]
 
 
+# query_logs(columns=...)로 선택할 수 있는 컬럼 (SQL에 직접 들어가므로 허용 목록으로 제한)
+LOG_COLUMNS = tuple(f.name for f in fields(RequestLogEntry))
+
+
+def _checked_columns(columns: Sequence[str]) -> List[str]:
+    """조회 컬럼 검증 (허용 목록에 없는 컬럼이면 ValueError)"""
+    unknown = [column for column in columns if column not in LOG_COLUMNS]
+    if unknown:
+        raise ValueError(f"조회할 수 없는 컬럼: {unknown}")
+    return list(columns)
+
+
 class RequestLoggerConfig:
     """요청 로거 설정"""
     
@@ -118,7 +132,10 @@ class RequestLoggerConfig:
         compress_old_logs: bool = True,
         database_enabled: bool = False,
         database_path: str = "logs/requests.db",
-        retention_days: int = 30
+        retention_days: int = 30,
+        recent_buffer_size: int = 1000,
+        ip_summary_enabled: bool = False,
+        ip_summary_hours: int = 168
     ):
         self.enabled = enabled
         self.log_dir = Path(log_dir)
@@ -135,6 +152,10 @@ class RequestLoggerConfig:
         self.database_enabled = database_enabled
         self.database_path = Path(database_path)
         self.retention_days = retention_days
+        self.recent_buffer_size = recent_buffer_size
+        # IP별 활동 요약 (프로세스 메모리에 유지하므로 단일 워커 배포에서만 활성화)
+        self.ip_summary_enabled = ip_summary_enabled
+        self.ip_summary_hours = ip_summary_hours
         
         # 디렉토리 생성
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -187,13 +208,18 @@ class DatabaseLogger:
             # 인덱스 생성
             indexes = [
                 'CREATE INDEX IF NOT EXISTS idx_timestamp ON request_logs(timestamp)',
-                'CREATE INDEX IF NOT EXISTS idx_client_ip ON request_logs(client_ip)',
                 'CREATE INDEX IF NOT EXISTS idx_endpoint ON request_logs(endpoint)',
-                'CREATE INDEX IF NOT EXISTS idx_status_code ON request_logs(status_code)',
-                'CREATE INDEX IF NOT EXISTS idx_is_blocked ON request_logs(is_blocked)',
-                'CREATE INDEX IF NOT EXISTS idx_datetime ON request_logs(datetime_iso)'
+                'CREATE INDEX IF NOT EXISTS idx_datetime ON request_logs(datetime_iso)',
+                # 조건 + 시간 범위 조회용 복합 인덱스 (등치 컬럼 → timestamp 순서라 정렬도 인덱스로 처리)
+                'CREATE INDEX IF NOT EXISTS idx_ip_ts ON request_logs(client_ip, timestamp)',
+                'CREATE INDEX IF NOT EXISTS idx_status_ts ON request_logs(status_code, timestamp)',
+                'CREATE INDEX IF NOT EXISTS idx_blocked_ts ON request_logs(timestamp) WHERE is_blocked = 1'
             ]
             
+            # 복합 인덱스의 앞부분과 겹치는 단일 컬럼 인덱스 제거 (기존 DB 마이그레이션)
+            for index_name in ('idx_client_ip', 'idx_status_code', 'idx_is_blocked'):
+                conn.execute(f'DROP INDEX IF EXISTS {index_name}')
+            
             for index_sql in indexes:
                 conn.execute(index_sql)
             
@@ -215,57 +241,73 @@ class DatabaseLogger:
         except Exception as e:
             logger.error(f"데이터베이스 로그 저장 실패: {e}")
     
-    def query_logs(
-        self, 
+    @staticmethod
+    def _build_query(
         start_time: Optional[float] = None,
         end_time: Optional[float] = None,
         client_ip: Optional[str] = None,
         endpoint: Optional[str] = None,
         status_code: Optional[int] = None,
+        status_code_min: Optional[int] = None,
+        status_code_max: Optional[int] = None,
         is_blocked: Optional[bool] = None,
-        limit: int = 1000
-    ) -> List[Dict[str, Any]]:
-        """로그 쿼리"""
+        limit: int = 1000,
+        columns: Optional[Sequence[str]] = None
+    ) -> tuple[str, List[Any]]:
+        """로그 조회 SQL과 파라미터 생성 (최신순, columns 지정 시 해당 컬럼만 조회)"""
+        select_sql = ', '.join(_checked_columns(columns)) if columns else '*'
+        where_clauses = []
+        params = []
+        
+        if start_time:
+            where_clauses.append('timestamp >= ?')
+            params.append(start_time)
+        
+        if end_time:
+            where_clauses.append('timestamp <= ?')
+            params.append(end_time)
+        
+        if client_ip:
+            where_clauses.append('client_ip = ?')
+            params.append(client_ip)
+        
+        if endpoint:
+            where_clauses.append('endpoint LIKE ?')
+            params.append(f'%{endpoint}%')
+        
+        if status_code:
+            where_clauses.append('status_code = ?')
+            params.append(status_code)
+        
+        # 상태 코드 범위 (min 이상, max 미만)
+        if status_code_min is not None:
+            where_clauses.append('status_code >= ?')
+            params.append(status_code_min)
+        
+        if status_code_max is not None:
+            where_clauses.append('status_code < ?')
+            params.append(status_code_max)
+        
+        if is_blocked is not None:
+            # 부분 인덱스(idx_blocked_ts)를 쓸 수 있도록 바인딩 대신 리터럴 사용
+            where_clauses.append('is_blocked = 1' if is_blocked else 'is_blocked = 0')
+        
+        where_sql = ' AND '.join(where_clauses) if where_clauses else '1=1'
+        sql = f'''
+            SELECT {select_sql} FROM request_logs 
+            WHERE {where_sql} 
+            ORDER BY timestamp DESC 
+            LIMIT ?
+        '''
+        params.append(limit)
+        return sql, params
+    
+    def query_logs(self, **kwargs) -> List[Dict[str, Any]]:
+        """로그 쿼리 (조건은 _build_query 참고)"""
+        sql, params = self._build_query(**kwargs)
         try:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
-                
-                where_clauses = []
-                params = []
-                
-                if start_time:
-                    where_clauses.append('timestamp >= ?')
-                    params.append(start_time)
-                
-                if end_time:
-                    where_clauses.append('timestamp <= ?')
-                    params.append(end_time)
-                
-                if client_ip:
-                    where_clauses.append('client_ip = ?')
-                    params.append(client_ip)
-                
-                if endpoint:
-                    where_clauses.append('endpoint LIKE ?')
-                    params.append(f'%{endpoint}%')
-                
-                if status_code:
-                    where_clauses.append('status_code = ?')
-                    params.append(status_code)
-                
-                if is_blocked is not None:
-                    where_clauses.append('is_blocked = ?')
-                    params.append(is_blocked)
-                
-                where_sql = ' AND '.join(where_clauses) if where_clauses else '1=1'
-                sql = f'''
-                    SELECT * FROM request_logs 
-                    WHERE {where_sql} 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                '''
-                params.append(limit)
-                
                 cursor = conn.execute(sql, params)
                 return [dict(row) for row in cursor.fetchall()]
                 
@@ -273,6 +315,23 @@ class DatabaseLogger:
             logger.error(f"로그 쿼리 실패: {e}")
             return []
     
+    def iter_logs(self, batch_size: int = 500, **kwargs) -> Iterator[Dict[str, Any]]:
+        """로그를 batch_size 단위로 읽으며 한 행씩 반환 (전체 결과를 메모리에 올리지 않음)"""
+        sql, params = self._build_query(**kwargs)
+        # 스트리밍 응답은 스레드 풀의 여러 스레드에서 이어서 소비될 수 있음
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            conn.close()
+    
     def get_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """통계 정보 반환"""
         try:
@@ -428,6 +487,121 @@ class FileLogger:
             logger.error(f"로그 정리 실패: {e}")
 
 
+@dataclass
+class IPHourStats:
+    """IP별 1시간 구간 활동 집계"""
+    request_count: int = 0
+    error_4xx: int = 0
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    endpoints: set = field(default_factory=set)
+    user_agents: set = field(default_factory=set)
+
+
+class IPActivitySummary:
+    """로그 기록 시점에 갱신하는 IP별 시간 구간 요약 (조회 시 IP 수만큼만 계산)"""
+    
+    def __init__(self, retention_hours: int = 168):
+        self.retention_hours = retention_hours
+        self.started_at = time.time()
+        self._ips: Dict[str, Dict[int, IPHourStats]] = {}
+        self._current_hour: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def add(self, entry: RequestLogEntry):
+        """로그 엔트리 반영 (시간 구간이 바뀔 때 보존 기간이 지난 구간 정리)"""
+        hour = int(entry.timestamp // 3600)
+        with self._lock:
+            if self._current_hour is None or hour > self._current_hour:
+                self._current_hour = hour
+                self._prune(hour - self.retention_hours)
+            
+            stats = self._ips.setdefault(entry.client_ip, {}).get(hour)
+            if stats is None:
+                stats = self._ips[entry.client_ip][hour] = IPHourStats(
+                    first_seen=entry.timestamp, last_seen=entry.timestamp
+                )
+            stats.request_count += 1
+            if 400 <= entry.status_code < 500:
+                stats.error_4xx += 1
+            stats.first_seen = min(stats.first_seen, entry.timestamp)
+            stats.last_seen = max(stats.last_seen, entry.timestamp)
+            stats.endpoints.add(entry.endpoint)
+            stats.user_agents.add(entry.user_agent or '')
+    
+    def _prune(self, oldest_hour: int):
+        """oldest_hour 이전 구간과 활동이 없는 IP 제거 (잠금 안에서 호출)"""
+        for ip in list(self._ips):
+            hours = self._ips[ip]
+            for hour in [hour for hour in hours if hour < oldest_hour]:
+                del hours[hour]
+            if not hours:
+                del self._ips[ip]
+    
+    def load_from_database(self, db_path: Path):
+        """보존 기간 내 DB 로그로 요약 초기화 (프로세스 시작 직후에도 전체 구간 사용 가능)"""
+        start_hour = int(time.time() // 3600) - self.retention_hours
+        with sqlite3.connect(db_path) as conn:
+            cursor = conn.execute('''
+                SELECT
+                    client_ip,
+                    CAST(timestamp / 3600 AS INTEGER) AS hour,
+                    endpoint,
+                    COALESCE(user_agent, '') AS user_agent,
+                    COUNT(*),
+                    SUM(status_code BETWEEN 400 AND 499),
+                    MIN(timestamp),
+                    MAX(timestamp)
+                FROM request_logs
+                WHERE timestamp >= ?
+                GROUP BY client_ip, hour, endpoint, user_agent
+            ''', [start_hour * 3600])
+            rows = cursor.fetchall()
+        
+        with self._lock:
+            for ip, hour, endpoint, user_agent, count, error_4xx, first_seen, last_seen in rows:
+                stats = self._ips.setdefault(ip, {}).get(hour)
+                if stats is None:
+                    stats = self._ips[ip][hour] = IPHourStats(
+                        first_seen=first_seen, last_seen=last_seen
+                    )
+                stats.request_count += count
+                stats.error_4xx += error_4xx
+                stats.first_seen = min(stats.first_seen, first_seen)
+                stats.last_seen = max(stats.last_seen, last_seen)
+                stats.endpoints.add(endpoint)
+                stats.user_agents.add(user_agent)
+            self.started_at = start_hour * 3600
+    
+    def covers(self, start_time: float) -> bool:
+        """start_time부터의 로그를 정확히 집계할 수 있는지 (정시 시작, 요약 시작 이후, 보존 기간 이내)"""
+        if start_time % 3600:
+            return False
+        oldest = (int(time.time() // 3600) - self.retention_hours) * 3600
+        return start_time >= max(self.started_at, oldest)
+    
+    def aggregate(self, start_time: float, min_requests: int = 1) -> List[Dict[str, Any]]:
+        """LogAnalyzer.aggregate_by_ip와 같은 형식의 IP별 집계 (start_time이 속한 시간 구간부터, 정시 시작만 정확)"""
+        start_hour = int(start_time // 3600)
+        rows = []
+        with self._lock:
+            for ip, hours in self._ips.items():
+                buckets = [stats for hour, stats in hours.items() if hour >= start_hour]
+                request_count = sum(stats.request_count for stats in buckets)
+                if not buckets or request_count < min_requests:
+                    continue
+                rows.append({
+                    "client_ip": ip,
+                    "request_count": request_count,
+                    "unique_endpoints": len(set().union(*(stats.endpoints for stats in buckets))),
+                    "unique_user_agents": len(set().union(*(stats.user_agents for stats in buckets))),
+                    "error_4xx": sum(stats.error_4xx for stats in buckets),
+                    "first_seen": min(stats.first_seen for stats in buckets),
+                    "last_seen": max(stats.last_seen for stats in buckets),
+                })
+        return rows
+
+
 class RequestLoggerMiddleware:
     """요청 로깅 미들웨어"""
     
@@ -444,6 +618,20 @@ class RequestLoggerMiddleware:
             "last_log_time": 0
         }
         
+        # 최근 로그 엔트리 (DB 없이도 최근 로그 조회 가능, 오래된 항목은 자동 폐기)
+        self.recent_entries: deque = deque(maxlen=self.config.recent_buffer_size)
+        
+        # IP별 활동 요약 (의심 패턴 분석 시 DB 집계 대신 사용)
+        self.ip_summary = (
+            IPActivitySummary(self.config.ip_summary_hours)
+            if self.config.ip_summary_enabled else None
+        )
+        if self.ip_summary and self.db_logger:
+            try:
+                self.ip_summary.load_from_database(self.db_logger.db_path)
+            except Exception as e:
+                logger.error(f"IP 활동 요약 초기화 실패: {e}")
+        
         # 정리 작업 스케줄링
         self._cleanup_task_started = False
         
@@ -603,6 +791,9 @@ class RequestLoggerMiddleware:
             )
             
             # 로그 저장
+            self.recent_entries.append(log_entry)
+            if self.ip_summary:
+                self.ip_summary.add(log_entry)
             if self.file_logger:
                 await self.file_logger.log_entry(log_entry)
             
@@ -648,6 +839,9 @@ class RequestLoggerMiddleware:
                 request_id=request_id
             )
             
+            self.recent_entries.append(log_entry)
+            if self.ip_summary:
+                self.ip_summary.add(log_entry)
             if self.file_logger:
                 await self.file_logger.log_entry(log_entry)
             
@@ -682,10 +876,61 @@ class RequestLoggerMiddleware:
         return {}
     
     def query_logs(self, **kwargs) -> List[Dict[str, Any]]:
-        """로그 쿼리"""
+        """로그 쿼리 (DB 비활성화 시 메모리의 최근 로그에서 조회)"""
         if self.db_logger:
             return self.db_logger.query_logs(**kwargs)
-        return []
+        return self._query_recent_entries(**kwargs)
+    
+    def iter_logs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """로그를 한 행씩 반환 (DB 비활성화 시 메모리의 최근 로그에서 조회)"""
+        if self.db_logger:
+            return self.db_logger.iter_logs(**kwargs)
+        return iter(self._query_recent_entries(**kwargs))
+    
+    def _query_recent_entries(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        client_ip: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        status_code: Optional[int] = None,
+        status_code_min: Optional[int] = None,
+        status_code_max: Optional[int] = None,
+        is_blocked: Optional[bool] = None,
+        limit: int = 1000,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """최근 로그 버퍼 조회 (DatabaseLogger.query_logs와 같은 조건, 최신순)"""
+        if columns:
+            columns = _checked_columns(columns)
+        results = []
+        for entry in reversed(self.recent_entries):
+            if start_time and entry.timestamp < start_time:
+                continue
+            if end_time and entry.timestamp > end_time:
+                continue
+            if client_ip and entry.client_ip != client_ip:
+                continue
+            if endpoint and endpoint not in entry.endpoint:
+                continue
+            if status_code and entry.status_code != status_code:
+                continue
+            if status_code_min is not None and entry.status_code < status_code_min:
+                continue
+            if status_code_max is not None and entry.status_code >= status_code_max:
+                continue
+            if is_blocked is not None and entry.is_blocked != is_blocked:
+                continue
+            
+            if columns:
+                # asdict 전체 복사 대신 필요한 속성만 꺼냄
+                results.append({column: getattr(entry, column) for column in columns})
+            else:
+                results.append(entry.to_dict())
+            if len(results) >= limit:
+                break
+        
+        return results
 
 
 # 전역 인스턴스 (지연 생성)
@@ -706,7 +951,8 @@ def configure_request_logger(
     log_formats: List[str] = None,
     database_enabled: bool = False,
     retention_days: int = 30,
-    max_log_size_mb: int = 100
+    max_log_size_mb: int = 100,
+    ip_summary_enabled: bool = False
 ):
     """요청 로거 설정 업데이트"""
     global default_request_logger_config, request_logger_middleware
@@ -717,6 +963,7 @@ def configure_request_logger(
     default_request_logger_config.database_enabled = database_enabled
     default_request_logger_config.retention_days = retention_days
     default_request_logger_config.max_log_size_mb = max_log_size_mb
+    default_request_logger_config.ip_summary_enabled = ip_summary_enabled
     
     # 미들웨어 재생성
     request_logger_middleware = RequestLoggerMiddleware(default_request_logger_config)
@@ -728,12 +975,129 @@ def configure_request_logger(
 class LogAnalyzer:
     """로그 분석 유틸리티"""
     
-    def __init__(self, db_logger: DatabaseLogger):
+    # 상위 항목 집계를 허용하는 컬럼 (SQL에 직접 들어가므로 고정 목록만 사용)
+    TOP_VALUE_COLUMNS = ("endpoint", "user_agent")
+    
+    def __init__(self, db_logger: DatabaseLogger, ip_summary: Optional[IPActivitySummary] = None):
         self.db_logger = db_logger
+        self.ip_summary = ip_summary
+    
+    def aggregate_by_ip(self, start_time: float, min_requests: int = 1) -> List[Dict[str, Any]]:
+        """IP별 요청 수/엔드포인트/User-Agent/4xx 집계 (요약이 범위를 포함하면 요약, 아니면 SQLite GROUP BY)"""
+        if self.ip_summary is not None and self.ip_summary.covers(start_time):
+            return self.ip_summary.aggregate(start_time, min_requests)
+        
+        with sqlite3.connect(self.db_logger.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute('''
+                SELECT
+                    client_ip,
+                    COUNT(*) AS request_count,
+                    COUNT(DISTINCT endpoint) AS unique_endpoints,
+                    COUNT(DISTINCT COALESCE(user_agent, '')) AS unique_user_agents,
+                    SUM(status_code BETWEEN 400 AND 499) AS error_4xx,
+                    MIN(timestamp) AS first_seen,
+                    MAX(timestamp) AS last_seen
+                FROM request_logs
+                WHERE timestamp >= ?
+                GROUP BY client_ip
+                HAVING request_count >= ?
+            ''', [start_time, min_requests])
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def window_summary(self, start_time: float) -> Dict[str, Any]:
+        """시간 범위 내 전체 요청/IP/엔드포인트/User-Agent 수"""
+        with sqlite3.connect(self.db_logger.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute('''
+                SELECT
+                    COUNT(*) AS total_requests,
+                    COUNT(DISTINCT client_ip) AS unique_ips,
+                    COUNT(DISTINCT endpoint) AS unique_endpoints,
+                    COUNT(DISTINCT COALESCE(user_agent, '')) AS unique_user_agents
+                FROM request_logs
+                WHERE timestamp >= ?
+            ''', [start_time])
+            return dict(cursor.fetchone())
+    
+    def top_values(self, column: str, start_time: float, limit: int = 20) -> List[tuple]:
+        """컬럼 값별 요청 수 상위 목록 [(값, 요청 수), ...]"""
+        if column not in self.TOP_VALUE_COLUMNS:
+            raise ValueError(f"집계할 수 없는 컬럼: {column}")
+        
+        with sqlite3.connect(self.db_logger.db_path) as conn:
+            cursor = conn.execute(f'''
+                SELECT COALESCE({column}, '') AS value, COUNT(*) AS request_count
+                FROM request_logs
+                WHERE timestamp >= ?
+                GROUP BY value
+                ORDER BY request_count DESC
+                LIMIT ?
+            ''', [start_time, limit])
+            return cursor.fetchall()
+    
+    # ip_activity의 UNION ALL 결과 kind 값 → 분포 dict 이름
+    IP_ACTIVITY_KINDS = {
+        "m": "methods",
+        "s": "status_codes",
+        "e": "endpoints",
+        "u": "user_agents",
+        "h": "hourly_distribution",
+    }
+    
+    def ip_activity(self, client_ip: str, start_time: float, limit: int = 5000) -> Dict[str, Any]:
+        """특정 IP의 최근 limit개 로그 분포를 한 번의 쿼리(UNION ALL)로 집계 (로그가 없으면 빈 dict)"""
+        with sqlite3.connect(self.db_logger.db_path) as conn:
+            cursor = conn.execute('''
+                WITH recent AS (
+                    SELECT timestamp, method, endpoint, user_agent, status_code, response_time
+                    FROM request_logs
+                    WHERE client_ip = ? AND timestamp >= ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                )
+                SELECT 'n', NULL, COUNT(*) FROM recent
+                UNION ALL SELECT 'first', NULL, MIN(timestamp) FROM recent
+                UNION ALL SELECT 'last', NULL, MAX(timestamp) FROM recent
+                UNION ALL SELECT 'm', method, COUNT(*) FROM recent GROUP BY method
+                UNION ALL SELECT 's', status_code, COUNT(*) FROM recent GROUP BY status_code
+                UNION ALL SELECT 'e', endpoint, COUNT(*) FROM recent GROUP BY endpoint
+                UNION ALL SELECT 'u', user_agent, COUNT(*) FROM recent GROUP BY user_agent
+                UNION ALL SELECT 'h', CAST(strftime('%H', timestamp, 'unixepoch', 'localtime') AS INTEGER),
+                    COUNT(*) FROM recent GROUP BY 2
+                UNION ALL SELECT 'rt', response_time, NULL FROM recent WHERE response_time > 0
+            ''', [client_ip, start_time, limit])
+            rows = cursor.fetchall()
+        
+        activity = {name: {} for name in self.IP_ACTIVITY_KINDS.values()}
+        activity["response_times"] = []
+        for kind, key, value in rows:
+            if kind == "n":
+                activity["total_requests"] = value
+            elif kind == "first":
+                activity["first_seen"] = value
+            elif kind == "last":
+                activity["last_seen"] = value
+            elif kind == "rt":
+                activity["response_times"].append(key)
+            else:
+                activity[self.IP_ACTIVITY_KINDS[kind]][key] = value
+        
+        # UNION ALL 결과 순서는 보장되지 않으므로 분류를 마친 뒤 로그 유무 판단
+        if not activity.get("total_requests", 0):
+            return {}
+        return activity
+    
+    def window_start(self, hours: int) -> float:
+        """분석 구간 시작 시각 (요약 사용 시 모든 집계가 같은 정시 시작 구간을 보도록 내림)"""
+        start_time = time.time() - (hours * 3600)
+        if self.ip_summary is not None:
+            start_time = float(int(start_time // 3600) * 3600)
+        return start_time
     
     def detect_suspicious_patterns(self, hours: int = 24) -> Dict[str, Any]:
         """의심스러운 패턴 감지"""
-        start_time = time.time() - (hours * 3600)
+        start_time = self.window_start(hours)
         
         patterns = {
             "high_frequency_ips": [],
@@ -744,38 +1108,25 @@ class LogAnalyzer:
         }
         
         try:
-            # 고빈도 IP 감지
-            high_freq = self.db_logger.query_logs(
-                start_time=start_time,
-                limit=10000
-            )
-            
-            ip_counts = {}
-            for log in high_freq:
-                ip = log['client_ip']
-                ip_counts[ip] = ip_counts.get(ip, 0) + 1
-            
-            # 임계값 이상의 IP
+            # 고빈도 IP 감지 (임계값 이상의 IP만 DB에서 집계)
             threshold = 100  # 시간당 100회 이상
-            for ip, count in ip_counts.items():
-                if count > threshold:
-                    patterns["high_frequency_ips"].append({
-                        "ip": ip,
-                        "request_count": count,
-                        "requests_per_hour": count / hours
-                    })
+            for row in self.aggregate_by_ip(start_time, min_requests=threshold + 1):
+                count = row["request_count"]
+                patterns["high_frequency_ips"].append({
+                    "ip": row["client_ip"],
+                    "request_count": count,
+                    "requests_per_hour": count / hours
+                })
             
             # 실패 요청 패턴
             failed_logs = self.db_logger.query_logs(
                 start_time=start_time,
                 status_code=404,
-                limit=1000
+                limit=1000,
+                columns=['endpoint']
             )
             
-            endpoint_404s = {}
-            for log in failed_logs:
-                endpoint = log['endpoint']
-                endpoint_404s[endpoint] = endpoint_404s.get(endpoint, 0) + 1
+            endpoint_404s = Counter(log['endpoint'] for log in failed_logs)
             
             for endpoint, count in endpoint_404s.items():
                 if count > 10:  # 10회 이상 404
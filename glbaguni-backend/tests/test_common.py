@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공통 헬퍼 테스트
+"""
+
+from datetime import datetime
+
+from backend.utils import common
+
+
+class TestNowIsoCached:
+    """캐시된 현재 시각 문자열 테스트"""
+
+    def test_reused_within_one_second(self, monkeypatch):
+        """1초 이내 호출은 같은 문자열, 1초가 지나면 갱신"""
+        clock = [1_700_000_000.0]
+        monkeypatch.setattr(common.time, "time", lambda: clock[0])
+        monkeypatch.setitem(common._NOW_ISO, "t", 0.0)
+
+        first = common.now_iso_cached()
+        clock[0] += 0.5
+        assert common.now_iso_cached() is first
+
+        clock[0] += 0.5
+        assert common.now_iso_cached() == datetime.fromtimestamp(clock[0]).isoformat()
+
+    def test_clock_moved_backwards(self, monkeypatch):
+        """시계가 뒤로 조정되면 바로 갱신"""
+        clock = [1_700_000_000.0]
+        monkeypatch.setattr(common.time, "time", lambda: clock[0])
+        monkeypatch.setitem(common._NOW_ISO, "t", 0.0)
+
+        common.now_iso_cached()
+        clock[0] -= 60
+
+        assert common.now_iso_cached() == datetime.fromtimestamp(clock[0]).isoformat()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+헬스체크 라우터 테스트
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import health
+
+
+@pytest.fixture
+def client():
+    """헬스체크 라우터만 포함한 테스트 클라이언트"""
+    app = FastAPI()
+    app.include_router(health.router)
+    return TestClient(app)
+
+
+class TestSimpleHealthCheck:
+    """로드밸런서용 간단한 헬스체크 테스트"""
+
+    def test_simple_health_payload(self, client):
+        """미리 직렬화된 응답이 올바른 JSON인지 확인"""
+        response = client.get("/health/simple")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        body = json.loads(response.content)
+        assert body["status"] == "ok"
+        assert body["timestamp"].isdigit()
+
+
+class TestSystemSampler:
+    """백그라운드 시스템 지표 샘플링 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def no_background_task(self, monkeypatch):
+        monkeypatch.setattr(health, "_ensure_system_sampler", lambda: None)
+        for key in ("t", "cpu", "memory", "disk"):
+            monkeypatch.setitem(health._SYSTEM_SAMPLE, key, health._SYSTEM_SAMPLE[key])
+
+    @pytest.mark.asyncio
+    async def test_fresh_sample_is_reused(self, monkeypatch):
+        """샘플이 최신이면 요청 경로에서 psutil을 호출하지 않음"""
+        calls = []
+        monkeypatch.setattr(health, "_sample_system", lambda: calls.append(1))
+        health._SYSTEM_SAMPLE.update(
+            t=time.monotonic(),
+            cpu=12.5,
+            memory=SimpleNamespace(percent=40.0),
+        )
+
+        result = await health.check_system_resources()
+
+        assert result["cpu_percent"] == 12.5
+        assert result["memory_percent"] == 40.0
+        assert result["healthy"] is True
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_stale_sample_is_refreshed(self, monkeypatch):
+        """샘플러가 갱신하지 못한 경우 직접 수집"""
+        monkeypatch.setattr(
+            health,
+            "_sample_system",
+            lambda: {
+                "cpu": 95.0,
+                "memory": SimpleNamespace(percent=50.0),
+                "disk": None,
+            },
+        )
+        health._SYSTEM_SAMPLE["t"] = 0.0
+
+        result = await health.check_system_resources()
+
+        assert result["cpu_percent"] == 95.0
+        assert result["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(self, monkeypatch):
+        """동시에 오래된 샘플을 요청해도 수집은 한 번만 수행"""
+        calls = []
+
+        def fake_sample():
+            calls.append(1)
+            time.sleep(0.05)
+            return {
+                "cpu": 10.0,
+                "memory": SimpleNamespace(total=2**30, available=2**29, percent=50.0),
+                "disk": SimpleNamespace(total=2**30, free=2**29, used=2**29),
+            }
+
+        monkeypatch.setattr(health, "_sample_system", fake_sample)
+        health._SYSTEM_SAMPLE["t"] = 0.0
+
+        memory, disk = await asyncio.gather(
+            health.get_memory_info(), health.get_disk_info()
+        )
+
+        assert memory["used_percent"] == 50.0
+        assert disk["used_percent"] == 50.0
+        assert len(calls) == 1
+
+
+class TestEnvironmentStatus:
+    """환경변수 상태 확인 테스트"""
+
+    def test_environment_status_counts(self, monkeypatch):
+        """설정된/누락된 환경변수 집계"""
+        monkeypatch.setitem(health._ENV_CACHE, "t", 0.0)
+        monkeypatch.setitem(health._ENV_CACHE, "payload", None)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("SMTP_USERNAME", "")
+        monkeypatch.delenv("SMTP_PASSWORD", raising=False)
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+
+        status = health.check_environment_status()
+
+        assert status["configured"] == ["OPENAI_API_KEY"]
+        assert status["missing"] == ["SMTP_USERNAME", "SMTP_PASSWORD", "DATABASE_URL"]
+        assert status["total"] == 4
+        assert status["configuration_rate"] == 25.0
+
+
+class TestDatabaseCheck:
+    """데이터베이스 연결 체크 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self, monkeypatch):
+        monkeypatch.setitem(health._DB_CACHE, "t", 0.0)
+        monkeypatch.setitem(health._DB_CACHE, "payload", None)
+
+    @pytest.mark.asyncio
+    async def test_database_ping_success(self, monkeypatch):
+        """ping 성공 시 healthy 및 응답 시간 반환"""
+        monkeypatch.setattr(health, "_ping_database", lambda: None)
+
+        result = await health.check_database_connection()
+
+        assert result["healthy"] is True
+        assert result["response_time_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_database_ping_timeout(self, monkeypatch):
+        """제한 시간 초과 시 블로킹 없이 unhealthy 반환"""
+        monkeypatch.setattr(health, "DB_PING_TIMEOUT", 0.01)
+        monkeypatch.setattr(health, "_ping_database", lambda: time.sleep(0.2))
+
+        result = await health.check_database_connection()
+
+        assert result["healthy"] is False
+        assert "timed out" in result["message"]
+
+
+class TestServiceStatusCache:
+    """/status/services 응답 캐시 테스트"""
+
+    def test_service_status_reused_within_ttl(self, client, monkeypatch):
+        """TTL 내 반복 요청은 엔드포인트 본문을 다시 실행하지 않음"""
+        calls = []
+
+        async def fake_health_checks():
+            calls.append(1)
+            return {}
+
+        async def fake_connection_check():
+            return {"healthy": True, "message": "OK", "response_time_ms": 1}
+
+        monkeypatch.setitem(health.service_status.cache, "t", 0.0)
+        monkeypatch.setitem(health.service_status.cache, "payload", None)
+        monkeypatch.setattr(
+            health, "perform_component_health_checks", fake_health_checks
+        )
+        monkeypatch.setattr(health, "check_database_connection", fake_connection_check)
+        monkeypatch.setattr(health, "check_openai_connection", fake_connection_check)
+
+        first = client.get("/status/services")
+        second = client.get("/status/services")
+
+        assert first.status_code == second.status_code
+        assert first.content == second.content
+        assert len(calls) == 1
+
+    def test_failed_check_not_cached(self, client, monkeypatch):
+        """실패(5xx) 응답은 캐시하지 않고 다음 요청에서 다시 확인"""
+        calls = []
+
+        def failing_component_status():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(health.service_status.cache, "t", 0.0)
+        monkeypatch.setitem(health.service_status.cache, "payload", None)
+        monkeypatch.setattr(health, "get_component_status", failing_component_status)
+
+        first = client.get("/status/services")
+        second = client.get("/status/services")
+
+        assert first.status_code == second.status_code == 503
+        assert len(calls) == 2
+        assert health.service_status.cache["payload"] is None
+
+    @pytest.mark.asyncio
+    async def test_cached_response_copied_per_request(self, monkeypatch):
+        """캐시된 응답은 요청마다 새 Response 객체로 반환"""
+        monkeypatch.setitem(health.get_detailed_component_status.cache, "t", 0.0)
+        monkeypatch.setitem(health.get_detailed_component_status.cache, "payload", None)
+        monkeypatch.setattr(health, "get_component_status", lambda: {})
+
+        async def fake_health_checks():
+            return {}
+
+        monkeypatch.setattr(
+            health, "perform_component_health_checks", fake_health_checks
+        )
+
+        first = await health.get_detailed_component_status()
+        first.headers["X-Request-ID"] = "first"
+        second = await health.get_detailed_component_status()
+
+        assert first is not second
+        assert second.body == first.body
+        assert "x-request-id" not in second.headers
+
+    @pytest.mark.parametrize(
+        "cpu, system_status, expected, code",
+        [
+            (10.0, "healthy", "healthy", 200),
+            (75.0, "healthy", "warning", 200),
+            (75.0, "degraded", "degraded", 206),
+            (95.0, "degraded", "critical", 503),
+            (10.0, "critical", "critical", 503),
+        ],
+    )
+    def test_overall_status(
+        self, client, monkeypatch, cpu, system_status, expected, code
+    ):
+        """컴포넌트/리소스 상태에 따른 전체 상태 및 HTTP 코드"""
+
+        async def fake_connection_check():
+            return {"healthy": True, "message": "OK", "response_time_ms": 1}
+
+        async def fake_health_checks():
+            return {}
+
+        async def fake_resources():
+            return {
+                "healthy": True,
+                "message": "",
+                "cpu_percent": cpu,
+                "memory_percent": 10.0,
+            }
+
+        monkeypatch.setitem(health.service_status.cache, "t", 0.0)
+        monkeypatch.setitem(health.service_status.cache, "payload", None)
+        monkeypatch.setattr(health, "check_database_connection", fake_connection_check)
+        monkeypatch.setattr(health, "check_openai_connection", fake_connection_check)
+        monkeypatch.setattr(health, "check_system_resources", fake_resources)
+        monkeypatch.setattr(
+            health, "perform_component_health_checks", fake_health_checks
+        )
+        monkeypatch.setattr(
+            health, "get_component_status", lambda: {"system_status": system_status}
+        )
+
+        response = client.get("/status/services")
+
+        assert response.status_code == code
+        assert response.json()["data"]["overall_status"] == expected
+
+
+class TestCacheHeaders:
+    """헬스체크 응답의 HTTP 캐시 헤더 테스트"""
+
+    def test_health_sets_cache_control(self, client, monkeypatch):
+        """정상 헬스체크 응답은 TTL만큼 캐시 허용"""
+        monkeypatch.setitem(health._HEALTH_CACHE, "t", 0.0)
+        monkeypatch.setitem(health._HEALTH_CACHE, "payload", None)
+        monkeypatch.setattr(health, "get_component_status", lambda: {})
+
+        first = client.get("/health")
+        second = client.get("/health")
+
+        expected = f"max-age={int(health.HEALTH_TTL)}"
+        assert first.headers["cache-control"] == expected
+        assert second.headers["cache-control"] == expected
+        assert first.json()["timestamp"] == second.json()["timestamp"]
+
+    def test_health_error_is_not_cacheable(self, client, monkeypatch):
+        """오류 응답에는 캐시 헤더를 붙이지 않음"""
+
+        def broken_env_status():
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(health._HEALTH_CACHE, "t", 0.0)
+        monkeypatch.setitem(health._HEALTH_CACHE, "payload", None)
+        monkeypatch.setattr(health, "get_component_status", lambda: {})
+        monkeypatch.setattr(health, "check_environment_status", broken_env_status)
+
+        response = client.get("/health")
+
+        assert response.json()["status"] == "error"
+        assert "cache-control" not in response.headers
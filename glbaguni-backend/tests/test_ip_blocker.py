@@ -5,6 +5,7 @@ IP 차단 시스템 테스트
 """
 
 import asyncio
+import json
 import pytest
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -264,6 +265,26 @@ class TestRequestAnalyzer:
             if should_block:
                 assert reason in [BlockReason.ENDPOINT_SCANNING, BlockReason.SUSPICIOUS_PATTERNS]
                 break
+    
+    def test_recent_active_count(self):
+        """최근 1시간 내 요청한 IP만 집계"""
+        for ip in ("192.168.1.1", "192.168.1.2", "192.168.1.1"):
+            self.analyzer.analyze_request(RequestPattern(
+                ip=ip,
+                timestamp=time.time(),
+                endpoint="/api/test",
+                method="GET",
+                user_agent="Mozilla/5.0",
+                status_code=200,
+                response_time=0.1
+            ))
+        
+        assert self.analyzer.recent_active_count() == 2
+        
+        # 한 IP의 마지막 요청을 윈도우 밖으로 이동
+        self.analyzer._recent_activity["192.168.1.2"] = time.time() - 7200
+        self.analyzer._recent_activity.move_to_end("192.168.1.2", last=False)
+        assert self.analyzer.recent_active_count() == 1
 
 
 @pytest.mark.asyncio
@@ -320,6 +341,42 @@ class TestIPBlockerStorage:
         is_blocked, _ = await self.storage.is_blocked("192.168.1.100")
         assert is_blocked is False
     
+    async def test_is_blocked_many_memory(self):
+        """메모리 저장소 일괄 차단 확인 테스트"""
+        now = time.time()
+        await self.storage.block_ip(BlockedIP(
+            ip="192.168.1.100",
+            reason=BlockReason.MANUAL_BLOCK,
+            threat_level=ThreatLevel.MEDIUM,
+            blocked_at=now,
+            blocked_until=now + 1800
+        ))
+        
+        results = await self.storage.is_blocked_many(["192.168.1.100", "192.168.1.101"])
+        
+        assert results["192.168.1.100"][0] is True
+        assert results["192.168.1.101"] == (False, None)
+    
+    async def test_is_blocked_many_redis_single_round_trip(self):
+        """Redis 사용 시 MGET 한 번으로 조회"""
+        now = time.time()
+        blocked_ip = BlockedIP(
+            ip="192.168.1.100",
+            reason=BlockReason.MANUAL_BLOCK,
+            threat_level=ThreatLevel.HIGH,
+            blocked_at=now,
+            blocked_until=now + 1800
+        )
+        self.storage.redis_client = MagicMock()
+        self.storage.redis_client.mget.return_value = [json.dumps(blocked_ip.to_dict()), None]
+        
+        results = await self.storage.is_blocked_many(["192.168.1.100", "192.168.1.101"])
+        
+        self.storage.redis_client.mget.assert_called_once()
+        self.storage.redis_client.get.assert_not_called()
+        assert results["192.168.1.100"][1].threat_level == ThreatLevel.HIGH
+        assert results["192.168.1.101"] == (False, None)
+    
     async def test_expired_block_cleanup(self):
         """만료된 차단 정리 테스트"""
         now = time.time()
@@ -452,6 +509,29 @@ class TestIPBlockerMiddleware:
         assert self.middleware.is_whitelisted("localhost") is True
         assert self.middleware.is_whitelisted("192.168.1.100") is False
     
+    def test_is_whitelisted_cidr(self):
+        """CIDR 화이트리스트 확인 테스트"""
+        middleware = IPBlockerMiddleware(IPBlockerConfig(
+            whitelist_ips={"10.0.0.0/8", "192.168.1.5/24", "2001:db8::/32", "bad/cidr"}
+        ))
+        
+        assert middleware.is_whitelisted("10.20.30.40") is True
+        assert middleware.is_whitelisted("192.168.1.200") is True
+        assert middleware.is_whitelisted("2001:db8::1") is True
+        assert middleware.is_whitelisted("11.0.0.1") is False
+        assert middleware.is_whitelisted("192.168.2.1") is False
+        assert middleware.is_whitelisted("not-an-ip") is False
+    
+    def test_whitelist_reload_invalidates_cache(self):
+        """화이트리스트 변경 후 reload_whitelist()로 캐시된 결과 갱신"""
+        middleware = IPBlockerMiddleware(IPBlockerConfig(whitelist_ips={"10.0.0.0/8"}))
+        assert middleware.is_whitelisted("172.16.0.1") is False
+        
+        middleware.config.whitelist_ips.add("172.16.0.0/12")
+        middleware.reload_whitelist()
+        
+        assert middleware.is_whitelisted("172.16.0.1") is True
+    
     def test_is_protected_endpoint(self):
         """보호 대상 엔드포인트 확인 테스트"""
         assert self.middleware.is_protected_endpoint("/auth/login") is True
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IP 차단 관리 라우터 테스트
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import ip_management
+from backend.utils.ip_blocker import IPBlockerMiddleware, RequestPattern
+
+
+def make_pattern(ip: str, timestamp: float) -> RequestPattern:
+    """테스트용 요청 패턴 생성"""
+    return RequestPattern(
+        ip=ip,
+        timestamp=timestamp,
+        endpoint="/api/test",
+        method="GET",
+        user_agent="pytest",
+        status_code=200,
+        response_time=0.01,
+    )
+
+
+@pytest.fixture
+def blocker(monkeypatch):
+    """테스트마다 새 IP 차단 미들웨어와 빈 캐시 사용"""
+    middleware = IPBlockerMiddleware()
+    monkeypatch.setattr(ip_management, "ip_blocker_middleware", middleware)
+    monkeypatch.setitem(ip_management._BLOCKED_CACHE, "t", 0.0)
+    monkeypatch.setitem(ip_management._BLOCKED_CACHE, "payload", None)
+    monkeypatch.setitem(ip_management._BLOCKED_GROUPS, "snapshot", None)
+    monkeypatch.setitem(ip_management._BLOCKED_GROUPS, "payload", None)
+    monkeypatch.setattr(ip_management, "_BLOCK_TASKS", {})
+    return middleware
+
+
+@pytest.fixture
+def client(blocker):
+    """IP 관리 라우터만 포함한 테스트 클라이언트"""
+    app = FastAPI()
+    app.include_router(ip_management.router)
+    return TestClient(app)
+
+
+class TestBlockedIPsCache:
+    """차단 목록 캐시 테스트"""
+
+    def test_storage_scanned_once_within_ttl(self, client, blocker, monkeypatch):
+        """TTL 내 반복 목록 조회는 저장소를 한 번만 스캔"""
+        calls = []
+        original = blocker.storage.get_blocked_ips
+
+        async def counting_get_blocked_ips():
+            calls.append(1)
+            return await original()
+
+        monkeypatch.setattr(
+            blocker.storage, "get_blocked_ips", counting_get_blocked_ips
+        )
+
+        client.get("/ip-management/blocked-ips")
+        client.get("/ip-management/blocked-ips")
+
+        assert len(calls) == 1
+
+    def test_manual_block_invalidates_cache(self, client):
+        """수동 차단 직후 목록에 바로 반영"""
+        assert client.get("/ip-management/blocked-ips").json()["total_blocked"] == 0
+
+        response = client.post(
+            "/ip-management/block-ip", json={"ip": "203.0.113.7", "duration_hours": 1}
+        )
+        assert response.json()["success"] is True
+
+        body = client.get("/ip-management/blocked-ips").json()
+        assert body["total_blocked"] == 1
+        blocked = body["blocked_ips"][0]
+        assert blocked["ip"] == "203.0.113.7"
+        assert body["by_threat_level"]["high"] == [blocked]
+        assert body["by_reason"]["manual_block"] == [blocked]
+
+    def test_groups_reused_for_same_snapshot(self, client):
+        """같은 스냅샷이면 분류 버킷을 다시 만들지 않고, 무효화 후에는 새로 분류"""
+        client.get("/ip-management/blocked-ips")
+        groups = ip_management._BLOCKED_GROUPS["payload"]
+
+        client.get("/ip-management/blocked-ips")
+        assert ip_management._BLOCKED_GROUPS["payload"] is groups
+
+        client.post("/ip-management/block-ip", json={"ip": "203.0.113.7"})
+        body = client.get("/ip-management/blocked-ips").json()
+        assert ip_management._BLOCKED_GROUPS["payload"] is not groups
+        assert len(body["by_reason"]["manual_block"]) == 1
+
+
+
+class TestManualBlock:
+    """수동 차단/해제 테스트"""
+
+    def test_block_is_accepted_then_completed(self, client):
+        """기본 요청은 접수 즉시 응답하고 백그라운드 처리 결과를 상태로 조회"""
+        body = client.post("/ip-management/block-ip", json={"ip": "203.0.113.9"}).json()
+
+        assert body["accepted"] is True
+        assert body["status"] == "pending"
+
+        status = client.get("/ip-management/block-ip/status/203.0.113.9").json()
+        assert status["request_id"] == body["request_id"]
+        assert status["action"] == "block"
+        assert status["status"] == "completed"
+        assert status["is_blocked"] is True
+
+    def test_sync_block_and_unblock(self, client):
+        """sync=true이면 처리 완료 후 응답"""
+        blocked = client.post(
+            "/ip-management/block-ip",
+            params={"sync": "true"},
+            json={"ip": "203.0.113.9", "duration_hours": 2},
+        ).json()
+        assert blocked["success"] is True
+        assert "accepted" not in blocked
+
+        unblocked = client.delete(
+            "/ip-management/unblock-ip/203.0.113.9", params={"sync": "true"}
+        ).json()
+        assert unblocked["success"] is True
+        assert unblocked["previous_block"]["ip"] == "203.0.113.9"
+        assert client.get("/ip-management/blocked-ips").json()["total_blocked"] == 0
+
+    def test_status_unknown_ip(self, client):
+        """요청 기록이 없는 IP는 404"""
+        response = client.get("/ip-management/block-ip/status/203.0.113.10")
+
+        assert response.status_code == 404
+
+class TestBlockerStats:
+    """IP 차단 통계 테스트"""
+
+    def test_distributions_include_all_levels(self, client):
+        """차단이 없는 레벨/이유도 0으로 포함"""
+        client.post("/ip-management/block-ip", json={"ip": "203.0.113.8"})
+
+        body = client.get("/ip-management/stats").json()
+
+        assert body["threat_distribution"] == {
+            "low": 0,
+            "medium": 0,
+            "high": 1,
+            "critical": 0,
+        }
+        assert body["reason_distribution"]["manual_block"] == 1
+        assert sum(body["reason_distribution"].values()) == 1
+
+
+class TestRecentActivity:
+    """최근 활동 조회 테스트"""
+
+    def test_latest_requests_first_within_window(self, client, blocker):
+        """1시간 이내 요청만 최신순으로 limit개 반환"""
+        now = time.time()
+        history = blocker.analyzer.request_history
+        history["198.51.100.1"].extend(
+            [make_pattern("198.51.100.1", now - 7200), make_pattern("198.51.100.1", now - 10)]
+        )
+        history["198.51.100.2"].extend(
+            [make_pattern("198.51.100.2", now - 20), make_pattern("198.51.100.2", now - 5)]
+        )
+
+        body = client.get("/ip-management/recent-activity", params={"limit": 2}).json()
+
+        assert body["total_recent_requests"] == 3
+        assert [item["timestamp"] for item in body["recent_activity"]] == [
+            now - 5,
+            now - 10,
+        ]
+
+    def test_ip_filter(self, client, blocker):
+        """특정 IP만 조회"""
+        now = time.time()
+        history = blocker.analyzer.request_history
+        history["198.51.100.1"].append(make_pattern("198.51.100.1", now))
+        history["198.51.100.2"].append(make_pattern("198.51.100.2", now))
+
+        body = client.get(
+            "/ip-management/recent-activity", params={"ip_filter": "198.51.100.2"}
+        ).json()
+
+        assert [item["ip"] for item in body["recent_activity"]] == ["198.51.100.2"]
+
+    def test_user_agent_truncation(self):
+        """100자를 넘는 User-Agent만 잘라서 말줄임표 추가"""
+        short = "Mozilla/5.0"
+        long = "A" * 150
+
+        assert ip_management._truncate_user_agent(short) == short
+        assert ip_management._truncate_user_agent("B" * 100) == "B" * 100
+        assert ip_management._truncate_user_agent(long) == "A" * 100 + "..."
+
+
+class TestIPValidation:
+    """IP 주소 유효성 검사 테스트"""
+
+    @pytest.mark.parametrize(
+        "ip, expected",
+        [
+            ("192.168.0.1", True),
+            ("255.255.255.255", True),
+            ("0.0.0.0", True),
+            ("::1", True),
+            ("2001:db8::1", True),
+            ("256.1.1.1", False),
+            ("01.2.3.4", False),
+            ("1.2.3", False),
+            ("1.2.3.4\n", False),
+            ("192.168.1.0/24", False),
+            ("not-an-ip", False),
+        ],
+    )
+    def test_matches_ipaddress(self, ip, expected):
+        """정규식 빠른 경로도 ipaddress와 같은 결과"""
+        assert ip_management._is_valid_ip(ip) is expected
+
+    def test_invalid_ip_rejected(self, client):
+        """유효하지 않은 IP는 400 반환"""
+        response = client.get("/ip-management/blocked-ips/999.1.1.1")
+
+        assert response.status_code == 400
+
+
+class TestAnalyzeIP:
+    """IP 위험도 분석 테스트"""
+
+    def test_recent_requests_counted_once(self, client, blocker):
+        """1시간 이내 요청 수가 위험 요인과 응답에 같은 값으로 반영"""
+        now = time.time()
+        history = blocker.analyzer.request_history["198.51.100.9"]
+        history.append(make_pattern("198.51.100.9", now - 7200))
+        history.extend(make_pattern("198.51.100.9", now - i) for i in range(101))
+
+        body = client.post(
+            "/ip-management/analyze-ip", json={"ip": "198.51.100.9"}
+        ).json()
+
+        assert body["request_history_count"] == 102
+        assert body["recent_requests_count"] == 101
+        assert "최근 1시간 과도한 요청: 101회" in body["risk_factors"]
+
+    @pytest.mark.parametrize(
+        "ip_stats, score, factors",
+        [
+            ({}, 0, []),
+            ({"total_requests": 1001}, 30, ["과도한 요청 수: 1001"]),
+            ({"total_requests": 501, "failed_auths": 6}, 25, ["많은 요청 수: 501", "인증 실패: 6회"]),
+            ({"total_requests": 500, "failed_auths": 11}, 25, ["인증 실패 과다: 11회"]),
+            (
+                {"user_agents": set(range(11)), "endpoints": set(range(21))},
+                35,
+                ["다양한 User-Agent: 11개", "다양한 엔드포인트 접근: 21개"],
+            ),
+        ],
+    )
+    def test_score_ip_stats(self, ip_stats, score, factors):
+        """통계별 임계값 규칙이 기존 if/elif 분기와 같은 점수/요인을 생성"""
+        assert ip_management._score_ip_stats(ip_stats) == (score, factors)
+
+    @pytest.mark.parametrize(
+        "score, level",
+        [(0, "SAFE"), (9, "SAFE"), (10, "LOW"), (30, "MEDIUM"), (69, "HIGH"), (70, "CRITICAL"), (100, "CRITICAL")],
+    )
+    def test_risk_level_boundaries(self, score, level):
+        """임계값과 같은 점수는 상위 레벨로 분류"""
+        index = ip_management.bisect.bisect_right(ip_management._LEVEL_THRESHOLDS, score)
+        assert ip_management._LEVELS[index] == level
+
+
+    def test_analyze_ips_batch(self, client, blocker):
+        """여러 IP를 한 번에 분석하고 중복 IP는 한 번만 포함"""
+        client.post("/ip-management/block-ip", json={"ip": "203.0.113.8"})
+
+        body = client.post(
+            "/ip-management/analyze-ips",
+            json={"ips": ["203.0.113.8", "198.51.100.9", "203.0.113.8"]},
+        ).json()
+
+        assert body["count"] == 2
+        assert [(item["ip"], item["is_blocked"]) for item in body["results"]] == [
+            ("203.0.113.8", True),
+            ("198.51.100.9", False),
+        ]
+
+    def test_analyze_ips_rejects_invalid(self, client):
+        """유효하지 않은 IP가 섞이면 400"""
+        response = client.post(
+            "/ip-management/analyze-ips", json={"ips": ["198.51.100.9", "not-an-ip"]}
+        )
+
+        assert response.status_code == 400
+        assert "not-an-ip" in response.json()["detail"]
+
+class TestInfo:
+    """시스템 정보 엔드포인트 테스트"""
+
+    def test_info_serves_precomputed_body(self, client):
+        """미리 직렬화된 정보가 그대로 JSON으로 응답됨"""
+        response = client.get("/ip-management/info")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == ip_management._INFO_DICT
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메인 라우터 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import main
+
+
+@pytest.fixture
+def db_calls():
+    """DB 세션 생성 횟수 기록"""
+    return []
+
+
+@pytest.fixture
+def router_factory(db_calls):
+    """테스트용 상태/임포터로 메인 라우터를 만든 클라이언트 생성 함수"""
+
+    def get_db():
+        db_calls.append(1)
+        yield SimpleNamespace(execute=lambda query: None, close=lambda: None)
+
+    def factory():
+        app_state = SimpleNamespace(
+            initialized=False, uptime_seconds=lambda: 1.0, get_stats=lambda: {}
+        )
+        importer = SimpleNamespace(security_available=False, services={"get_db": get_db})
+        app = FastAPI()
+        app.include_router(main.create_main_router(app_state, importer))
+        return TestClient(app)
+
+    return factory
+
+
+class TestHealthCache:
+    """/health 데이터 캐시 테스트"""
+
+    def test_envelope_rebuilt_per_request(self, router_factory, db_calls):
+        """TTL 내에는 DB 확인을 건너뛰지만 요청 ID는 요청마다 새로 발급"""
+        client = router_factory()
+
+        first = client.get("/health").json()
+        second = client.get("/health").json()
+
+        assert len(db_calls) == 1
+        assert first["data"] == second["data"]
+        assert first["request_id"] != second["request_id"]
+
+    def test_cache_per_router(self, router_factory, db_calls):
+        """라우터마다 별도의 캐시 사용"""
+        router_factory().get("/health")
+        router_factory().get("/health")
+
+        assert len(db_calls) == 2
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리 관리 라우터 테스트
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import memory
+from backend.utils import memory_manager as memory_manager_module
+from backend.utils.memory_manager import MemoryConfig, MemoryManager, MemoryStats
+
+
+def make_stats(timestamp: datetime, memory_percent: float = 10.0) -> MemoryStats:
+    """테스트용 메모리 통계 생성"""
+    return MemoryStats(
+        timestamp=timestamp,
+        total_memory_mb=1024.0,
+        available_memory_mb=512.0,
+        used_memory_mb=512.0,
+        memory_percent=memory_percent,
+        process_memory_mb=64.0,
+        process_memory_percent=6.25,
+        swap_memory_mb=0.0,
+        swap_percent=0.0,
+    )
+
+
+@pytest.fixture
+def manager():
+    """테스트마다 새 메모리 관리자 (백그라운드 작업은 시작하지 않음)"""
+    return MemoryManager(MemoryConfig(max_cache_size=50))
+
+
+@pytest.fixture
+def client(manager):
+    """메모리 라우터에 테스트용 관리자를 주입한 클라이언트"""
+    app = FastAPI()
+    app.include_router(memory.create_memory_router())
+    app.dependency_overrides[memory.get_memory_manager_dependency] = lambda: manager
+    return TestClient(app)
+
+
+class TestMemoryManagerDependency:
+    """메모리 관리자 의존성 주입 테스트"""
+
+    def test_config_uses_injected_manager(self, client):
+        """주입된 관리자의 설정을 그대로 반환"""
+        body = client.get("/memory/config").json()
+
+        assert body["max_cache_size"] == 50
+
+    def test_status_uses_overridden_manager(self, client):
+        """dependency_overrides로 교체한 관리자의 상태를 반환"""
+        stub = SimpleNamespace(
+            get_health_status=lambda: {
+                "status": "warning",
+                "message": "stub",
+                "memory_percent": 75.0,
+                "process_memory_mb": 128.0,
+                "cache_size": 7,
+            }
+        )
+        client.app.dependency_overrides[memory.get_memory_manager_dependency] = (
+            lambda: stub
+        )
+
+        body = client.get("/memory/status").json()
+
+        assert body["status"] == "warning"
+        assert body["cache_size"] == 7
+
+
+    def test_cache_register(self, client, manager):
+        """테스트용 캐시가 주입된 관리자에 등록되고 크기에 반영"""
+        body = client.get(
+            "/memory/cache/register", params={"name": "pytest", "size": 3}
+        ).json()
+
+        assert body["cache_size"] == 3
+        assert manager.monitor.cache_manager.get_cache_size() == 3
+
+    def test_cache_register_size_limit(self, client):
+        """최대 크기를 넘는 테스트 캐시는 거부"""
+        response = client.get(
+            "/memory/cache/register",
+            params={"name": "pytest", "size": memory.MAX_TEST_CACHE_SIZE + 1},
+        )
+
+        assert response.status_code == 422
+
+
+class TestTestCacheRegistry:
+    """테스트용 캐시 등록 개수 제한/해제 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_test_caches(self, monkeypatch):
+        monkeypatch.setattr(memory, "_TEST_CACHES", {})
+
+    def test_oldest_cache_evicted(self, client, manager):
+        """최대 개수를 넘으면 가장 먼저 등록된 캐시부터 해제"""
+        for i in range(memory.MAX_TEST_CACHES + 1):
+            client.get("/memory/cache/register", params={"name": f"c{i}", "size": 1})
+
+        assert list(memory._TEST_CACHES) == [
+            f"c{i}" for i in range(1, memory.MAX_TEST_CACHES + 1)
+        ]
+        assert "c0" not in manager.monitor.cache_manager.caches
+        assert manager.monitor.cache_manager.get_cache_size() == memory.MAX_TEST_CACHES
+
+    def test_reregister_replaces_cache(self, client):
+        """같은 이름으로 다시 등록하면 개수는 늘지 않고 크기만 교체"""
+        client.get("/memory/cache/register", params={"name": "pytest", "size": 3})
+        body = client.get(
+            "/memory/cache/register", params={"name": "pytest", "size": 5}
+        ).json()
+
+        assert len(memory._TEST_CACHES) == 1
+        assert body["total_cache_size"] == 5
+
+    def test_unregister(self, client, manager):
+        """등록 해제하면 크기에서 빠지고, 없는 이름은 404"""
+        client.get("/memory/cache/register", params={"name": "pytest", "size": 3})
+
+        body = client.delete("/memory/cache/register", params={"name": "pytest"}).json()
+        missing = client.delete("/memory/cache/register", params={"name": "pytest"})
+
+        assert body["total_cache_size"] == 0
+        assert "pytest" not in manager.monitor.cache_manager.caches
+        assert missing.status_code == 404
+
+
+class TestMemoryHistory:
+    """메모리 히스토리 조회 테스트"""
+
+    def test_recent_stats_window(self, manager):
+        """시간 범위 밖의 오래된 통계는 제외"""
+        now = datetime.now()
+        monitor = manager.monitor
+        for minutes_ago in (180, 90, 30, 1):
+            monitor.add_stats(make_stats(now - timedelta(minutes=minutes_ago)))
+
+        recent = monitor.get_recent_stats(3600)
+
+        assert [stats.timestamp for stats in recent] == [
+            now - timedelta(minutes=30),
+            now - timedelta(minutes=1),
+        ]
+        assert monitor.count_recent_stats(3600) == 2
+        assert monitor.get_recent_stats(3600, limit=1) == recent[-1:]
+
+    def test_history_endpoint_limits_data(self, client, manager):
+        """히스토리 개수는 범위 전체, 데이터는 최근 100개만 반환"""
+        now = datetime.now()
+        for seconds_ago in range(150, 0, -1):
+            manager.monitor.add_stats(make_stats(now - timedelta(seconds=seconds_ago)))
+
+        body = client.get("/memory/history", params={"hours": 1}).json()
+
+        assert body["history_count"] == 150
+        assert len(body["data"]) == 100
+        assert body["data"][-1]["timestamp"] == (now - timedelta(seconds=1)).isoformat()
+
+
+class TestMemoryOptimizer:
+    """메모리 최적화 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_gc_runs_off_event_loop(self, manager, monkeypatch):
+        """GC는 이벤트 루프 스레드가 아닌 스레드 풀에서 실행"""
+        threads = []
+
+        def fake_collect(generation):
+            threads.append(threading.get_ident())
+            return 0
+
+        monkeypatch.setattr(memory_manager_module.gc, "collect", fake_collect)
+
+        result = await manager.force_cleanup()
+
+        assert "error" not in result
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+
+class TestMemoryConfigCache:
+    """메모리 설정 응답 ETag 캐시 테스트"""
+
+    def test_matching_etag_returns_not_modified(self, client):
+        """같은 ETag로 다시 요청하면 본문 없이 304"""
+        first = client.get("/memory/config")
+        etag = first.headers["etag"]
+
+        second = client.get("/memory/config", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_config_always_revalidated(self, client):
+        """변경 가능한 설정은 공유 캐시에 저장하지 않고 매번 재검증"""
+        response = client.get("/memory/config")
+
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_new_config_changes_etag(self, client, manager):
+        """설정 객체가 바뀌면 다시 직렬화해 새 ETag 발급"""
+        etag = client.get("/memory/config").headers["etag"]
+
+        manager.config = MemoryConfig(max_cache_size=75)
+        response = client.get("/memory/config", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["max_cache_size"] == 75
+
+
+class TestMemoryConfigUpdate:
+    """메모리 설정 업데이트 테스트"""
+
+    def test_partial_update_keeps_defaults(self, client, monkeypatch):
+        """요청에 없는 항목은 MemoryConfig 기본값 유지"""
+        applied = []
+
+        async def fake_initialize(config):
+            applied.append(config)
+
+        monkeypatch.setattr(memory, "initialize_memory_manager", fake_initialize)
+
+        body = client.post("/memory/config", json={"max_cache_size": 10}).json()
+
+        assert applied == [memory.MemoryConfig(max_cache_size=10)]
+        assert body["config"]["max_cache_size"] == 10
+        assert body["config"]["warning_threshold"] == 70.0
+
+
+class TestMemoryStatusResponses:
+    """검증 없이 반환하는 상태/통계 응답 테스트"""
+
+    def test_stats_keys_match_response_model(self, client):
+        """통계 응답 키가 문서화된 응답 모델 필드와 일치"""
+        body = client.get("/memory/stats").json()
+
+        assert set(body) == set(memory.MemoryStatsResponse.model_fields)
+
+    def test_status_keys_match_response_model(self, client):
+        """상태 응답 키가 문서화된 응답 모델 필드와 일치"""
+        body = client.get("/memory/status").json()
+
+        assert set(body) == set(memory.MemoryStatusResponse.model_fields)
+
+    def test_openapi_keeps_response_models(self, client):
+        """OpenAPI 문서에는 응답 모델 스키마 유지"""
+        schemas = client.get("/openapi.json").json()["components"]["schemas"]
+
+        assert "MemoryStatusResponse" in schemas
+        assert "MemoryStatsResponse" in schemas
+
+
+class TestMemoryCleanupCoalescing:
+    """강제 메모리 정리 중복 실행 방지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_cleanup_cache(self, monkeypatch):
+        monkeypatch.setitem(memory._CLEANUP_LAST, "t", 0.0)
+        monkeypatch.setitem(memory._CLEANUP_LAST, "result", None)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cleanups_run_once(self):
+        """동시에 들어온 정리 요청은 한 번만 실행하고 결과를 공유"""
+        calls = []
+
+        async def fake_force_cleanup():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"gc_collected": 5}
+
+        stub = SimpleNamespace(force_cleanup=fake_force_cleanup)
+
+        results = await asyncio.gather(
+            *(memory._coalesced_cleanup(stub) for _ in range(3))
+        )
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_cleanup_not_shared(self):
+        """실패한 정리 결과는 재사용하지 않음"""
+        calls = []
+
+        async def failing_force_cleanup():
+            calls.append(1)
+            return {"error": "boom"}
+
+        stub = SimpleNamespace(force_cleanup=failing_force_cleanup)
+
+        await memory._coalesced_cleanup(stub)
+        await memory._coalesced_cleanup(stub)
+
+        assert len(calls) == 2
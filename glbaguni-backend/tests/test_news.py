@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 라우터 테스트
+"""
+
+import itertools
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import news
+from backend.utils.logging_config import StructuredFormatter
+
+
+@pytest.fixture
+def client():
+    """뉴스 라우터만 포함한 테스트 클라이언트"""
+    app = FastAPI()
+    app.include_router(news.router)
+    return TestClient(app)
+
+
+class TestKeywordExtraction:
+    """간단 키워드 추출 테스트"""
+
+    def test_keywords_ranked_by_frequency(self, client):
+        """2글자 이상 단어를 빈도순으로, 빈도가 같으면 등장 순서대로 반환"""
+        body = client.post(
+            "/news/extract-keywords",
+            json={"text": "반도체 AI 인공지능 산업 AI 인공지능 AI 성장세", "max_keywords": 3},
+        ).json()
+
+        assert body["keywords"] == ["AI", "인공지능", "반도체"]
+        assert len(body["request_id"]) == 8
+
+    def test_single_characters_ignored(self):
+        """한 글자 토큰은 키워드에서 제외"""
+        assert news._extract_keywords("이 칩 성능 성능", 5) == ["성능"]
+
+
+class TestRequestId:
+    """요청 ID 생성 테스트"""
+
+    def test_prefix_and_wrapping_counter(self, monkeypatch):
+        """4자리 접두사 뒤에 4자리로 순환하는 카운터가 붙음"""
+        monkeypatch.setattr(news, "_RID_COUNTER", itertools.count(0xFFFF))
+
+        last, wrapped = news._rid(), news._rid()
+
+        assert len(news._RID_PREFIX) == 4
+        assert last == f"{news._RID_PREFIX}ffff"
+        assert wrapped == f"{news._RID_PREFIX}0000"
+
+
+class TestShortContent:
+    """본문 미리보기 자르기 테스트"""
+
+    def test_short_text_returned_as_is(self):
+        """제한 이하의 본문은 같은 객체 그대로 반환"""
+        text = "가" * 500
+
+        assert news._short(text) is text
+
+    def test_long_text_truncated(self):
+        """제한을 넘는 본문은 잘라서 말줄임표 추가"""
+        assert news._short("abcdef", 3) == "abc..."
+
+
+class TestNewsSearch:
+    """뉴스 검색 응답 직렬화 테스트"""
+
+    def test_articles_serialized(self, client, monkeypatch):
+        """기사 본문은 500자로 자르고 URL/날짜는 문자열로 변환"""
+        articles = [
+            SimpleNamespace(
+                title="긴 기사",
+                url="https://example.com/a",
+                content="가" * 600,
+                source="테스트",
+                published_at=datetime(2024, 1, 2, 3, 4, 5),
+            ),
+            SimpleNamespace(
+                title="짧은 기사",
+                url="https://example.com/b",
+                content="짧은 본문",
+                source="테스트",
+                published_at=None,
+            ),
+        ]
+
+        async def fake_search_news(query, max_results, sources):
+            return articles
+
+        monkeypatch.setattr(
+            news,
+            "_get_news_service",
+            lambda: SimpleNamespace(search_news=fake_search_news),
+        )
+
+        body = client.post("/news/search", json={"query": "반도체 뉴스"}).json()
+
+        first, second = body["articles"]
+        assert first["content"] == "가" * 500 + "..."
+        assert first["published_date"] == "2024-01-02T03:04:05"
+        assert second["content"] == "짧은 본문"
+        assert second["published_date"] is None
+        assert body["total_articles"] == 2
+
+
+class TestStructuredLogging:
+    """요청당 단일 구조화 로그 테스트"""
+
+    def test_search_logs_single_record(self, client, monkeypatch, caplog):
+        """검색 요청은 단계 정보를 담은 INFO 로그 한 건만 남김"""
+        async def fake_search_news(query, max_results, sources):
+            return []
+
+        monkeypatch.setattr(
+            news,
+            "_get_news_service",
+            lambda: SimpleNamespace(search_news=fake_search_news),
+        )
+
+        with caplog.at_level(logging.INFO, logger=news.logger.name):
+            body = client.post("/news/search", json={"query": "반도체 뉴스"}).json()
+
+        records = [r for r in caplog.records if r.name == news.logger.name]
+        assert len(records) == 1
+        record = records[0]
+        assert record.rid == body["request_id"]
+        assert record.articles == 0
+        assert [name for name, _ in record.stages] == [
+            "received",
+            "validated",
+            "searched",
+        ]
+
+    def test_structured_formatter_appends_extra(self):
+        """extra 필드만 JSON으로 덧붙이고 기본 속성은 제외"""
+        formatter = StructuredFormatter("%(levelname)s | %(message)s")
+        record = logging.LogRecord("news", logging.INFO, "", 0, "완료", (), None)
+        record.rid = "ab000001"
+        record.stages = [("received", 0.1)]
+
+        line = formatter.format(record)
+
+        assert line == 'INFO | 완료 | {"rid": "ab000001", "stages": [["received", 0.1]]}'
+
+
+class TestNewsServiceSingleton:
+    """뉴스 서비스 지연 생성 테스트"""
+
+    def test_service_created_once_on_first_use(self, monkeypatch):
+        """첫 호출 시에만 생성하고 이후 같은 인스턴스 재사용"""
+        created = []
+        monkeypatch.setattr(news, "NewsService", lambda: created.append(1) or object())
+        news._get_news_service.cache_clear()
+        try:
+            first = news._get_news_service()
+            second = news._get_news_service()
+        finally:
+            news._get_news_service.cache_clear()
+
+        assert first is second
+        assert len(created) == 1
+
+
+class TestDependencyResolution:
+    """모듈 로드 시 의존성 해석 테스트"""
+
+    def test_missing_validator_raises(self, monkeypatch):
+        """입력 검증기가 없으면 명시적 허용 없이는 ImportError"""
+
+        def fail_import(attr, *module_names):
+            raise ImportError(attr)
+
+        monkeypatch.setattr(news, "_import_attr", fail_import)
+        monkeypatch.delenv("NEWS_ALLOW_UNVALIDATED_INPUT", raising=False)
+
+        with pytest.raises(ImportError):
+            news._resolve()
+
+    def test_validator_fallback_opt_in(self, monkeypatch):
+        """환경변수로 허용하면 검증 없는 입력 통과, 서비스는 선택 의존성"""
+
+        def fail_import(attr, *module_names):
+            raise ImportError(attr)
+
+        monkeypatch.setattr(news, "_import_attr", fail_import)
+        monkeypatch.setenv("NEWS_ALLOW_UNVALIDATED_INPUT", "1")
+
+        deps = news._resolve()
+
+        assert deps.NewsService is None
+        assert deps.validate_user_input(" 원문 ", 10) == " 원문 "
+
+    def test_health_reports_missing_service(self, client, monkeypatch):
+        """뉴스 서비스가 없으면 헬스 체크에 사용 불가로 표시"""
+        monkeypatch.setattr(news, "NewsService", None)
+        news._get_news_service.cache_clear()
+
+        body = client.get("/news/health").json()
+
+        assert body["news_service_available"] is False
+
+    def test_health_remembers_construction_failure(self, client, monkeypatch, caplog):
+        """생성 실패는 한 번만 기록하고 이후 프로브에서 다시 생성하지 않음"""
+        created = []
+
+        def failing_service():
+            created.append(1)
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(news, "NewsService", failing_service)
+        monkeypatch.setitem(news._SERVICE_INIT_ERROR, "error", None)
+        news._get_news_service.cache_clear()
+
+        with caplog.at_level(logging.ERROR, logger=news.logger.name):
+            first = client.get("/news/health").json()
+            second = client.get("/news/health").json()
+
+        assert first["news_service_available"] is False
+        assert second["news_service_available"] is False
+        assert len(created) == 1
+        assert len([r for r in caplog.records if r.name == news.logger.name]) == 1
+
+
+class TestTrendingCache:
+    """트렌딩 응답 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_trending_cache(self, monkeypatch):
+        monkeypatch.setitem(news._TRENDING_CACHE, "t", 0.0)
+        yield
+        news._trending_payload.cache_clear()
+
+    def test_payload_reused_within_ttl(self, client):
+        """TTL 내 같은 조건의 요청은 같은 본문 재사용"""
+        first = client.get("/news/trending", params={"category": "tech"})
+        second = client.get("/news/trending", params={"category": "tech"})
+
+        assert first.content == second.content
+        assert first.json()["category"] == "tech"
+        assert news._trending_payload.cache_info().hits == 1
+
+    def test_payload_rebuilt_after_ttl(self, client):
+        """TTL이 지나면 캐시를 비우고 다시 생성"""
+        client.get("/news/trending")
+        news._TRENDING_CACHE["t"] = 0.0
+
+        client.get("/news/trending")
+
+        info = news._trending_payload.cache_info()
+        assert (info.hits, info.misses) == (0, 1)
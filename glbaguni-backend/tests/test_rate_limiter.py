@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from backend.routers import rate_limit_test
+from backend.utils.rate_limiter import (
+    DEFAULT_EXEMPT_PATHS,
+    RateLimitConfig,
+    compile_exempt_pattern,
+)
+
+
+class TestExemptPaths:
+    """제외 경로 매칭 테스트"""
+
+    def test_default_config_uses_shared_paths(self):
+        """기본 설정의 제외 경로는 공유 집합과 동일"""
+        assert set(RateLimitConfig().exempt_paths) == DEFAULT_EXEMPT_PATHS
+
+    def test_pattern_keeps_substring_matching(self):
+        """기존 부분 일치 동작 유지"""
+        pattern = compile_exempt_pattern(DEFAULT_EXEMPT_PATHS)
+
+        assert pattern.search("/health/detailed")
+        assert pattern.search("/api/docs")
+        assert not pattern.search("/news/search")
+
+    def test_empty_paths(self):
+        """제외 경로가 없으면 정규식을 만들지 않음"""
+        assert compile_exempt_pattern([]) is None
+
+    def test_info_lists_shared_paths(self):
+        """/rate-limit/info는 공유 집합을 정렬해 노출"""
+        app = FastAPI()
+        app.include_router(rate_limit_test.router)
+
+        response = TestClient(app).get("/rate-limit/info")
+
+        assert response.json()["exempt_paths"] == sorted(DEFAULT_EXEMPT_PATHS)
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+
+class TestRateLimitHeaders:
+    """/rate-limit/test 헤더 추출 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(rate_limit_test.router)
+        return TestClient(app)
+
+    def test_missing_headers_reuse_shared_dict(self):
+        """헤더가 모두 없으면 공유 dict를 그대로 반환"""
+        request = SimpleNamespace(headers=Headers())
+
+        result = rate_limit_test._rate_limit_headers(request)
+
+        assert result is rate_limit_test._NO_RATE_LIMIT_HEADERS
+
+    def test_present_headers_echoed(self, client):
+        """전달된 헤더 값은 대소문자 구분 없이 반환"""
+        body = client.get(
+            "/rate-limit/test", headers={"X-RateLimit-Limit": "60"}
+        ).json()
+
+        assert body["headers"] == {
+            "x-ratelimit-limit": "60",
+            "x-ratelimit-remaining": None,
+            "x-ratelimit-reset": None,
+        }
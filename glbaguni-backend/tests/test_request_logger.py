@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 로거 테스트
+"""
+
+import asyncio
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.utils.request_logger import (
+    DatabaseLogger,
+    IPActivitySummary,
+    LogAnalyzer,
+    RequestLogEntry,
+    RequestLoggerConfig,
+    RequestLoggerMiddleware,
+)
+
+
+def make_entry(
+    timestamp: float, status_code: int = 200, is_blocked: bool = False, **fields
+):
+    """테스트용 로그 엔트리 생성 (fields로 기본값 덮어쓰기)"""
+    values = dict(
+        timestamp=timestamp,
+        datetime_iso="",
+        client_ip="127.0.0.1",
+        real_ip="",
+        forwarded_for="",
+        method="GET",
+        endpoint="/api/test",
+        query_params="",
+        user_agent="pytest",
+        referer="",
+        accept_language="",
+        content_type="",
+        content_length=0,
+        status_code=status_code,
+        response_time=0.01,
+        response_size=0,
+        is_whitelisted=False,
+        is_blocked=is_blocked,
+        block_reason=None,
+        threat_level=None,
+    )
+    values.update(fields)
+    return RequestLogEntry(**values)
+
+
+@pytest.fixture
+def db_logger(tmp_path):
+    """임시 SQLite 파일을 사용하는 DB 로거"""
+    return DatabaseLogger(tmp_path / "requests.db")
+
+
+def insert_entries(db_logger, entries):
+    """로그 엔트리를 DB에 저장"""
+    for entry in entries:
+        asyncio.run(db_logger.log_entry(entry))
+
+
+@pytest.fixture
+def middleware(tmp_path):
+    """DB 로깅 없이 최근 로그 버퍼만 사용하는 미들웨어"""
+    config = RequestLoggerConfig(log_dir=str(tmp_path), recent_buffer_size=3)
+    return RequestLoggerMiddleware(config)
+
+
+class TestRecentEntries:
+    """메모리 최근 로그 버퍼 테스트"""
+
+    def test_buffer_keeps_only_latest_entries(self, middleware):
+        """버퍼 크기를 넘으면 오래된 항목부터 폐기"""
+        now = time.time()
+        for offset in range(5):
+            middleware.recent_entries.append(make_entry(now + offset))
+
+        logs = middleware.query_logs(limit=10)
+
+        assert [log["timestamp"] for log in logs] == [now + 4, now + 3, now + 2]
+
+    def test_query_filters_without_database(self, middleware):
+        """DB 없이도 시간/차단 여부 조건으로 조회"""
+        now = time.time()
+        middleware.recent_entries.append(make_entry(now - 7200))
+        middleware.recent_entries.append(make_entry(now, is_blocked=True))
+        middleware.recent_entries.append(make_entry(now, status_code=404))
+
+        blocked = middleware.query_logs(start_time=now - 3600, is_blocked=True)
+        recent = middleware.query_logs(start_time=now - 3600, limit=10)
+
+        assert len(blocked) == 1
+        assert blocked[0]["is_blocked"] is True
+        assert len(recent) == 2
+
+    def test_selected_columns_without_database(self, middleware):
+        """DB 없이도 지정한 컬럼만 담아 반환"""
+        middleware.recent_entries.append(make_entry(time.time(), endpoint="/a"))
+
+        logs = middleware.query_logs(columns=["endpoint", "status_code"])
+
+        assert logs == [{"endpoint": "/a", "status_code": 200}]
+
+
+class TestLogAnalyzer:
+    """DB 집계 기반 로그 분석 테스트"""
+
+    def test_aggregate_by_ip(self, db_logger):
+        """IP별 요청 수/고유 엔드포인트/4xx 수를 DB에서 집계"""
+        now = time.time()
+        insert_entries(
+            db_logger,
+            [
+                make_entry(now - 10, client_ip="10.0.0.1", endpoint="/a"),
+                make_entry(now - 5, 404, client_ip="10.0.0.1", endpoint="/b"),
+                make_entry(now, 404, client_ip="10.0.0.1", endpoint="/b"),
+                make_entry(now, client_ip="10.0.0.2", user_agent=None),
+                make_entry(now - 7200, client_ip="10.0.0.3"),
+            ],
+        )
+        analyzer = LogAnalyzer(db_logger)
+
+        rows = {row["client_ip"]: row for row in analyzer.aggregate_by_ip(now - 3600)}
+
+        assert set(rows) == {"10.0.0.1", "10.0.0.2"}
+        assert rows["10.0.0.1"]["request_count"] == 3
+        assert rows["10.0.0.1"]["unique_endpoints"] == 2
+        assert rows["10.0.0.1"]["error_4xx"] == 2
+        assert rows["10.0.0.1"]["last_seen"] - rows["10.0.0.1"]["first_seen"] == 10
+        assert analyzer.aggregate_by_ip(now - 3600, min_requests=2)[0]["client_ip"] == (
+            "10.0.0.1"
+        )
+
+    def test_summary_and_top_values(self, db_logger):
+        """전체 요약과 상위 엔드포인트 집계"""
+        now = time.time()
+        insert_entries(
+            db_logger,
+            [
+                make_entry(now, endpoint="/a"),
+                make_entry(now, endpoint="/b", client_ip="10.0.0.9"),
+                make_entry(now, endpoint="/b"),
+            ],
+        )
+        analyzer = LogAnalyzer(db_logger)
+
+        summary = analyzer.window_summary(now - 60)
+
+        assert summary == {
+            "total_requests": 3,
+            "unique_ips": 2,
+            "unique_endpoints": 2,
+            "unique_user_agents": 1,
+        }
+        assert analyzer.top_values("endpoint", now - 60, 1) == [("/b", 2)]
+        with pytest.raises(ValueError):
+            analyzer.top_values("client_ip; DROP TABLE request_logs", now - 60)
+
+    def test_ip_activity_independent_of_row_order(self, db_logger, monkeypatch):
+        """UNION ALL 결과 행 순서가 바뀌어도 같은 집계"""
+        now = time.time()
+        insert_entries(
+            db_logger,
+            [make_entry(now - 5, 404, client_ip="10.0.0.1"), make_entry(now, client_ip="10.0.0.1")],
+        )
+        analyzer = LogAnalyzer(db_logger)
+        expected = analyzer.ip_activity("10.0.0.1", now - 60)
+        connect = sqlite3.connect
+
+        class ReversedRows:
+            def __init__(self, *args, **kwargs):
+                self.conn = connect(*args, **kwargs)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return self.conn.__exit__(*exc)
+
+            def execute(self, sql, params):
+                rows = self.conn.execute(sql, params).fetchall()
+                return SimpleNamespace(fetchall=lambda: rows[::-1])
+
+        monkeypatch.setattr(sqlite3, "connect", ReversedRows)
+
+        assert analyzer.ip_activity("10.0.0.1", now - 60) == expected
+        assert expected["total_requests"] == 2
+        assert analyzer.ip_activity("10.0.0.99", now - 60) == {}
+
+    def test_repeated_404_endpoints(self, db_logger):
+        """10회를 넘게 404가 난 엔드포인트만 실패 패턴으로 보고"""
+        now = time.time()
+        insert_entries(
+            db_logger,
+            [make_entry(now, 404, endpoint="/wp-admin") for _ in range(11)]
+            + [make_entry(now, 404, endpoint="/missing") for _ in range(3)],
+        )
+
+        patterns = LogAnalyzer(db_logger).detect_suspicious_patterns(hours=1)
+
+        assert patterns["failed_requests"] == [{"endpoint": "/wp-admin", "count": 11}]
+
+
+class TestDatabaseIndexes:
+    """시간 범위 조회 인덱스 테스트"""
+
+    @pytest.mark.parametrize(
+        "where, params, index",
+        [
+            ("client_ip = ?", ["10.0.0.1"], "idx_ip_ts"),
+            ("status_code = ?", [404], "idx_status_ts"),
+            ("is_blocked = 1", [], "idx_blocked_ts"),
+        ],
+    )
+    def test_filtered_range_uses_composite_index(self, db_logger, where, params, index):
+        """조건 + 시간 범위 조회는 복합 인덱스로 검색하고 별도 정렬 없음"""
+        sql = (
+            "EXPLAIN QUERY PLAN SELECT * FROM request_logs "
+            f"WHERE timestamp >= ? AND {where} ORDER BY timestamp DESC LIMIT 10"
+        )
+        with sqlite3.connect(db_logger.db_path) as conn:
+            plan = [row[-1] for row in conn.execute(sql, [0, *params])]
+
+        assert any(index in step for step in plan)
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+    def test_iter_logs_in_batches(self, db_logger):
+        """배치 크기보다 많은 로그도 최신순으로 모두 반환"""
+        now = time.time()
+        insert_entries(db_logger, [make_entry(now + i) for i in range(5)])
+
+        logs = list(db_logger.iter_logs(batch_size=2, start_time=now - 60))
+
+        assert [log["timestamp"] for log in logs] == [now + i for i in range(4, -1, -1)]
+
+    def test_blocked_filter(self, db_logger):
+        """차단 여부 조건은 True/False 모두 정상 조회"""
+        now = time.time()
+        insert_entries(db_logger, [make_entry(now, is_blocked=True), make_entry(now)])
+
+        blocked = db_logger.query_logs(start_time=now - 60, is_blocked=True)
+        allowed = db_logger.query_logs(start_time=now - 60, is_blocked=False)
+
+        assert [log["is_blocked"] for log in blocked] == [1]
+        assert [log["is_blocked"] for log in allowed] == [0]
+
+
+class TestSelectedColumns:
+    """필요한 컬럼만 조회하는 테스트"""
+
+    def test_query_returns_only_selected_columns(self, db_logger):
+        """columns를 지정하면 해당 컬럼만 조회"""
+        now = time.time()
+        insert_entries(db_logger, [make_entry(now, 404, endpoint="/a")])
+
+        logs = db_logger.query_logs(
+            start_time=now - 60, columns=["timestamp", "status_code"]
+        )
+
+        assert logs == [{"timestamp": now, "status_code": 404}]
+
+    def test_unknown_column_rejected(self, db_logger):
+        """허용 목록에 없는 컬럼은 SQL을 만들기 전에 거부"""
+        with pytest.raises(ValueError):
+            db_logger.query_logs(columns=["timestamp", "1; DROP TABLE request_logs"])
+
+
+class TestIPActivitySummary:
+    """기록 시점에 갱신하는 IP별 활동 요약 테스트"""
+
+    def test_summary_matches_database_aggregate(self, db_logger):
+        """같은 로그에 대해 DB 집계와 같은 IP별 결과"""
+        now = time.time()
+        entries = [
+            make_entry(now - 10, client_ip="10.0.0.1", endpoint="/a"),
+            make_entry(now - 5, 404, client_ip="10.0.0.1", endpoint="/b"),
+            make_entry(now, 404, client_ip="10.0.0.1", endpoint="/b", user_agent=None),
+            make_entry(now, client_ip="10.0.0.2"),
+        ]
+        insert_entries(db_logger, entries)
+        summary = IPActivitySummary()
+        summary.started_at = now - 7200
+        for entry in entries:
+            summary.add(entry)
+        start_time = (int(now // 3600) - 1) * 3600
+
+        by_summary = LogAnalyzer(db_logger, summary).aggregate_by_ip(start_time)
+        by_database = LogAnalyzer(db_logger).aggregate_by_ip(start_time)
+
+        key = lambda row: row["client_ip"]
+        assert sorted(by_summary, key=key) == sorted(by_database, key=key)
+        assert [row["client_ip"] for row in summary.aggregate(start_time, 2)] == [
+            "10.0.0.1"
+        ]
+
+    def test_unaligned_window_matches_database(self, db_logger):
+        """정시에 시작하지 않는 구간은 DB와 같은 결과 (구간 이전 요청은 제외)"""
+        base = (int(time.time() // 3600) - 1) * 3600
+        entries = [
+            make_entry(base + 10, client_ip="10.0.0.1"),
+            make_entry(base + 3000, client_ip="10.0.0.1"),
+        ]
+        insert_entries(db_logger, entries)
+        summary = IPActivitySummary()
+        summary.started_at = base - 3600
+        for entry in entries:
+            summary.add(entry)
+        start_time = base + 1000
+
+        by_summary = LogAnalyzer(db_logger, summary).aggregate_by_ip(start_time)
+        by_database = LogAnalyzer(db_logger).aggregate_by_ip(start_time)
+
+        assert not summary.covers(start_time)
+        assert by_summary == by_database
+        assert by_summary[0]["request_count"] == 1
+
+    def test_loaded_from_database(self, db_logger):
+        """DB의 기존 로그로 초기화하면 프로세스 시작 전 구간도 요약으로 집계"""
+        now = time.time()
+        insert_entries(
+            db_logger,
+            [
+                make_entry(now - 20 * 3600, 404, client_ip="10.0.0.1", endpoint="/a"),
+                make_entry(now - 60, client_ip="10.0.0.1", endpoint="/b", user_agent=None),
+                make_entry(now, client_ip="10.0.0.2"),
+            ],
+        )
+        summary = IPActivitySummary()
+        summary.load_from_database(db_logger.db_path)
+        analyzer = LogAnalyzer(db_logger, summary)
+        start_time = analyzer.window_start(24)
+
+        key = lambda row: row["client_ip"]
+        assert summary.covers(start_time)
+        assert sorted(summary.aggregate(start_time), key=key) == sorted(
+            LogAnalyzer(db_logger).aggregate_by_ip(start_time), key=key
+        )
+
+    def test_falls_back_to_database_before_summary_start(self, db_logger):
+        """요약 시작 이전 범위는 DB에서 집계"""
+        now = time.time()
+        insert_entries(db_logger, [make_entry(now - 600, client_ip="10.0.0.3")])
+        summary = IPActivitySummary()
+
+        rows = LogAnalyzer(db_logger, summary).aggregate_by_ip(now - 3600)
+
+        assert not summary.covers(now - 3600)
+        assert [row["client_ip"] for row in rows] == ["10.0.0.3"]
+
+    def test_old_hours_pruned(self):
+        """보존 기간이 지난 시간 구간과 IP는 새 구간이 시작될 때 제거"""
+        summary = IPActivitySummary(retention_hours=2)
+        now = time.time()
+        summary.add(make_entry(now - 3 * 3600, client_ip="10.0.0.4"))
+        summary.add(make_entry(now, client_ip="10.0.0.5"))
+
+        assert set(summary._ips) == {"10.0.0.5"}
+
+    def test_middleware_updates_summary(self, tmp_path):
+        """설정으로 활성화하면 미들웨어가 요청마다 요약 갱신"""
+        config = RequestLoggerConfig(
+            log_dir=str(tmp_path), ip_summary_enabled=True
+        )
+        middleware = RequestLoggerMiddleware(config)
+        app = FastAPI()
+        app.middleware("http")(middleware)
+        app.get("/ping")(lambda: {"ok": True})
+
+        TestClient(app).get("/ping")
+
+        rows = middleware.ip_summary.aggregate(time.time() - 60)
+        assert [row["request_count"] for row in rows] == [1]
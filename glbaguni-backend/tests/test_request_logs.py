@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 로그 관리 라우터 테스트
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import logging
+import sqlite3
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import request_logs
+from tests.test_request_logger import make_entry
+
+
+@pytest.fixture
+def logger_middleware(tmp_path, monkeypatch):
+    """임시 DB를 사용하는 요청 로거로 교체"""
+    config = request_logs.RequestLoggerConfig(
+        log_dir=str(tmp_path / "requests"),
+        database_enabled=True,
+        database_path=str(tmp_path / "requests.db"),
+    )
+    middleware = request_logs.RequestLoggerMiddleware(config)
+    monkeypatch.setattr(
+        request_logs, "get_request_logger_middleware", lambda: middleware
+    )
+    return middleware
+
+
+@pytest.fixture(autouse=True)
+def reset_response_caches(monkeypatch):
+    """테스트 간 응답 캐시 공유 방지"""
+    monkeypatch.setattr(request_logs, "_PATTERN_CACHE", {})
+    monkeypatch.setattr(request_logs, "_STATS_CACHE", {"t": 0.0, "payload": None})
+
+
+@pytest.fixture
+def client(logger_middleware):
+    """요청 로그 라우터만 포함한 테스트 클라이언트"""
+    app = FastAPI()
+    app.include_router(request_logs.router)
+    return TestClient(app)
+
+
+def insert_entries(middleware, entries):
+    """로그 엔트리를 DB에 저장"""
+    for entry in entries:
+        asyncio.run(middleware.db_logger.log_entry(entry))
+
+
+class TestRecentLogs:
+    """최근 로그 상태 필터 테스트"""
+
+    def test_error_filter_applied_before_limit(self, client, logger_middleware):
+        """최신 로그가 모두 성공이어도 limit 안에서 에러 로그를 찾아 반환"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [make_entry(now - 10, 500), make_entry(now - 5, 404)]
+            + [make_entry(now - i * 0.01) for i in range(5)],
+        )
+
+        body = client.get(
+            "/request-logs/recent", params={"status_filter": "error", "limit": 2}
+        ).json()
+
+        assert [log["status_code"] for log in body["logs"]] == [404, 500]
+        assert body["total_results"] == 2
+
+    def test_success_filter_range(self, client, logger_middleware):
+        """성공 필터는 2xx/3xx만 반환"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [make_entry(now - 3, 101), make_entry(now - 2, 302), make_entry(now - 1, 404)],
+        )
+
+        body = client.get("/request-logs/recent", params={"status_filter": "success"}).json()
+
+        assert [log["status_code"] for log in body["logs"]] == [302]
+
+
+class TestSuspiciousPatterns:
+    """의심 패턴 분석 테스트"""
+
+    def test_scanner_ip_flagged(self, client, logger_middleware):
+        """다양한 엔드포인트에 4xx가 많은 IP는 의심 IP로 분류"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(now, 404, client_ip="10.0.0.66", endpoint=f"/scan/{i}")
+                for i in range(25)
+            ]
+            + [make_entry(now, client_ip="10.0.0.1", endpoint="/news/search")],
+        )
+
+        body = client.get(
+            "/request-logs/analyze/suspicious-patterns", params={"hours": 1}
+        ).json()
+
+        assert [ip["ip"] for ip in body["suspicious_ips"]] == ["10.0.0.66"]
+        assert body["suspicious_ips"][0]["risk_score"] == 45
+        assert body["summary"] == {
+            "total_ips_analyzed": 2,
+            "suspicious_ips_count": 1,
+            "total_requests_analyzed": 26,
+            "unique_endpoints": 26,
+            "unique_user_agents": 1,
+        }
+        assert body["top_endpoints"][0]["count"] == 1
+        assert body["top_user_agents"] == [{"user_agent": "pytest", "count": 26}]
+
+
+    def test_summary_window_matches_totals(self, tmp_path, monkeypatch):
+        """IP 활동 요약 사용 시에도 IP별 집계와 전체 요약이 같은 구간을 봄"""
+        config = request_logs.RequestLoggerConfig(
+            log_dir=str(tmp_path / "requests"),
+            database_enabled=True,
+            database_path=str(tmp_path / "requests.db"),
+            ip_summary_enabled=True,
+        )
+        now = time.time()
+        # 정시로 내린 구간 시작 직후 (정시 이전 구간을 더 세던 요약도 DB와 같은 구간을 봐야 함)
+        window_start = int((now - 3600) // 3600) * 3600
+        seed = request_logs.RequestLoggerMiddleware(config)
+        insert_entries(
+            seed,
+            [
+                make_entry(window_start + 1, 404, client_ip="10.0.0.66", endpoint=f"/scan/{i}")
+                for i in range(25)
+            ]
+            + [make_entry(now, client_ip="10.0.0.66")],
+        )
+        middleware = request_logs.RequestLoggerMiddleware(config)
+        monkeypatch.setattr(
+            request_logs, "get_request_logger_middleware", lambda: middleware
+        )
+        app = FastAPI()
+        app.include_router(request_logs.router)
+
+        body = TestClient(app).get(
+            "/request-logs/analyze/suspicious-patterns", params={"hours": 1}
+        ).json()
+
+        total = body["summary"]["total_requests_analyzed"]
+        assert all(ip["stats"]["request_count"] <= total for ip in body["suspicious_ips"])
+        assert sum(ip["stats"]["request_count"] for ip in body["suspicious_ips"]) == total
+
+
+class TestResponseCache:
+    """패턴 분석/통계 응답 캐시 테스트"""
+
+    def test_patterns_reused_within_ttl(self, client, logger_middleware):
+        """같은 조건의 반복 분석은 TTL 동안 캐시된 결과 반환"""
+        params = {"hours": 1, "threshold_requests": 10}
+        first = client.get("/request-logs/analyze/suspicious-patterns", params=params)
+        insert_entries(logger_middleware, [make_entry(time.time())])
+
+        second = client.get("/request-logs/analyze/suspicious-patterns", params=params)
+        other = client.get(
+            "/request-logs/analyze/suspicious-patterns",
+            params={"hours": 2, "threshold_requests": 10},
+        )
+
+        assert second.json() == first.json()
+        assert other.json()["summary"]["total_requests_analyzed"] == 1
+
+    def test_pattern_cache_bounded(self):
+        """최대 크기를 넘으면 가장 오래된 키부터 제거"""
+        for hours in range(request_logs.MAX_PATTERN_CACHE_SIZE + 1):
+            request_logs._store_cached_patterns((hours, 10), {"hours": hours})
+
+        assert len(request_logs._PATTERN_CACHE) == request_logs.MAX_PATTERN_CACHE_SIZE
+        assert (0, 10) not in request_logs._PATTERN_CACHE
+
+    def test_stats_reused_within_ttl(self, client, monkeypatch):
+        """통계는 짧은 TTL 동안 재사용"""
+        calls = []
+        monkeypatch.setattr(
+            request_logs.RequestLoggerMiddleware,
+            "get_database_stats",
+            lambda self, hours: calls.append(hours) or {},
+        )
+
+        client.get("/request-logs/stats")
+        client.get("/request-logs/stats")
+
+        assert calls == [24]
+
+
+class TestIpActivity:
+    """IP 활동 분석/타임라인 테스트"""
+
+    def test_hourly_distribution_uses_local_hour(self, client, logger_middleware):
+        """시간대 분포는 로컬 시각 기준 시(hour)로 집계"""
+        now = time.time()
+        timestamps = [now - 7200, now - 3600, now]
+        insert_entries(
+            logger_middleware, [make_entry(ts, client_ip="10.0.0.7") for ts in timestamps]
+        )
+
+        body = client.get("/request-logs/analyze/ip/10.0.0.7").json()
+
+        expected = {}
+        for ts in timestamps:
+            hour = str(datetime.fromtimestamp(ts).hour)
+            expected[hour] = expected.get(hour, 0) + 1
+        assert body["hourly_distribution"] == expected
+
+    def test_activity_summary(self, client, logger_middleware):
+        """처음/마지막 접속 시각과 고유 엔드포인트/User-Agent 수"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(now - 30, client_ip="10.0.0.9", endpoint="/a"),
+                make_entry(now - 20, client_ip="10.0.0.9", endpoint="/b", user_agent="curl"),
+                make_entry(now - 10, client_ip="10.0.0.9", endpoint="/a"),
+            ],
+        )
+
+        body = client.get("/request-logs/analyze/ip/10.0.0.9").json()
+
+        assert body["first_seen"] == now - 30
+        assert body["last_seen"] == now - 10
+        assert body["unique_endpoints"] == 2
+        assert body["unique_user_agents"] == 2
+
+    def test_activity_counts(self, client, logger_middleware):
+        """메소드/상태 코드/엔드포인트별 빈도와 상위 엔드포인트 순서"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(now - 3, client_ip="10.0.0.5", endpoint="/a"),
+                make_entry(now - 2, 404, client_ip="10.0.0.5", endpoint="/b"),
+                make_entry(now - 1, client_ip="10.0.0.5", endpoint="/b"),
+            ],
+        )
+
+        body = client.get("/request-logs/analyze/ip/10.0.0.5").json()
+
+        assert body["status_codes"] == {"200": 2, "404": 1}
+        assert body["methods"] == {"GET": 3}
+        assert body["top_endpoints"] == [["/b", 2], ["/a", 1]]
+        assert body["statistics"]["error_rate"] == pytest.approx(100 / 3)
+
+    def test_database_counts_match_memory_counts(self, logger_middleware):
+        """DB의 단일 UNION ALL 집계와 메모리 로그 집계 결과가 같음"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(now - 7200, client_ip="10.0.0.6", endpoint="/a"),
+                make_entry(now - 60, 404, client_ip="10.0.0.6", endpoint="/b", method="POST"),
+                make_entry(now, client_ip="10.0.0.6", endpoint="/b", user_agent=None),
+                make_entry(now, client_ip="10.0.0.1"),
+            ],
+        )
+        start_time = now - 3 * 3600
+
+        by_database = request_logs.LogAnalyzer(logger_middleware.db_logger).ip_activity(
+            "10.0.0.6", start_time
+        )
+        by_memory = request_logs._count_ip_activity(
+            logger_middleware.query_logs(
+                start_time=start_time,
+                client_ip="10.0.0.6",
+                columns=request_logs._IP_ACTIVITY_COLUMNS,
+            )
+        )
+
+        assert by_database == by_memory
+        assert by_database["status_codes"] == {200: 2, 404: 1}
+        assert request_logs.LogAnalyzer(logger_middleware.db_logger).ip_activity(
+            "10.0.0.99", start_time
+        ) == {}
+
+    def test_hourly_distribution_across_dst_change(self, logger_middleware, monkeypatch):
+        """서머타임 전환을 걸친 구간도 행마다 로컬 시(hour)로 집계 (DB/메모리 경로 동일)"""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            # 2024-03-10 00:00 EST, 06:00 EDT (07:00 UTC에 전환)
+            timestamps = [1710046800, 1710064800]
+            insert_entries(
+                logger_middleware,
+                [make_entry(ts, client_ip="10.0.0.10") for ts in timestamps],
+            )
+            logs = logger_middleware.query_logs(
+                client_ip="10.0.0.10", columns=request_logs._IP_ACTIVITY_COLUMNS
+            )
+
+            by_memory = request_logs._count_ip_activity(logs)
+            by_database = request_logs.LogAnalyzer(
+                logger_middleware.db_logger
+            ).ip_activity("10.0.0.10", 0)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert by_memory["hourly_distribution"] == {0: 1, 6: 1}
+        assert by_database["hourly_distribution"] == by_memory["hourly_distribution"]
+
+    def test_timeline_buckets(self, client, logger_middleware):
+        """10분 단위 구간별로 시간순 집계"""
+        base = (int(time.time()) // 600) * 600 - 1200
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(base + 5, client_ip="10.0.0.8"),
+                make_entry(base + 10, client_ip="10.0.0.8"),
+                make_entry(base + 700, 404, client_ip="10.0.0.8"),
+            ],
+        )
+
+        timeline = client.get("/request-logs/timeline/10.0.0.8").json()["timeline"]
+
+        assert [slot["timestamp"] for slot in timeline] == [base, base + 600]
+        assert [slot["request_count"] for slot in timeline] == [2, 1]
+        assert timeline[0]["time"] == datetime.fromtimestamp(base).isoformat()
+        assert timeline[1]["status_codes"] == {"404": 1}
+
+
+class TestCsvExport:
+    """CSV 스트리밍 내보내기 테스트"""
+
+    def test_export_streams_rows(self, client, logger_middleware):
+        """헤더와 로그 행을 최신순 CSV로 내려줌"""
+        now = time.time()
+        insert_entries(
+            logger_middleware,
+            [
+                make_entry(now - 1, client_ip="10.0.0.1"),
+                make_entry(now, 404, client_ip="10.0.0.2"),
+            ],
+        )
+
+        response = client.get("/request-logs/export/csv", params={"hours": 1})
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        assert [row["client_ip"] for row in rows] == ["10.0.0.2", "10.0.0.1"]
+        assert rows[0]["status_code"] == "404"
+
+    def test_export_empty(self, client):
+        """로그가 없으면 빈 본문"""
+        response = client.get("/request-logs/export/csv")
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_query_error_returns_500(self, client, logger_middleware):
+        """쿼리 실패는 스트리밍 시작 전에 500으로 응답"""
+        with sqlite3.connect(logger_middleware.db_logger.db_path) as conn:
+            conn.execute("DROP TABLE request_logs")
+
+        response = client.get("/request-logs/export/csv")
+
+        assert response.status_code == 500
+
+    def test_stream_error_logged(self, logger_middleware, caplog):
+        """스트리밍 중 오류는 기록 후 다시 발생"""
+
+        def failing_rows():
+            yield make_entry(time.time()).to_dict()
+            raise sqlite3.OperationalError("disk I/O error")
+
+        rows = failing_rows()
+        stream = request_logs._iter_csv(next(rows), rows)
+
+        with caplog.at_level(logging.ERROR), pytest.raises(sqlite3.OperationalError):
+            list(stream)
+        assert "disk I/O error" in caplog.text
+
+    def test_export_gzip(self, client, logger_middleware):
+        """compress=true이면 같은 CSV를 .csv.gz 파일로 내려줌"""
+        now = time.time()
+        insert_entries(logger_middleware, [make_entry(now, client_ip="10.0.0.3")])
+
+        plain = client.get("/request-logs/export/csv", params={"hours": 1})
+        compressed = client.get(
+            "/request-logs/export/csv", params={"hours": 1, "compress": True}
+        )
+
+        assert compressed.headers["content-type"] == "application/gzip"
+        assert compressed.headers["content-disposition"].endswith('.csv.gz"')
+        assert "content-encoding" not in compressed.headers
+        assert gzip.decompress(compressed.content) == plain.content
+
+    def test_gzip_chunks(self, monkeypatch):
+        """압축 결과가 기준 크기를 넘을 때마다 나눠서 전송"""
+        monkeypatch.setattr(request_logs, "_GZIP_CHUNK_SIZE", 1)
+        lines = [f"{i},{'x' * 50}\r\n" for i in range(2000)]
+
+        chunks = list(request_logs._iter_gzip(iter(lines)))
+
+        assert len(chunks) > 1
+        assert gzip.decompress(b"".join(chunks)).decode() == "".join(lines)
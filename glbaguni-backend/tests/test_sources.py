@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+언론사 목록 라우터 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import sources
+
+
+@pytest.fixture
+def client():
+    """언론사 목록 라우터만 포함한 테스트 클라이언트"""
+    app = FastAPI()
+    app.include_router(sources.router)
+    return TestClient(app)
+
+
+class TestNewsSources:
+    """미리 직렬화된 언론사 목록 응답 테스트"""
+
+    def test_all_sources(self, client):
+        """전체 목록 조회"""
+        response = client.get("/sources/")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["total_count"] == len(sources.NEWS_SOURCES)
+        assert body["sources"] == sources.NEWS_SOURCES
+
+    def test_category_filter_is_case_insensitive(self, client):
+        """카테고리 필터는 대소문자를 구분하지 않음"""
+        response = client.get("/sources/", params={"category": "it"})
+
+        body = response.json()
+        assert body["total_count"] == 5
+        assert {source["category"] for source in body["sources"]} == {"IT"}
+
+    def test_unknown_category_returns_empty_list(self, client):
+        """없는 카테고리는 빈 목록 반환"""
+        response = client.get("/sources/", params={"category": "없음"})
+
+        body = response.json()
+        assert body["success"] is True
+        assert body["sources"] == []
+        assert body["total_count"] == 0
+
+    def test_openapi_keeps_response_schema(self, client):
+        """응답 모델 스키마는 OpenAPI 문서에 유지"""
+        schema = client.get("/openapi.json").json()
+
+        assert "SourcesResponse" in schema["components"]["schemas"]